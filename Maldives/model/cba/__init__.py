@@ -8,8 +8,14 @@ Cost-Benefit Analysis components for scenario comparison.
 from .npv_calculator import (
     CBACalculator,
     NPVResult,
+    DiscountSweepResult,
     IncrementalResult,
     CBAComparison,
+    ScenarioComparison,
+    SalvageAsset,
+    SALVAGE_ASSETS,
+    irr_batch,
+    payback_periods,
 )
 
 from .sensitivity import (
@@ -24,8 +30,14 @@ __all__ = [
     # NPV Calculator
     "CBACalculator",
     "NPVResult",
+    "DiscountSweepResult",
     "IncrementalResult",
     "CBAComparison",
+    "ScenarioComparison",
+    "SalvageAsset",
+    "SALVAGE_ASSETS",
+    "irr_batch",
+    "payback_periods",
     # Sensitivity Analysis
     "SensitivityAnalysis",
     "SensitivityParameter",
@@ -16,11 +16,15 @@ References:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from model.config import Config, get_config
 
 
@@ -270,42 +274,123 @@ CRITERION_DIRECTION = {
 }
 
 
-def _normalise_metrics(
-    metrics: Dict[str, Dict[str, float]],
-) -> Dict[str, Dict[str, Tuple[float, float]]]:
+def _normalise_matrix(raw: np.ndarray, criteria: List[str]) -> np.ndarray:
     """
-    Min-max normalise each criterion across scenarios to [0, 1].
+    Min-max normalise each criterion (column) across scenarios to [0, 1].
     
-    Returns:
-        {scenario_key: {criterion: (raw, normalised), ...}, ...}
+    1 is best: lower_better criteria are reversed. A criterion on which all
+    scenarios are equal gives every scenario a perfect score. `raw` may
+    carry leading axes (e.g. Monte Carlo draws × scenarios × criteria);
+    each (scenarios × criteria) slice is normalised on its own.
     """
-    criteria = list(next(iter(metrics.values())).keys())
-    scenarios = list(metrics.keys())
+    v_min = raw.min(axis=-2, keepdims=True)
+    v_max = raw.max(axis=-2, keepdims=True)
+    spread = v_max - v_min
+    lower_better = np.array(
+        [CRITERION_DIRECTION.get(c, "higher_better") == "lower_better" for c in criteria]
+    )
+    safe = np.where(spread == 0, 1.0, spread)
+    norm = np.where(lower_better, (v_max - raw) / safe, (raw - v_min) / safe)
+    return np.where(spread == 0, 1.0, norm)
+
+
+# ── Prepare / score stages ──────────────────────────────────────────
+# Everything weight-independent (metric extraction, job-year and forex
+# estimates, normalisation) is done once per set of CBA inputs by
+# prepare_mca() and cached; scoring a weight vector is then one
+# (scenarios × criteria) @ (criteria,) product.
+
+_PREPARED_CACHE: "OrderedDict[str, MCAMatrix]" = OrderedDict()
+_PREPARED_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class MCAMatrix:
+    """Weight-independent MCA inputs: the scenario × criterion matrices."""
+    scenarios: List[str]
+    criteria: List[str]
+    raw: np.ndarray            # (scenarios, criteria) metric values
+    normalised: np.ndarray     # (scenarios, criteria) 0-1 scores (1 = best)
+    key: str = ""              # Content hash of the inputs it was built from
     
-    result: Dict[str, Dict[str, Tuple[float, float]]] = {
-        s: {} for s in scenarios
-    }
+    def weight_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        """Weights dict → vector in criterion order (missing criteria weigh 0)."""
+        return np.array([weights.get(c, 0.0) for c in self.criteria], dtype=float)
     
-    for criterion in criteria:
-        values = [metrics[s][criterion] for s in scenarios]
-        v_min = min(values)
-        v_max = max(values)
-        spread = v_max - v_min
+    def score(self, weights) -> np.ndarray:
+        """
+        Total weighted score per scenario.
         
-        direction = CRITERION_DIRECTION.get(criterion, "higher_better")
+        Args:
+            weights: {criterion: weight} dict, a (criteria,) vector, or an
+                (n, criteria) array of weight vectors
         
-        for s in scenarios:
-            raw = metrics[s][criterion]
-            if spread == 0:
-                norm = 1.0  # All equal → all get perfect score
-            elif direction == "higher_better":
-                norm = (raw - v_min) / spread
-            else:  # lower_better
-                norm = (v_max - raw) / spread
-            
-            result[s][criterion] = (raw, norm)
+        Returns:
+            (scenarios,) scores, or (n, scenarios) for a stack of weights
+        """
+        if isinstance(weights, dict):
+            weights = self.weight_vector(weights)
+        return np.asarray(weights) @ self.normalised.T
+
+
+def _mca_input_key(cba_results: dict, scenario_summaries: dict, config: Config) -> str:
+    """Content hash of everything prepare_mca() reads."""
+    digest = hashlib.sha256()
+    digest.update(config.fingerprint(["mca"]).encode())
+    digest.update(json.dumps(cba_results.get("incremental_vs_bau", {}), sort_keys=True).encode())
+    digest.update(json.dumps(scenario_summaries, sort_keys=True).encode())
+    return digest.hexdigest()[:32]
+
+
+def prepare_mca(
+    cba_results: dict,
+    scenario_summaries: dict,
+    config: Optional[Config] = None,
+    use_cache: bool = True,
+) -> MCAMatrix:
+    """
+    Build (or fetch from cache) the normalised scenario × criterion matrix.
     
-    return result
+    The cache is keyed on the content of the CBA inputs and the MCA
+    parameters, so repeated scoring (weight profiles, SMAA, interactive
+    weight tweaking) reuses one matrix until those inputs change.
+    
+    Args:
+        cba_results: Loaded cba_results.json
+        scenario_summaries: Loaded scenario_summaries.json
+        config: Model config (uses get_config() if None)
+        use_cache: Reuse / store the prepared matrix in the in-process cache
+    
+    Returns:
+        MCAMatrix with read-only arrays
+    """
+    if config is None:
+        config = get_config()
+    
+    key = _mca_input_key(cba_results, scenario_summaries, config)
+    if use_cache and key in _PREPARED_CACHE:
+        _PREPARED_CACHE.move_to_end(key)
+        return _PREPARED_CACHE[key]
+    
+    metrics = _extract_metrics(cba_results, scenario_summaries, config)
+    scenarios = list(metrics)
+    criteria = list(next(iter(metrics.values())))
+    raw = np.array([[metrics[s][c] for c in criteria] for s in scenarios], dtype=float)
+    normalised = _normalise_matrix(raw, criteria)
+    raw.setflags(write=False)
+    normalised.setflags(write=False)
+    prepared = MCAMatrix(scenarios, criteria, raw, normalised, key)
+    
+    if use_cache:
+        _PREPARED_CACHE[key] = prepared
+        while len(_PREPARED_CACHE) > _PREPARED_CACHE_SIZE:
+            _PREPARED_CACHE.popitem(last=False)
+    return prepared
+
+
+def clear_mca_cache() -> None:
+    """Drop all prepared MCA matrices."""
+    _PREPARED_CACHE.clear()
 
 
 # ── Main MCA engine ─────────────────────────────────────────────────
@@ -370,36 +455,45 @@ def run_mca(
     if weights is None:
         weights = _get_default_weights(config)
     
+    return score_mca(prepare_mca(cba_results, scenario_summaries, config), weights)
+
+
+def score_mca(prepared: MCAMatrix, weights: Dict[str, float]) -> Dict[str, any]:
+    """
+    Apply a weight vector to a prepared MCA matrix.
+    
+    Args:
+        prepared: Output of prepare_mca()
+        weights: Weights dict (must sum to 1.0)
+    
+    Returns:
+        Full MCA results dict suitable for JSON serialisation.
+    """
     _validate_weights(weights)
     
-    # Extract and normalise metrics
-    raw_metrics = _extract_metrics(cba_results, scenario_summaries, config)
-    normalised = _normalise_metrics(raw_metrics)
+    w = prepared.weight_vector(weights)
+    weighted = prepared.normalised * w
+    totals = prepared.score(w)
     
     # Build scored results
     scenario_results: List[ScenarioMCAResult] = []
     
-    for s_key in normalised:
-        criterion_scores: Dict[str, CriterionScore] = {}
-        total_weighted = 0.0
-        
-        for criterion, (raw, norm) in normalised[s_key].items():
-            w = weights.get(criterion, 0.0)
-            weighted = norm * w
-            total_weighted += weighted
-            
-            criterion_scores[criterion] = CriterionScore(
-                raw_value=raw,
-                normalised=round(norm, 4),
-                weighted=round(weighted, 4),
+    for i, s_key in enumerate(prepared.scenarios):
+        criterion_scores = {
+            criterion: CriterionScore(
+                raw_value=float(prepared.raw[i, j]),
+                normalised=round(float(prepared.normalised[i, j]), 4),
+                weighted=round(float(weighted[i, j]), 4),
                 direction=CRITERION_DIRECTION.get(criterion, "higher_better"),
             )
+            for j, criterion in enumerate(prepared.criteria)
+        }
         
         scenario_results.append(ScenarioMCAResult(
             scenario_key=s_key,
             scenario_label=SCENARIO_LABELS.get(s_key, s_key),
             criterion_scores=criterion_scores,
-            total_weighted_score=round(total_weighted, 4),
+            total_weighted_score=round(float(totals[i]), 4),
         ))
     
     # Rank scenarios by total weighted score (highest = rank 1)
@@ -560,12 +654,11 @@ def weight_sensitivity(
         },
     }
     
+    prepared = prepare_mca(cba_results, scenario_summaries, config)
     results = {}
     all_rankings = {}  # profile -> {scenario: rank}
     for profile_name, weights in profiles.items():
-        mca_result = run_mca(
-            cba_results, scenario_summaries, config, weights
-        )
+        mca_result = score_mca(prepared, weights)
         ranking = mca_result["ranking"]
         results[profile_name] = {
             "weights": weights,
@@ -614,6 +707,368 @@ def weight_sensitivity(
     return results
 
 
+# ── Stochastic multicriteria acceptability (SMAA) ───────────────────
+
+SMAA_SAMPLES = 100_000
+SMAA_CHUNK = 100_000
+
+
+def _weight_bounds(
+    criteria: List[str],
+    bounds: Optional[Dict[str, Tuple[float, float]]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower/upper weight bounds per criterion, validated against the simplex."""
+    bounds = bounds or {}
+    unknown = set(bounds) - set(criteria)
+    if unknown:
+        raise ValueError(f"SMAA weight bounds for unknown criteria: {sorted(unknown)}")
+    lower = np.array([bounds.get(c, (0.0, 1.0))[0] for c in criteria], dtype=float)
+    upper = np.array([bounds.get(c, (0.0, 1.0))[1] for c in criteria], dtype=float)
+    if np.any(lower < 0) or np.any(upper > 1) or np.any(lower > upper):
+        raise ValueError(f"SMAA weight bounds must satisfy 0 <= lower <= upper <= 1: {bounds}")
+    if lower.sum() > 1.0 + 1e-12 or upper.sum() < 1.0 - 1e-12:
+        raise ValueError(
+            f"SMAA weight bounds admit no weights summing to 1.0 "
+            f"(sum of lower = {lower.sum():.3f}, sum of upper = {upper.sum():.3f})"
+        )
+    return lower, upper
+
+
+def _sample_weights(
+    rng: np.random.Generator,
+    n: int,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """
+    Draw up to n weight vectors uniformly from {w : sum(w) = 1, lower <= w <= upper}.
+    
+    Lower bounds are exact: the bounded simplex is the unit simplex scaled by
+    1 - sum(lower) and shifted by lower, so uniform (Dirichlet(1, ..., 1))
+    draws map onto it uniformly. Upper bounds are applied by rejection, so
+    fewer than n rows may be returned.
+    """
+    w = rng.standard_exponential((n, lower.size))
+    w /= w.sum(axis=1, keepdims=True)
+    w = lower + (1.0 - lower.sum()) * w
+    if np.all(upper >= 1.0):
+        return w
+    return w[np.all(w <= upper, axis=1)]
+
+
+def _weight_chunks(
+    rng: np.random.Generator,
+    n: int,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    chunk_size: int,
+):
+    """Yield (weights, vectors drawn) chunks until n bounded weight vectors are accepted."""
+    rejecting = bool(np.any(upper < 1.0))
+    drawn = accepted = 0
+    while accepted < n:
+        if drawn >= 100 * n:
+            raise ValueError(
+                f"MCA weight bounds accept under 1% of the simplex "
+                f"(lower = {lower.tolist()}, upper = {upper.tolist()})"
+            )
+        want = chunk_size if rejecting else min(chunk_size, n - accepted)
+        w = _sample_weights(rng, want, lower, upper)[:n - accepted]
+        drawn += want
+        accepted += w.shape[0]
+        yield w, want
+
+
+def smaa_analysis(
+    cba_results: dict,
+    scenario_summaries: dict,
+    config: Optional[Config] = None,
+    n_samples: int = SMAA_SAMPLES,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    seed: int = 42,
+    chunk_size: int = SMAA_CHUNK,
+) -> Dict[str, any]:
+    """
+    Stochastic Multicriteria Acceptability Analysis (SMAA-2) of the MCA.
+    
+    Rather than a handful of hand-picked weight profiles, samples n_samples
+    weight vectors uniformly from the weight simplex (optionally restricted
+    to per-criterion [lower, upper] bounds) and scores every scenario under
+    each of them. The prepared criteria matrix is reused; each chunk of
+    weights is scored with a single (weights × criteria) @ (criteria ×
+    scenarios) product.
+    
+    Args:
+        cba_results: Loaded cba_results.json
+        scenario_summaries: Loaded scenario_summaries.json
+        config: Model config (uses get_config() if None)
+        n_samples: Number of weight vectors (up to ~1e6)
+        bounds: Optional {criterion: (lower, upper)} weight bounds
+        seed: RNG seed
+        chunk_size: Weight vectors scored per matrix product
+    
+    Returns:
+        Dict with, per scenario, rank-acceptability indices b_r (share of
+        weight space giving rank r), the expected rank and the central
+        weight vector (mean weights under which it ranks first; None if
+        it never does).
+    
+    References:
+        Lahdelma & Salminen (2001), SMAA-2: Stochastic Multicriteria
+        Acceptability Analysis for Group Decision Making, Oper. Res. 49(3).
+    """
+    if config is None:
+        config = get_config()
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be positive (got {n_samples})")
+    
+    prepared = prepare_mca(cba_results, scenario_summaries, config)
+    scenarios, criteria = prepared.scenarios, prepared.criteria
+    lower, upper = _weight_bounds(criteria, bounds)
+    n_scen = len(scenarios)
+    
+    rng = np.random.default_rng(seed)
+    rank_counts = np.zeros((n_scen, n_scen), dtype=np.int64)  # [scenario, rank]
+    central_sum = np.zeros((n_scen, len(criteria)))
+    drawn = accepted = 0
+    for w, n_drawn in _weight_chunks(rng, n_samples, lower, upper, chunk_size):
+        drawn += n_drawn
+        accepted += w.shape[0]
+        
+        scores = prepared.score(w)                       # (samples, scenarios)
+        order = np.argsort(-scores, axis=1, kind="stable")  # order[:, r] = scenario at rank r
+        rank_counts += np.stack(
+            [np.bincount(order[:, r], minlength=n_scen) for r in range(n_scen)], axis=1
+        )
+        winners = order[:, 0]
+        for i in range(n_scen):
+            central_sum[i] += w[winners == i].sum(axis=0)
+    
+    acceptability = rank_counts / accepted
+    ranks = np.arange(1, n_scen + 1)
+    expected_rank = acceptability @ ranks
+    first = rank_counts[:, 0]
+    
+    scenarios_out = {}
+    for i, s_key in enumerate(scenarios):
+        central = (
+            {c: round(float(v), 4) for c, v in zip(criteria, central_sum[i] / first[i])}
+            if first[i] else None
+        )
+        scenarios_out[s_key] = {
+            "label": SCENARIO_LABELS.get(s_key, s_key),
+            "rank_acceptability": {
+                f"rank_{r}": round(float(acceptability[i, r - 1]), 4) for r in ranks
+            },
+            "first_rank_acceptability": round(float(acceptability[i, 0]), 4),
+            "expected_rank": round(float(expected_rank[i]), 3),
+            "central_weights": central,
+        }
+    
+    ranking = sorted(
+        scenarios,
+        key=lambda s: (-scenarios_out[s]["first_rank_acceptability"], scenarios_out[s]["expected_rank"]),
+    )
+    return {
+        "method": "SMAA-2 (stochastic multicriteria acceptability analysis)",
+        "n_samples": int(accepted),
+        "acceptance_rate": round(accepted / drawn, 4),
+        "seed": seed,
+        "weight_bounds": {c: [float(lower[j]), float(upper[j])] for j, c in enumerate(criteria)},
+        "ranking_by_first_rank_acceptability": ranking,
+        "scenarios": scenarios_out,
+        "interpretation": (
+            "rank_acceptability gives the share of the admissible weight space "
+            "under which a scenario attains each rank; central_weights is the "
+            "typical weight vector that makes it the preferred option."
+        ),
+    }
+
+
+# ── MCA under parameter and preference uncertainty ──────────────────
+# The Monte Carlo run records, per draw, the scenario quantities the MCA
+# criteria are built from (MCA_SUMMARY_FIELDS plus NPV savings vs BAU).
+# Each draw is normalised on its own, as the point MCA is, and every
+# (draw, weight vector) pair is scored, so rank probabilities reflect
+# both uncertain criteria values and uncertain stakeholder weights.
+
+MCA_SUMMARY_FIELDS = (
+    "total_capex_million",
+    "total_emissions_mtco2",
+    "total_diesel_gwh",
+    "final_re_share",
+)
+MC_MCA_DRAWS_FILE = "monte_carlo_mca_draws.npz"
+MCA_MC_WEIGHTS = 1000
+MCA_MC_CHUNK_ELEMENTS = 1_000_000   # scores held per chunk (draws × weights × scenarios)
+
+
+def mca_summary_fields(results) -> Dict[str, float]:
+    """
+    The MCA_SUMMARY_FIELDS for one ScenarioResults, taken as four column
+    reductions on its AnnualTables (same values as get_summary()).
+    """
+    gen = results.generation_mix.column
+    return {
+        "total_capex_million": results.annual_costs.column("total_capex").sum() / 1e6,
+        "total_emissions_mtco2": results.annual_emissions.column("total_emissions_tco2").sum() / 1e6,
+        "total_diesel_gwh": gen("diesel_gwh").sum(),
+        "final_re_share": gen("re_share")[-1],
+    }
+
+
+def mca_metric_draws(
+    metric_draws: Dict[str, List[Dict[str, float]]],
+    config: Optional[Config] = None,
+) -> Tuple[List[str], List[str], np.ndarray]:
+    """
+    Raw criterion values for every Monte Carlo draw.
+    
+    Args:
+        metric_draws: {scenario_key: [per-draw {field: value}]} with the
+            MCA_SUMMARY_FIELDS for every scenario (incl. "bau") and
+            "npv_savings" (USD, vs BAU) for each alternative, as collected
+            by run_monte_carlo.run_iteration(mca_metrics=...)
+        config: Model config (uses get_config() if None)
+    
+    Returns:
+        (scenarios, criteria, raw) with raw shaped (draws, scenarios, criteria)
+    """
+    if config is None:
+        config = get_config()
+    n_draws = len(metric_draws["bau"])
+    
+    raw = []
+    for d in range(n_draws):
+        summaries = {
+            k: {f: rows[d][f] for f in MCA_SUMMARY_FIELDS} for k, rows in metric_draws.items()
+        }
+        cba_results = {"incremental_vs_bau": {
+            k: {"npv_savings": rows[d]["npv_savings"]}
+            for k, rows in metric_draws.items() if k != "bau"
+        }}
+        metrics = _extract_metrics(cba_results, summaries, config)
+        if d == 0:
+            scenarios = list(metrics)
+            criteria = list(next(iter(metrics.values())))
+        raw.append([[metrics[s][c] for c in criteria] for s in scenarios])
+    return scenarios, criteria, np.array(raw, dtype=float)
+
+
+def load_mca_draws(path: str) -> Tuple[List[str], List[str], np.ndarray]:
+    """Load (scenarios, criteria, raw) saved by run_monte_carlo (MC_MCA_DRAWS_FILE)."""
+    with np.load(path, allow_pickle=False) as npz:
+        return npz["scenarios"].tolist(), npz["criteria"].tolist(), npz["raw"]
+
+
+def run_mca_monte_carlo(
+    raw_draws: np.ndarray,
+    scenarios: List[str],
+    criteria: List[str],
+    config: Optional[Config] = None,
+    n_weights: int = MCA_MC_WEIGHTS,
+    bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    seed: int = 42,
+    chunk_elements: int = MCA_MC_CHUNK_ELEMENTS,
+) -> Dict[str, any]:
+    """
+    MCA rank probabilities under joint parameter and weight uncertainty.
+    
+    Every Monte Carlo draw of the criteria is scored under every sampled
+    weight vector (uniform on the weight simplex, optionally bounded as in
+    smaa_analysis). Draws are processed in chunks so that at most
+    `chunk_elements` scores are held at once; within a chunk the
+    (draws × weights × scenarios) scores are one batched matrix product.
+    The default weights are scored alongside, giving the rank
+    distribution under parameter uncertainty alone.
+    
+    Args:
+        raw_draws: (draws, scenarios, criteria) from mca_metric_draws()
+        scenarios: Scenario keys for axis 1
+        criteria: Criterion names for axis 2
+        config: Model config for the default weights (get_config() if None)
+        n_weights: Number of sampled weight vectors
+        bounds: Optional {criterion: (lower, upper)} weight bounds
+        seed: RNG seed for the weight sample
+        chunk_elements: Upper bound on scores held in memory per chunk
+    
+    Returns:
+        Dict with per-scenario joint rank probabilities, expected rank and
+        first-rank probability under parameter-only uncertainty.
+    """
+    if config is None:
+        config = get_config()
+    if n_weights < 1:
+        raise ValueError(f"n_weights must be positive (got {n_weights})")
+    
+    normalised = _normalise_matrix(np.asarray(raw_draws, dtype=float), criteria)
+    n_draws, n_scen, _ = normalised.shape
+    lower, upper = _weight_bounds(criteria, bounds)
+    
+    rng = np.random.default_rng(seed)
+    sampled = np.vstack([w for w, _ in _weight_chunks(rng, n_weights, lower, upper, n_weights)])
+    default = np.array([_get_default_weights(config).get(c, 0.0) for c in criteria])
+    weights = np.vstack([default, sampled])               # row 0 = default weights
+    
+    joint_counts = np.zeros((n_scen, n_scen), dtype=np.int64)   # [scenario, rank]
+    param_counts = np.zeros((n_scen, n_scen), dtype=np.int64)
+    step = max(1, chunk_elements // (weights.shape[0] * n_scen))
+    for start in range(0, n_draws, step):
+        block = normalised[start:start + step]             # (d, scenarios, criteria)
+        scores = weights @ block.transpose(0, 2, 1)        # (d, weights, scenarios)
+        order = np.argsort(-scores, axis=2, kind="stable")  # order[..., r] = scenario at rank r
+        for r in range(n_scen):
+            param_counts[:, r] += np.bincount(order[:, 0, r], minlength=n_scen)
+            joint_counts[:, r] += np.bincount(order[:, 1:, r].ravel(), minlength=n_scen)
+    
+    joint = joint_counts / (n_draws * sampled.shape[0])
+    param_only = param_counts / n_draws
+    expected_rank = joint @ np.arange(1, n_scen + 1)
+    
+    scenarios_out = {}
+    for i, s_key in enumerate(scenarios):
+        scenarios_out[s_key] = {
+            "label": SCENARIO_LABELS.get(s_key, s_key),
+            "rank_probabilities": {
+                f"rank_{r + 1}": round(float(joint[i, r]), 4) for r in range(n_scen)
+            },
+            "expected_rank": round(float(expected_rank[i]), 3),
+            "prob_first_joint": round(float(joint[i, 0]), 4),
+            "prob_first_default_weights": round(float(param_only[i, 0]), 4),
+        }
+    
+    return {
+        "method": "MCA rank probabilities over Monte Carlo draws × sampled weights",
+        "n_draws": int(n_draws),
+        "n_weights": int(sampled.shape[0]),
+        "seed": seed,
+        "weight_bounds": {c: [float(lower[j]), float(upper[j])] for j, c in enumerate(criteria)},
+        "ranking_by_prob_first": sorted(
+            scenarios, key=lambda s: -scenarios_out[s]["prob_first_joint"]
+        ),
+        "scenarios": scenarios_out,
+        "interpretation": (
+            "rank_probabilities combine parameter uncertainty (Monte Carlo "
+            "draws of the criteria) with preference uncertainty (weights "
+            "sampled from the simplex); prob_first_default_weights isolates "
+            "parameter uncertainty at the default weights."
+        ),
+    }
+
+
+def print_mca_mc_summary(mca_mc: dict) -> None:
+    """Pretty-print joint MCA rank probabilities to console."""
+    n_scen = len(mca_mc["scenarios"])
+    print(f"\n--- MCA Rank Probabilities ({mca_mc['n_draws']:,} draws × "
+          f"{mca_mc['n_weights']:,} weight vectors) ---")
+    header = "".join(f"{'P' + str(r):>7}" for r in range(1, n_scen + 1))
+    print(f"  {'Scenario':<40s}{header}{'P1|dflt':>9}")
+    for s_key in mca_mc["ranking_by_prob_first"]:
+        s_data = mca_mc["scenarios"][s_key]
+        cells = "".join(f"{p:>7.1%}" for p in s_data["rank_probabilities"].values())
+        print(f"  {s_data['label']:<40s}{cells}{s_data['prob_first_default_weights']:>9.1%}")
+
+
 # ── Console display ─────────────────────────────────────────────────
 
 def print_mca_results(mca_output: dict) -> None:
@@ -658,6 +1113,20 @@ def print_mca_results(mca_output: dict) -> None:
     print()
 
 
+def print_smaa_results(smaa: dict) -> None:
+    """Pretty-print SMAA rank-acceptability indices to console."""
+    n_scen = len(smaa["scenarios"])
+    print("\n" + "=" * 80)
+    print(f"SMAA RANK ACCEPTABILITY ({smaa['n_samples']:,} weight vectors)")
+    print("=" * 80)
+    header = "".join(f"{'b' + str(r):>7}" for r in range(1, n_scen + 1))
+    print(f"  {'Scenario':<40s}{header}{'E[rank]':>9}")
+    for s_key in smaa["ranking_by_first_rank_acceptability"]:
+        s_data = smaa["scenarios"][s_key]
+        cells = "".join(f"{b:>7.1%}" for b in s_data["rank_acceptability"].values())
+        print(f"  {s_data['label']:<40s}{cells}{s_data['expected_rank']:>9.2f}")
+
+
 # ── Standalone runner ───────────────────────────────────────────────
 
 def main():
@@ -708,8 +1177,13 @@ def main():
         for entry in data["ranking"]:
             print(f"    #{entry['rank']}  {entry['label']:<40s}  {entry['score']:.4f}")
     
+    # SMAA over the whole weight simplex
+    smaa = smaa_analysis(cba_results, scenario_summaries, config)
+    print_smaa_results(smaa)
+    
     # Save results
     mca_output["weight_sensitivity"] = ws
+    mca_output["smaa"] = smaa
     out_path = os.path.join(outputs_dir, "mca_results.json")
     with open(out_path, "w") as f:
         json.dump(mca_output, f, indent=2)
@@ -11,12 +11,259 @@ This module calculates:
 - Annualized costs (levelized)
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+import weakref
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 import numpy as np
+import pandas as pd
 
 from ..config import Config, get_config
-from ..scenarios import ScenarioResults
+from ..scenarios import GenerationMix, ScenarioResults
+
+
+# Row order of the (streams × years) matrix built by CBACalculator.stream_matrix().
+# Every PV in NPVResult is one row of  stream_matrix @ discount_factors.
+PV_STREAMS = (
+    "capex",
+    "opex",
+    "fuel",                    # E-CR-02: diesel + LNG fuel
+    "ppa",
+    "emission_costs",          # total emissions × SCC(year)
+    "health_benefits",         # L4
+    "reliability_benefits",    # L20
+    "environmental_benefits",  # A-MO-01
+    "demand_gwh",              # LCOE denominator
+)
+
+
+def _constant_discount_factors(t: np.ndarray, rate) -> np.ndarray:
+    """
+    Vectorised DF = 1 / (1 + r)^t.
+    
+    `rate` may be a scalar or a column vector (k × 1) to broadcast over
+    several rates at once.
+    """
+    return 1.0 / ((1 + rate) ** t)
+
+
+def _ddr_discount_factors(t: np.ndarray, r1, r2, r3) -> np.ndarray:
+    """
+    Vectorised P1 declining discount factors (HM Treasury step schedule).
+    
+    Mirrors CBACalculator.discount_factor_declining(): years 0-30 at r1,
+    31-75 at r2, 76+ at r3, and DF = 1 for t <= 0. Rates may be scalars or
+    column vectors (k × 1) for batched schedules.
+    """
+    t1 = np.clip(t, 0, 30)
+    t2 = np.clip(t - 30, 0, 45)
+    t3 = np.clip(t - 75, 0, None)
+    return (1.0 / ((1 + r1) ** t1)) * (1.0 / ((1 + r2) ** t2)) * (1.0 / ((1 + r3) ** t3))
+
+
+def _npv_rows(cash_flows: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    """NPV of each row of `cash_flows` at the matching entry of `rates` (t = 0, 1, ...)."""
+    t = np.arange(cash_flows.shape[1])
+    return (cash_flows * (1.0 + rates)[:, None] ** -t).sum(axis=1)
+
+
+def irr_batch(
+    cash_flows,
+    guess: float = 0.1,
+    lo: float = -0.5,
+    hi: float = 2.0,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """
+    Vectorised IRR for many cash-flow series at once.
+    
+    Newton-Raphson on NPV(r) = sum_t cf_t / (1+r)^t runs on every row
+    simultaneously. Rows where Newton diverges, leaves r > -1 or fails to
+    converge fall back to bisection on [lo, hi], also vectorised. Rows
+    without a sign change in their cash flows, or without a root in the
+    bracket, return NaN.
+    
+    Args:
+        cash_flows: (n_series × n_periods) array, or one 1-D series
+        guess: Newton starting rate
+        lo, hi: Bisection bracket for the fallback
+        tol: Convergence tolerance on the rate
+        max_iter: Newton iterations before falling back
+    
+    Returns:
+        (n_series,) array of IRRs
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n, n_periods = cf.shape
+    t = np.arange(n_periods)
+    
+    rate = np.full(n, np.nan)
+    # An IRR needs at least one inflow and one outflow
+    pending = np.flatnonzero((cf > 0).any(axis=1) & (cf < 0).any(axis=1))
+    unresolved = []
+    
+    r = np.full(pending.size, guess)
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            if pending.size == 0:
+                break
+            v = (1.0 + r)[:, None] ** -t
+            npv = (cf[pending] * v).sum(axis=1)
+            dnpv = -(cf[pending] * t * v).sum(axis=1) / (1.0 + r)
+            step = npv / dnpv
+            r_new = r - step
+            
+            failed = ~np.isfinite(r_new) | (r_new <= -1.0)
+            done = ~failed & (np.abs(step) <= tol * np.maximum(1.0, np.abs(r_new)))
+            rate[pending[done]] = r_new[done]
+            unresolved.append(pending[failed])
+            
+            keep = ~(failed | done)
+            pending, r = pending[keep], r_new[keep]
+    
+    # Bracketing fallback for everything Newton did not settle
+    unresolved.append(pending)
+    rows = np.concatenate(unresolved)
+    if rows.size:
+        a = np.full(rows.size, lo)
+        b = np.full(rows.size, hi)
+        fa = _npv_rows(cf[rows], a)
+        fb = _npv_rows(cf[rows], b)
+        bracketed = fa * fb <= 0
+        while (b - a).max() > tol:
+            mid = (a + b) / 2
+            fm = _npv_rows(cf[rows], mid)
+            left = fa * fm <= 0
+            b = np.where(left, mid, b)
+            a = np.where(left, a, mid)
+            fa = np.where(left, fa, fm)
+        rate[rows] = np.where(bracketed, (a + b) / 2, np.nan)
+    
+    return rate
+
+
+def payback_periods(investment, savings) -> np.ndarray:
+    """
+    Vectorised simple payback for many series (A-M-02 definition).
+    
+    For each row, the first period p (1-based) at which cumulative savings
+    cover cumulative positive investment, with cumulative investment > 0.
+    
+    Args:
+        investment: (n_series × n_periods) incremental investment
+        savings: (n_series × n_periods) annual savings
+    
+    Returns:
+        (n_series,) array of payback periods, NaN where never paid back
+    """
+    inv = np.atleast_2d(np.asarray(investment, dtype=float))
+    sav = np.atleast_2d(np.asarray(savings, dtype=float))
+    cumulative_cost = np.cumsum(np.maximum(inv, 0.0), axis=1)
+    cumulative_savings = np.cumsum(sav, axis=1)
+    paid = (cumulative_savings >= cumulative_cost) & (cumulative_cost > 0)
+    return np.where(paid.any(axis=1), paid.argmax(axis=1) + 1.0, np.nan)
+
+
+@dataclass(frozen=True)
+class SalvageAsset:
+    """
+    One row of the C3 salvage asset table.
+    
+    Vintage rules:
+      - "additions": every year-on-year capacity increase is a vintage
+        installed that year (solar, battery, wind)
+      - "fleet":     final-year capacity treated as one vintage installed in
+        the base year (diesel, A-L-02)
+      - "fixed":     final-year capacity installed in `install_year`
+        (cable, WTE, LNG); vintages before the base year are sunk and skipped
+    
+    `replaced` assets are renewed like-for-like every `lifetime` years, so
+    their remaining life is taken modulo the lifetime (S-17, M-BUG-6).
+    
+    `capacity` is called with a column view of generation_mix (attributes
+    are arrays over years), so it must be written elementwise.
+    """
+    name: str
+    capacity: Callable[[GenerationMix, Config], float]  # units installed, per year (vectorised)
+    unit_capex: Callable[[Config], float]               # USD/unit at base-year prices
+    lifetime: Callable[[Config], int]
+    cost_decline: Callable[[Config], float] = lambda cfg: 0.0
+    vintages: str = "additions"
+    replaced: bool = False
+    install_year: Optional[Callable[[Config], int]] = None
+
+
+SALVAGE_ASSETS: Dict[str, SalvageAsset] = {
+    # S-16: vintage-tracked, cost decline at install year
+    "solar": SalvageAsset(
+        name="solar",
+        capacity=lambda gen, cfg: gen.solar_capacity_mw,
+        unit_capex=lambda cfg: cfg.technology.solar_pv_capex * 1000,  # $/kW → $/MW
+        lifetime=lambda cfg: cfg.technology.solar_pv_lifetime,
+        cost_decline=lambda cfg: cfg.technology.solar_pv_cost_decline,
+    ),
+    # S-17: vintage-tracked, replaced every battery_life years
+    "battery": SalvageAsset(
+        name="battery",
+        capacity=lambda gen, cfg: gen.battery_capacity_mwh,
+        unit_capex=lambda cfg: cfg.technology.battery_capex * 1000,  # $/kWh → $/MWh
+        lifetime=lambda cfg: cfg.technology.battery_lifetime,
+        cost_decline=lambda cfg: cfg.technology.battery_cost_decline,
+        replaced=True,
+    ),
+    "diesel": SalvageAsset(
+        name="diesel",
+        capacity=lambda gen, cfg: gen.diesel_capacity_mw,
+        unit_capex=lambda cfg: cfg.technology.diesel_gen_capex * 1000,
+        lifetime=lambda cfg: cfg.technology.diesel_gen_lifetime,
+        vintages="fleet",
+        replaced=True,
+    ),
+    # A-MO-02: cable_capex_total includes converters, landing, IDC, grid upgrades
+    "cable": SalvageAsset(
+        name="cable",
+        capacity=lambda gen, cfg: (gen.import_gwh > 0) * 1.0,
+        unit_capex=lambda cfg: cfg.one_grid.cable_capex_total * cfg.one_grid.gom_share_pct,
+        lifetime=lambda cfg: cfg.technology.cable_lifetime,
+        vintages="fixed",
+        install_year=lambda cfg: cfg.one_grid.cable_online_year,
+    ),
+    "wte": SalvageAsset(
+        name="wte",
+        capacity=lambda gen, cfg: (gen.wte_gwh > 0) * cfg.wte.total_capacity_mw,
+        unit_capex=lambda cfg: cfg.wte.capex_per_kw * 1000 * (1 + cfg.technology.climate_adaptation_premium),
+        lifetime=lambda cfg: cfg.wte.plant_lifetime,
+        vintages="fixed",
+        install_year=lambda cfg: cfg.wte.online_year,
+    ),
+    "lng": SalvageAsset(
+        name="lng",
+        capacity=lambda gen, cfg: (gen.lng_gwh > 0) * cfg.lng.plant_capacity_mw,
+        unit_capex=lambda cfg: cfg.lng.capex_per_mw,
+        lifetime=lambda cfg: cfg.lng.plant_lifetime,
+        vintages="fixed",
+        install_year=lambda cfg: cfg.lng.online_year,
+    ),
+    # Installed MW backed out of generation at the configured capacity factor
+    "wind": SalvageAsset(
+        name="wind",
+        capacity=lambda gen, cfg: gen.wind_gwh * 1000 / (8760 * cfg.wind.capacity_factor),
+        unit_capex=lambda cfg: cfg.wind.capex_per_kw * 1000 * (1 + cfg.technology.climate_adaptation_premium),
+        lifetime=lambda cfg: cfg.wind.lifetime,
+    ),
+}
+
+# Assets credited in NPV (C3). WTE, LNG and wind rows are available to
+# salvage_by_asset() but not credited, so headline results are unchanged.
+DEFAULT_SALVAGE_ASSETS = ("solar", "battery", "diesel", "cable")
+
+# Entries kept by CBACalculator's salvage cache (least recently used evicted)
+SALVAGE_CACHE_SIZE = 64
+
+# Config sections read by SALVAGE_ASSETS (capex, lifetimes, cost declines,
+# install years); the salvage cache is keyed on their fingerprint
+SALVAGE_CONFIG_SECTIONS = ["technology", "one_grid", "wte", "lng", "wind"]
 
 
 @dataclass
@@ -57,6 +304,66 @@ class NPVResult:
     discount_rate: float = 0.0
 
 
+@dataclass
+class DiscountSweepResult:
+    """
+    PV breakdown of one scenario under many discount schedules at once.
+    
+    Row i of every array is schedule i: the constant rates first (in the
+    order given), then the DDR schedules. Columns of `pv` follow PV_STREAMS.
+    """
+    scenario_name: str
+    labels: List[str]
+    
+    # Constant rate per row; -1 flags a DDR row (same convention as NPVResult)
+    discount_rates: np.ndarray
+    
+    # (schedules × streams) present values
+    pv: np.ndarray
+    
+    # Per-schedule derived totals (USD, USD/kWh)
+    pv_salvage: np.ndarray
+    pv_total_costs: np.ndarray
+    lcoe_usd_per_kwh: np.ndarray
+    annual_avg_cost: np.ndarray
+    annual_avg_capex: np.ndarray
+    
+    streams: Tuple[str, ...] = PV_STREAMS
+    
+    def stream(self, name: str) -> np.ndarray:
+        """PV of one stream across all schedules."""
+        return self.pv[:, self.streams.index(name)]
+    
+    @property
+    def pv_economic_costs(self) -> np.ndarray:
+        """F-01: financial + emission costs, as used by the sensitivity runners."""
+        return self.pv_total_costs + self.stream("emission_costs")
+    
+    def to_npv_results(self) -> List[NPVResult]:
+        """Expand the sweep into one NPVResult per schedule."""
+        out = []
+        for i, rate in enumerate(self.discount_rates.tolist()):
+            name = self.scenario_name if rate >= 0 else self.scenario_name + " (DDR)"
+            out.append(NPVResult(
+                scenario_name=name,
+                pv_capex=float(self.pv[i, 0]),
+                pv_opex=float(self.pv[i, 1]),
+                pv_fuel=float(self.pv[i, 2]),
+                pv_ppa=float(self.pv[i, 3]),
+                pv_salvage=float(self.pv_salvage[i]),
+                pv_total_costs=float(self.pv_total_costs[i]),
+                pv_emission_costs=float(self.pv[i, 4]),
+                pv_health_benefits=float(self.pv[i, 5]),
+                pv_reliability_benefits=float(self.pv[i, 6]),
+                pv_environmental_benefits=float(self.pv[i, 7]),
+                lcoe_usd_per_kwh=float(self.lcoe_usd_per_kwh[i]),
+                annual_avg_cost=float(self.annual_avg_cost[i]),
+                annual_avg_capex=float(self.annual_avg_capex[i]),
+                discount_rate=rate,
+            ))
+        return out
+
+
 @dataclass
 class IncrementalResult:
     """
@@ -93,6 +400,70 @@ class IncrementalResult:
     payback_years: Optional[float] = None
 
 
+@dataclass
+class ScenarioComparison:
+    """
+    CBA comparison of any number of scenarios, keyed by logical scenario key.
+    
+    Table-like: row i of every array is scenario `keys[i]`; columns of `pv`
+    follow PV_STREAMS. `incremental` holds one IncrementalResult per
+    (base_key, alt_key) pair — every scenario against `baseline`, plus any
+    extra pairs requested.
+    """
+    keys: List[str]
+    baseline: str
+    
+    # (scenarios × streams) present values and per-scenario totals
+    pv: np.ndarray
+    pv_salvage: np.ndarray
+    pv_total_costs: np.ndarray
+    lcoe_usd_per_kwh: np.ndarray
+    
+    npv: Dict[str, NPVResult] = field(default_factory=dict)
+    incremental: Dict[Tuple[str, str], IncrementalResult] = field(default_factory=dict)
+    
+    def vs_baseline(self) -> Dict[str, IncrementalResult]:
+        """Incremental results of every alternative against the baseline."""
+        return {
+            alt: incr for (base, alt), incr in self.incremental.items()
+            if base == self.baseline
+        }
+    
+    @property
+    def pv_economic_costs(self) -> np.ndarray:
+        """Financial + emission costs per scenario."""
+        return self.pv_total_costs + self.pv[:, PV_STREAMS.index("emission_costs")]
+    
+    @property
+    def least_cost_scenario(self) -> str:
+        return self.keys[int(np.argmin(self.pv_total_costs))]
+    
+    @property
+    def recommended_scenario(self) -> str:
+        """Least cost once emissions are valued at the SCC."""
+        return self.keys[int(np.argmin(self.pv_economic_costs))]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per scenario: PV breakdown, salvage, totals and LCOE."""
+        df = pd.DataFrame(self.pv, index=self.keys, columns=[f"pv_{c}" for c in PV_STREAMS])
+        df["pv_salvage"] = self.pv_salvage
+        df["pv_total_costs"] = self.pv_total_costs
+        df["lcoe_usd_per_kwh"] = self.lcoe_usd_per_kwh
+        df.index.name = "scenario"
+        return df
+    
+    def incremental_dataframe(self) -> pd.DataFrame:
+        """One row per (base, alternative) pair."""
+        rows = [
+            {"base": base, "alternative": alt, **{
+                k: v for k, v in vars(incr).items()
+                if k not in ("base_scenario", "alternative_scenario")
+            }}
+            for (base, alt), incr in self.incremental.items()
+        ]
+        return pd.DataFrame(rows).set_index(["base", "alternative"])
+
+
 @dataclass
 class CBAComparison:
     """
@@ -141,6 +512,11 @@ class CBACalculator:
         self.discount_rate = self.config.economics.discount_rate
         self.base_year = self.config.base_year
         self.horizon = self.config.time_horizon
+        
+        # Discount-factor arrays keyed on (schedule, years) — see discount_factors()
+        self._df_cache: Dict[Tuple, np.ndarray] = {}
+        # Undiscounted salvage per results object — see salvage_by_asset()
+        self._salvage_cache: "OrderedDict[Tuple, Tuple[weakref.ref, Dict[str, float]]]" = OrderedDict()
     
     def discount_factor(self, year: int) -> float:
         """
@@ -205,14 +581,101 @@ class CBACalculator:
             df_rest = 1.0 / ((1 + r3) ** (t - 75))
             return df_30 * df_45 * df_rest
     
+    def _schedule_key(self, declining: bool) -> Tuple:
+        """Cache key for the active discount schedule (read live from config)."""
+        if declining:
+            econ = self.config.economics
+            return ("ddr", econ.ddr_rate_0_30, econ.ddr_rate_31_75, econ.ddr_rate_76_125)
+        return ("constant", self.discount_rate)
+    
+    def discount_factors(self, years, declining: bool = False) -> np.ndarray:
+        """
+        Discount factors for a sequence of years as a read-only array.
+        
+        Same formulas as discount_factor() / discount_factor_declining(),
+        but evaluated once per (schedule, horizon) and cached, so every PV
+        on that horizon is a dot product against the same vector.
+        """
+        years = tuple(int(y) for y in years)
+        key = (self._schedule_key(declining), self.base_year, years)
+        df = self._df_cache.get(key)
+        if df is None:
+            t = np.asarray(years, dtype=np.int64) - self.base_year
+            if declining:
+                df = _ddr_discount_factors(t, *key[0][1:])
+            else:
+                df = _constant_discount_factors(t, self.discount_rate)
+            df = np.asarray(df, dtype=float)
+            df.setflags(write=False)
+            self._df_cache[key] = df
+        return df
+    
+    def stream_matrix(self, results: ScenarioResults) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pull every discounted stream of a scenario into one array.
+        
+        Returns:
+            (years, matrix) where matrix has shape (len(PV_STREAMS), len(years))
+            and rows follow PV_STREAMS. Years missing from a stream count as 0.
+        """
+        costs = results.annual_costs
+        emissions = results.annual_emissions
+        benefits = results.annual_benefits
+        gen = results.generation_mix
+        stored = [t.years for t in (costs, gen, emissions, benefits) if len(t)]
+        if stored and all(len(y) == len(stored[0]) and (y == stored[0]).all() for y in stored[1:]):
+            years = stored[0]  # usual case: every table covers the same years
+        else:
+            years = np.union1d(
+                np.union1d(costs.years, gen.years),
+                np.union1d(emissions.years, benefits.years),
+            )
+        matrix = np.zeros((len(PV_STREAMS), len(years)))
+        emissions_tco2 = np.zeros(len(years))
+        
+        # Columns come straight from the AnnualTable arrays
+        if len(costs):
+            j = np.searchsorted(years, costs.years)
+            matrix[0, j] = costs.column("total_capex")
+            matrix[1, j] = costs.column("total_opex")
+            matrix[2, j] = costs.column("fuel_diesel") + costs.column("fuel_lng")  # E-CR-02: include LNG fuel
+            matrix[3, j] = costs.column("ppa_imports")
+        if len(emissions):
+            j = np.searchsorted(years, emissions.years)
+            emissions_tco2[j] = emissions.column("total_emissions_ktco2") * 1000  # ktCO2 to tCO2
+        if len(benefits):
+            j = np.searchsorted(years, benefits.years)
+            matrix[5, j] = benefits.column("health_benefit")
+            matrix[6, j] = benefits.column("reliability_benefit")
+            matrix[7, j] = benefits.column("environmental_benefit")
+        if len(gen):
+            matrix[8, np.searchsorted(years, gen.years)] = gen.column("total_demand_gwh")
+        
+        # SCC valuation for the whole horizon at once (same growth law as _get_scc)
+        econ = self.config.economics
+        t = years - self.base_year
+        matrix[4] = emissions_tco2 * (econ.social_cost_carbon * ((1 + econ.scc_annual_growth) ** t))
+        
+        return years, matrix
+    
+    def present_values(self, results: ScenarioResults, declining: bool = False) -> Dict[str, float]:
+        """
+        PV of every stream in PV_STREAMS with one matrix-vector product.
+        """
+        years, matrix = self.stream_matrix(results)
+        if len(years) == 0:
+            return dict.fromkeys(PV_STREAMS, 0.0)
+        pv = matrix @ self.discount_factors(years, declining)
+        return dict(zip(PV_STREAMS, pv.tolist()))
+    
     def present_value_declining(self, annual_values: Dict[int, float]) -> float:
         """
         P1: Calculate present value using declining discount rate schedule.
         """
-        pv = 0.0
-        for year, value in annual_values.items():
-            pv += value * self.discount_factor_declining(year)
-        return pv
+        if not annual_values:
+            return 0.0
+        values = np.fromiter(annual_values.values(), dtype=float, count=len(annual_values))
+        return float(values @ self.discount_factors(annual_values.keys(), declining=True))
     
     def calculate_npv_declining(self, results: ScenarioResults) -> NPVResult:
         """
@@ -224,67 +687,31 @@ class CBACalculator:
             discount_rate=-1,  # Flag: declining schedule, not constant
         )
         
-        # Extract annual cost streams
-        capex_stream = {}
-        opex_stream = {}
-        fuel_stream = {}
-        ppa_stream = {}
-        demand_stream = {}
-        
-        for year, costs in results.annual_costs.items():
-            capex_stream[year] = costs.total_capex
-            opex_stream[year] = costs.total_opex
-            fuel_stream[year] = costs.fuel_diesel + costs.fuel_lng  # E-CR-02: include LNG fuel
-            ppa_stream[year] = costs.ppa_imports
-        
-        for year, gen in results.generation_mix.items():
-            demand_stream[year] = gen.total_demand_gwh
-        
-        # Calculate present values using DDR
-        npv.pv_capex = self.present_value_declining(capex_stream)
-        npv.pv_opex = self.present_value_declining(opex_stream)
-        npv.pv_fuel = self.present_value_declining(fuel_stream)
-        npv.pv_ppa = self.present_value_declining(ppa_stream)
+        pv = self.present_values(results, declining=True)
+        npv.pv_capex = pv["capex"]
+        npv.pv_opex = pv["opex"]
+        npv.pv_fuel = pv["fuel"]
+        npv.pv_ppa = pv["ppa"]
         
         # Salvage value (use DDR discount factor for end year)
-        # C-MO-04 fix: renamed from salvage_undiscounted — calculate_salvage_value()
-        # already returns a value discounted at the constant rate.
+        # C-MO-04: discount the shared undiscounted salvage directly rather
+        # than re-scaling the constant-rate PV.
         end_year = max(self.horizon)
-        salvage_discounted = self.calculate_salvage_value(results)
-        # Re-discount using DDR factor ratio
-        constant_df = self.discount_factor(end_year)
-        ddr_df = self.discount_factor_declining(end_year)
-        if constant_df > 0:
-            npv.pv_salvage = salvage_discounted * (ddr_df / constant_df)
-        else:
-            npv.pv_salvage = salvage_discounted
+        npv.pv_salvage = self._salvage_undiscounted(results) * self.discount_factor_declining(end_year)
         
         npv.pv_total_costs = (
             npv.pv_capex + npv.pv_opex + npv.pv_fuel + npv.pv_ppa
             - npv.pv_salvage
         )
         
-        # Emission costs
-        emission_stream = {}
-        for year, emissions in results.annual_emissions.items():
-            scc = self._get_scc(year)
-            emission_stream[year] = emissions.total_emissions_ktco2 * 1000 * scc
-        npv.pv_emission_costs = self.present_value_declining(emission_stream)
-        
-        # Health + reliability + environmental benefits
-        health_stream = {}
-        reliability_stream = {}
-        environmental_stream = {}
-        for year, benefits in results.annual_benefits.items():
-            health_stream[year] = benefits.health_benefit
-            reliability_stream[year] = benefits.reliability_benefit
-            environmental_stream[year] = benefits.environmental_benefit  # A-MO-01
-        npv.pv_health_benefits = self.present_value_declining(health_stream)
-        npv.pv_reliability_benefits = self.present_value_declining(reliability_stream)
-        npv.pv_environmental_benefits = self.present_value_declining(environmental_stream)
+        # Emission costs + health, reliability and environmental benefits
+        npv.pv_emission_costs = pv["emission_costs"]
+        npv.pv_health_benefits = pv["health_benefits"]
+        npv.pv_reliability_benefits = pv["reliability_benefits"]
+        npv.pv_environmental_benefits = pv["environmental_benefits"]  # A-MO-01
         
         # LCOE
-        pv_demand_gwh = self.present_value_declining(demand_stream)
+        pv_demand_gwh = pv["demand_gwh"]
         if pv_demand_gwh > 0:
             npv.lcoe_usd_per_kwh = npv.pv_total_costs / (pv_demand_gwh * 1e6)
         
@@ -294,10 +721,10 @@ class CBACalculator:
         """
         Calculate present value of a stream of annual values.
         """
-        pv = 0.0
-        for year, value in annual_values.items():
-            pv += value * self.discount_factor(year)
-        return pv
+        if not annual_values:
+            return 0.0
+        values = np.fromiter(annual_values.values(), dtype=float, count=len(annual_values))
+        return float(values @ self.discount_factors(annual_values.keys()))
     
     def annuity_factor(self, n_years: int = None) -> float:
         """
@@ -322,27 +749,12 @@ class CBACalculator:
             discount_rate=self.discount_rate,
         )
         
-        # Extract annual cost streams
-        capex_stream = {}
-        opex_stream = {}
-        fuel_stream = {}
-        ppa_stream = {}
-        demand_stream = {}
-        
-        for year, costs in results.annual_costs.items():
-            capex_stream[year] = costs.total_capex
-            opex_stream[year] = costs.total_opex
-            fuel_stream[year] = costs.fuel_diesel + costs.fuel_lng  # E-CR-02: include LNG fuel
-            ppa_stream[year] = costs.ppa_imports
-        
-        for year, gen in results.generation_mix.items():
-            demand_stream[year] = gen.total_demand_gwh
-        
-        # Calculate present values
-        npv.pv_capex = self.present_value(capex_stream)
-        npv.pv_opex = self.present_value(opex_stream)
-        npv.pv_fuel = self.present_value(fuel_stream)
-        npv.pv_ppa = self.present_value(ppa_stream)
+        # All discounted streams in one (streams × years) @ (years,) product
+        pv = self.present_values(results)
+        npv.pv_capex = pv["capex"]
+        npv.pv_opex = pv["opex"]
+        npv.pv_fuel = pv["fuel"]
+        npv.pv_ppa = pv["ppa"]
         
         # C3: Salvage value at end of horizon (credited as negative cost)
         npv.pv_salvage = self.calculate_salvage_value(results)
@@ -353,33 +765,19 @@ class CBACalculator:
         )
         
         # Emission costs (SCC valuation)
-        emission_stream = {}
-        for year, emissions in results.annual_emissions.items():
-            scc = self._get_scc(year)
-            emission_stream[year] = emissions.total_emissions_ktco2 * 1000 * scc  # ktCO2 to tCO2
-        
-        npv.pv_emission_costs = self.present_value(emission_stream)
-        
-        # L4: Health co-benefits — discount the health benefit stream
-        health_stream = {}
-        for year, benefits in results.annual_benefits.items():
-            health_stream[year] = benefits.health_benefit
-        npv.pv_health_benefits = self.present_value(health_stream)
-        
-        # L20: Reliability benefits — discount the reliability benefit stream
-        reliability_stream = {}
-        for year, benefits in results.annual_benefits.items():
-            reliability_stream[year] = benefits.reliability_benefit
-        npv.pv_reliability_benefits = self.present_value(reliability_stream)
-        
-        # A-MO-01: Environmental externality benefits — discount
-        environmental_stream = {}
-        for year, benefits in results.annual_benefits.items():
-            environmental_stream[year] = benefits.environmental_benefit
-        npv.pv_environmental_benefits = self.present_value(environmental_stream)
+        npv.pv_emission_costs = pv["emission_costs"]
+        
+        # L4: Health co-benefits
+        npv.pv_health_benefits = pv["health_benefits"]
+        
+        # L20: Reliability benefits
+        npv.pv_reliability_benefits = pv["reliability_benefits"]
+        
+        # A-MO-01: Environmental externality benefits
+        npv.pv_environmental_benefits = pv["environmental_benefits"]
         
         # Levelized cost of electricity (LCOE)
-        pv_demand_gwh = self.present_value(demand_stream)
+        pv_demand_gwh = pv["demand_gwh"]
         if pv_demand_gwh > 0:
             npv.lcoe_usd_per_kwh = (npv.pv_total_costs) / (pv_demand_gwh * 1e6)
         
@@ -390,6 +788,73 @@ class CBACalculator:
         
         return npv
     
+    def calculate_npv_sweep(
+        self,
+        results: ScenarioResults,
+        discount_rates: Sequence[float] = (),
+        ddr_schedules: Sequence[Tuple[float, float, float]] = (),
+    ) -> DiscountSweepResult:
+        """
+        P1: PV breakdown of one scenario under many discount schedules.
+        
+        Discounting is pure post-processing on the cash flows, so the scenario
+        is not re-run: the (schedules × years) discount-factor matrix is applied
+        to the (streams × years) stream matrix in a single product.
+        
+        Args:
+            results: Scenario results (benefits populated if benefit PVs are needed)
+            discount_rates: Constant real rates, e.g. [0.03, 0.06, 0.09]
+            ddr_schedules: Declining schedules as (r_0_30, r_31_75, r_76_125)
+        
+        Returns:
+            DiscountSweepResult with one row per schedule
+        """
+        rates = np.asarray(discount_rates, dtype=float).reshape(-1, 1)
+        ddr = np.asarray(ddr_schedules, dtype=float).reshape(-1, 3)
+        
+        years, matrix = self.stream_matrix(results)
+        end_year = max(self.horizon)
+        
+        # Last column is the end-year factor used to discount salvage
+        t = np.append(years, end_year) - self.base_year
+        df = np.vstack([
+            _constant_discount_factors(t, rates),
+            _ddr_discount_factors(t, ddr[:, 0:1], ddr[:, 1:2], ddr[:, 2:3]),
+        ])
+        
+        pv = df[:, :-1] @ matrix.T
+        pv_salvage = self._salvage_undiscounted(results) * df[:, -1]
+        pv_total_costs = pv[:, 0] + pv[:, 1] + pv[:, 2] + pv[:, 3] - pv_salvage
+        
+        pv_demand_gwh = pv[:, 8]
+        lcoe = np.zeros(len(df))
+        positive = pv_demand_gwh > 0
+        lcoe[positive] = pv_total_costs[positive] / (pv_demand_gwh[positive] * 1e6)
+        
+        # Annuity factor per constant rate; DDR rows are not levelised
+        # (matches calculate_npv_declining, which leaves annual averages at 0)
+        n = len(self.horizon)
+        r = rates[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            af_constant = np.where(r == 0, 1.0 / n, r * (1 + r) ** n / ((1 + r) ** n - 1))
+        af = np.concatenate([af_constant, np.zeros(len(ddr))])
+        
+        labels = [f"{x:.2%}" for x in r] + [
+            f"DDR {a:.1%}/{b:.1%}/{c:.1%}" for a, b, c in ddr
+        ]
+        
+        return DiscountSweepResult(
+            scenario_name=results.name,
+            labels=labels,
+            discount_rates=np.concatenate([r, np.full(len(ddr), -1.0)]),
+            pv=pv,
+            pv_salvage=pv_salvage,
+            pv_total_costs=pv_total_costs,
+            lcoe_usd_per_kwh=lcoe,
+            annual_avg_cost=pv_total_costs * af,
+            annual_avg_capex=pv[:, 0] * af,
+        )
+    
     def calculate_salvage_value(self, results: ScenarioResults) -> float:
         """
         C3: Calculate terminal salvage value of assets at end of analysis horizon.
@@ -403,109 +868,109 @@ class CBACalculator:
           - Diesel generators (20-year life)
           - Submarine cables (40-year life, if applicable)
         
+        Asset rules live in SALVAGE_ASSETS; see salvage_by_asset().
         Returns salvage value discounted to base year.
         """
         end_year = max(self.horizon)
+        return self._salvage_undiscounted(results) * self.discount_factor(end_year)
+    
+    def _salvage_undiscounted(self, results: ScenarioResults) -> float:
+        """
+        C3: Terminal salvage value in end-year dollars (before discounting).
         
-        # Asset lifetimes from config
-        solar_life = self.config.technology.solar_pv_lifetime  # 30 yr
-        battery_life = self.config.technology.battery_lifetime  # 15 yr
-        diesel_life = self.config.technology.diesel_gen_lifetime  # 20 yr
+        Independent of the discount rate, so constant-rate, DDR and sweep
+        paths all apply their own end-year factor to this one number.
+        """
+        return sum(self.salvage_by_asset(results).values())
+    
+    def salvage_by_asset(
+        self,
+        results: ScenarioResults,
+        assets: Sequence[str] = DEFAULT_SALVAGE_ASSETS,
+    ) -> Dict[str, float]:
+        """
+        C3: Undiscounted terminal salvage value per asset class.
+        
+        Capacity trajectories are whole generation_mix columns; vintage
+        additions come from np.diff, and remaining life and cost decline are
+        evaluated as arrays over all vintages of an asset. Straight-line
+        depreciation: SV = CAPEX(install year) × remaining_life / life.
+        
+        Results are cached per results object (bounded LRU of
+        SALVAGE_CACHE_SIZE entries, holding the results only weakly), so the
+        constant-rate, DDR and sweep paths share one evaluation. The key
+        also carries the generation_mix write revision, the horizon and the
+        fingerprint of SALVAGE_CONFIG_SECTIONS, so an edited trajectory or
+        a changed calculator config is never served stale values.
+        
+        Args:
+            results: Scenario results
+            assets: Keys of SALVAGE_ASSETS to value
+        
+        Returns:
+            Asset name → salvage value in end-year USD
+        """
+        assets = tuple(assets)
+        end_year = max(self.horizon)
+        key = (
+            id(results), results.generation_mix.revision, assets, self.base_year, end_year,
+            self.config.fingerprint(SALVAGE_CONFIG_SECTIONS),
+        )
+        cached = self._salvage_cache.get(key)
+        if cached is not None and cached[0]() is results:
+            self._salvage_cache.move_to_end(key)
+            return dict(cached[1])
         
-        # Get final-year generation mix for installed capacities
-        final_gen = results.generation_mix.get(end_year)
-        if final_gen is None:
+        if end_year not in results.generation_mix:
+            values = {name: 0.0 for name in assets}
+        else:
+            gen = results.generation_mix
+            values = {
+                name: self._asset_salvage(SALVAGE_ASSETS[name], gen.years, gen.view(), end_year)
+                for name in assets
+            }
+        
+        self._salvage_cache[key] = (weakref.ref(results), values)
+        while len(self._salvage_cache) > SALVAGE_CACHE_SIZE:
+            self._salvage_cache.popitem(last=False)
+        return dict(values)
+    
+    def _asset_salvage(
+        self,
+        asset: SalvageAsset,
+        years: np.ndarray,
+        gen,
+        end_year: int,
+    ) -> float:
+        """Salvage of one asset class over all its vintages (see SalvageAsset)."""
+        cfg = self.config
+        capacity = np.broadcast_to(np.asarray(asset.capacity(gen, cfg), dtype=float), years.shape)
+        final = capacity[np.searchsorted(years, end_year)]
+        
+        if asset.vintages == "additions":
+            added = np.diff(capacity, prepend=0.0)
+            installed = added > 0
+            size, vintage = added[installed], years[installed]
+        elif asset.vintages == "fleet":
+            size, vintage = np.array([final]), np.array([self.base_year])
+        else:
+            size, vintage = np.array([final]), np.array([asset.install_year(cfg)])
+            if vintage[0] < self.base_year:
+                return 0.0
+        
+        if not np.any(size > 0):
             return 0.0
         
-        salvage_total = 0.0
-        horizon_length = end_year - self.base_year  # Used for modular replacement timing
-        
-        # --- Solar PV (S-16 fix: vintage-tracking) ---
-        # Track year-over-year capacity additions, compute salvage for each vintage
-        # accounting for its actual install year, cost decline at install time,
-        # and remaining life at end of horizon.
-        prev_solar_mw = 0.0
-        for year in sorted(results.generation_mix.keys()):
-            gen = results.generation_mix[year]
-            current_solar_mw = gen.solar_capacity_mw
-            added_mw = current_solar_mw - prev_solar_mw
-            if added_mw > 0:
-                years_in_service = end_year - year
-                remaining = max(0, solar_life - years_in_service)
-                if remaining > 0:
-                    # Unit CAPEX at install year (with cost decline from base year)
-                    solar_capex_per_mw = self.config.technology.solar_pv_capex * 1000  # $/kW → $/MW
-                    decline_years = year - self.base_year
-                    decline = (1 - self.config.technology.solar_pv_cost_decline) ** decline_years
-                    solar_capex_per_mw *= decline
-                    salvage_total += added_mw * solar_capex_per_mw * (remaining / solar_life)
-            prev_solar_mw = current_solar_mw
-        
-        # --- Battery storage (S-17 fix: vintage-tracking) ---
-        # Track year-over-year battery additions. Each vintage has its own
-        # replacement schedule (replaced every battery_life years) and its
-        # own remaining life at end of horizon.
-        prev_battery_mwh = 0.0
-        for year in sorted(results.generation_mix.keys()):
-            gen = results.generation_mix[year]
-            current_battery_mwh = gen.battery_capacity_mwh
-            added_mwh = current_battery_mwh - prev_battery_mwh
-            if added_mwh > 0:
-                years_in_service = end_year - year
-                # Battery is replaced every battery_life years from its install year
-                age_at_end = years_in_service % battery_life
-                if age_at_end == 0 and years_in_service > 0:
-                    remaining_batt = 0  # Fully depreciated at exact end of life
-                else:
-                    remaining_batt = battery_life - age_at_end
-                if remaining_batt > 0:
-                    # Battery CAPEX at install year (with cost decline)
-                    battery_capex_per_mwh = self.config.technology.battery_capex * 1000  # $/kWh → $/MWh
-                    decline_years = year - self.base_year
-                    decline = (1 - self.config.technology.battery_cost_decline) ** decline_years
-                    battery_capex_per_mwh *= decline
-                    salvage_total += added_mwh * battery_capex_per_mwh * (remaining_batt / battery_life)
-            prev_battery_mwh = current_battery_mwh
-        
-        # --- Diesel generators ---
-        # A-L-02 note: Diesel uses modular arithmetic (horizon_length % diesel_life)
-        # rather than vintage-tracking (as solar/battery do) because diesel capacity
-        # is assumed constant over the horizon in most scenarios — there are no
-        # year-over-year capacity additions to track. This is conservative: it may
-        # slightly overstate salvage if some generators were replaced mid-horizon
-        # (the modular approach assumes all generators are on the same replacement
-        # cycle starting from base year). For solar/battery, vintage-tracking is
-        # essential because capacity ramps up over time with cost declines.
-        diesel_mw = final_gen.diesel_capacity_mw
-        if diesel_mw > 0:
-            # M-BUG-6 fix: modular replacement timing (same logic as battery)
-            diesel_age_at_end = horizon_length % diesel_life
-            if diesel_age_at_end == 0:
-                remaining_diesel = 0
-            else:
-                remaining_diesel = diesel_life - diesel_age_at_end
-            diesel_capex_per_mw = self.config.technology.diesel_gen_capex * 1000
-            salvage_diesel = diesel_mw * diesel_capex_per_mw * (remaining_diesel / diesel_life)
-            salvage_total += salvage_diesel
-        
-        # --- Submarine cable (if import scenario) ---
-        # A-MO-02 fix: Use cable_capex_total which includes converter stations ($320M),
-        # landing facilities ($80M), IDC, and grid upgrades — not just bare cable.
-        import_gwh = final_gen.import_gwh
-        if import_gwh > 0:
-            cable_life = self.config.technology.cable_lifetime
-            cable_total = (
-                self.config.one_grid.cable_capex_total
-                * self.config.one_grid.gom_share_pct
-            )
-            cable_online = self.config.one_grid.cable_online_year
-            cable_age = end_year - cable_online
-            remaining_cable = max(0, cable_life - cable_age)
-            salvage_cable = cable_total * (remaining_cable / cable_life)
-            salvage_total += salvage_cable
+        life = asset.lifetime(cfg)
+        in_service = end_year - vintage
+        if asset.replaced:
+            age = in_service % life
+            remaining = np.where((age == 0) & (in_service > 0), 0, life - age)
+        else:
+            remaining = np.maximum(0, life - in_service)
         
-        # Discount to base year
-        return salvage_total * self.discount_factor(end_year)
+        unit = asset.unit_capex(cfg) * (1 - asset.cost_decline(cfg)) ** (vintage - self.base_year)
+        return float(np.sum(size * unit * (remaining / life)))
     
     def _get_scc(self, year: int) -> float:
         """
@@ -586,18 +1051,93 @@ class CBACalculator:
             # Incremental costs <= 0 means alt is cheaper than BAU on every dimension
             result.bcr = float('inf') if result.pv_total_benefits > 0 else 1.0
         
-        # Payback period calculation
-        result.payback_years = self._calculate_payback(base_results, alt_results)
-        
-        # IRR calculation
-        result.irr = self._calculate_irr(base_results, alt_results)
+        # Payback and IRR share one set of incremental streams
+        flows = self.incremental_cash_flows(base_results, alt_results)
+        result.payback_years = self._calculate_payback(base_results, alt_results, flows)
+        result.irr = self._calculate_irr(base_results, alt_results, flows)
         
         return result
     
+    def incremental_cash_flows(
+        self,
+        base_results: ScenarioResults,
+        alt_results: ScenarioResults,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Year-by-year incremental streams of `alt` against `base`.
+        
+        Arrays are aligned with self.horizon:
+          - investment:   Δ(CAPEX + OPEX + PPA)
+          - fuel_savings: base fuel - alt fuel (diesel + LNG)
+          - net:          EIRR cash flow — all benefit savings minus investment
+                          (A-CR-02: same benefit streams as ENPV)
+        """
+        horizon = np.asarray(self.horizon, dtype=np.int64)
+        
+        alignments = {}
+        
+        def on_horizon(table, attr):
+            # (values, present) of one AnnualTable column on self.horizon;
+            # the year alignment is worked out once per table
+            align = alignments.get(id(table))
+            if align is None:
+                years = table.years
+                if len(years) == len(horizon) and (years == horizon).all():
+                    align = (None, np.ones(len(horizon), dtype=bool))
+                elif len(years):
+                    j = np.minimum(np.searchsorted(years, horizon), len(years) - 1)
+                    align = (j, years[j] == horizon)
+                else:
+                    align = (None, np.zeros(len(horizon), dtype=bool))
+                alignments[id(table)] = align
+            j, present = align
+            if j is not None:
+                return np.where(present, table.column(attr)[j], 0.0), present
+            if len(table):
+                return table.column(attr), present
+            return np.zeros(len(horizon)), present
+        
+        def costs(results, attr):
+            values, present = on_horizon(results.annual_costs, attr)
+            if not present.all():
+                raise KeyError(int(horizon[~present][0]))
+            return values
+        
+        def benefit_delta(attr):
+            # Benefit savings count only where both scenarios carry benefits
+            b, b_present = on_horizon(base_results.annual_benefits, attr)
+            a, a_present = on_horizon(alt_results.annual_benefits, attr)
+            return np.where(b_present & a_present, a - b, 0.0)
+        
+        investment = (
+            (costs(alt_results, "total_capex") - costs(base_results, "total_capex"))
+            + (costs(alt_results, "total_opex") - costs(base_results, "total_opex"))
+            + (costs(alt_results, "ppa_imports") - costs(base_results, "ppa_imports"))
+        )
+        # E-CR-02 / E-01: include LNG fuel in fuel savings
+        fuel_savings = (
+            (costs(base_results, "fuel_diesel") + costs(base_results, "fuel_lng"))
+            - (costs(alt_results, "fuel_diesel") + costs(alt_results, "fuel_lng"))
+        )
+        total_savings = (
+            fuel_savings
+            + benefit_delta("emission_reduction_benefit")
+            + benefit_delta("health_benefit")
+            + benefit_delta("reliability_benefit")
+            + benefit_delta("environmental_benefit")  # A-MO-01
+        )
+        
+        return {
+            "investment": investment,
+            "fuel_savings": fuel_savings,
+            "net": total_savings - investment,
+        }
+    
     def _calculate_payback(
         self, 
         base_results: ScenarioResults, 
-        alt_results: ScenarioResults
+        alt_results: ScenarioResults,
+        flows: Optional[Dict[str, np.ndarray]] = None,
     ) -> Optional[float]:
         """
         Calculate simple payback period (fuel-only savings).
@@ -609,35 +1149,19 @@ class CBACalculator:
         all benefit streams) would be shorter. This conservative metric is
         reported alongside BCR and ENPV which do include all benefit streams.
         """
-        cumulative_cost = 0.0
-        cumulative_savings = 0.0
-        
-        for year in self.horizon:
-            base_costs = base_results.annual_costs[year]
-            alt_costs = alt_results.annual_costs[year]
-            
-            # Annual incremental investment (capex + opex + ppa)
-            annual_investment = (
-                (alt_costs.total_capex - base_costs.total_capex) +
-                (alt_costs.total_opex - base_costs.total_opex) +
-                (alt_costs.ppa_imports - base_costs.ppa_imports)
-            )
-            
-            # Annual savings (E-01 fix: include LNG fuel, consistent with IRR)
-            annual_savings = (base_costs.fuel_diesel + base_costs.fuel_lng) - (alt_costs.fuel_diesel + alt_costs.fuel_lng)
-            
-            cumulative_cost += max(0, annual_investment)
-            cumulative_savings += annual_savings
-            
-            if cumulative_savings >= cumulative_cost and cumulative_cost > 0:
-                return year - self.base_year + 1
-        
-        return None  # Never pays back in horizon
+        if flows is None:
+            flows = self.incremental_cash_flows(base_results, alt_results)
+        period = payback_periods(flows["investment"], flows["fuel_savings"])[0]
+        if np.isnan(period):
+            return None  # Never pays back in horizon
+        year = self.horizon[int(period) - 1]
+        return year - self.base_year + 1
     
     def _calculate_irr(
         self, 
         base_results: ScenarioResults, 
-        alt_results: ScenarioResults
+        alt_results: ScenarioResults,
+        flows: Optional[Dict[str, np.ndarray]] = None,
     ) -> Optional[float]:
         """
         Calculate Economic Internal Rate of Return (EIRR).
@@ -646,99 +1170,161 @@ class CBACalculator:
         (fuel savings + emission savings + health savings + reliability savings)
         per ADB (2017) §6.17.
         """
-        # Build cash flow stream: total benefits - incremental costs
-        cash_flows = []
+        # Cash flow stream: total benefits - incremental costs
+        if flows is None:
+            flows = self.incremental_cash_flows(base_results, alt_results)
+        cash_flows = flows["net"]
+        
+        # Same solver as compare() and the Monte Carlo summary (irr_batch), so
+        # a pair with several sign changes reports one root everywhere
+        irr = irr_batch(cash_flows)[0]
+        return float(irr) if np.isfinite(irr) else None
+    
+    def compare(
+        self,
+        results: Mapping[str, ScenarioResults],
+        baseline: str = "bau",
+        pairs: Sequence[Tuple[str, str]] = (),
+    ) -> ScenarioComparison:
+        """
+        Compare any number of scenarios in one vectorised pass.
         
-        for year in self.horizon:
-            base_costs = base_results.annual_costs[year]
-            alt_costs = alt_results.annual_costs[year]
-            base_benefits = base_results.annual_benefits.get(year)
-            alt_benefits = alt_results.annual_benefits.get(year)
-            
-            # Fuel savings (E-CR-02: include LNG fuel in fuel savings calc)
-            fuel_savings = (base_costs.fuel_diesel + base_costs.fuel_lng) - (alt_costs.fuel_diesel + alt_costs.fuel_lng)
-            
-            # Emission savings (SCC-valued)
-            emission_savings = 0.0
-            if base_benefits and alt_benefits:
-                emission_savings = (
-                    alt_benefits.emission_reduction_benefit
-                    - base_benefits.emission_reduction_benefit
-                )
-            
-            # Health savings
-            health_savings = 0.0
-            if base_benefits and alt_benefits:
-                health_savings = (
-                    alt_benefits.health_benefit
-                    - base_benefits.health_benefit
-                )
-            
-            # Reliability savings
-            reliability_savings = 0.0
-            if base_benefits and alt_benefits:
-                reliability_savings = (
-                    alt_benefits.reliability_benefit
-                    - base_benefits.reliability_benefit
-                )
-            
-            # A-MO-01: Environmental externality savings
-            environmental_savings = 0.0
-            if base_benefits and alt_benefits:
-                environmental_savings = (
-                    alt_benefits.environmental_benefit
-                    - base_benefits.environmental_benefit
-                )
-            
-            total_savings = fuel_savings + emission_savings + health_savings + reliability_savings + environmental_savings
-            
-            incremental_cost = (
-                (alt_costs.total_capex - base_costs.total_capex) +
-                (alt_costs.total_opex - base_costs.total_opex) +
-                (alt_costs.ppa_imports - base_costs.ppa_imports)
+        All stream matrices are stacked into a (scenarios × streams × years)
+        array and discounted together; incremental results for every
+        alternative against `baseline` (plus any extra `pairs`) are computed
+        as array differences, with EIRR and payback from irr_batch and
+        payback_periods over all pairs at once.
+        
+        Args:
+            results: Scenario key → ScenarioResults (any number of entries)
+            baseline: Key every other scenario is compared against
+            pairs: Extra (base_key, alt_key) comparisons, e.g. FI vs NG
+        
+        Returns:
+            ScenarioComparison with per-scenario NPVs and incremental results
+        """
+        keys = list(results)
+        stacked = [self.stream_matrix(results[k]) for k in keys]
+        years = np.array(sorted(set().union(*(y.tolist() for y, _ in stacked))), dtype=np.int64)
+        
+        tensor = np.zeros((len(keys), len(PV_STREAMS), len(years)))
+        for i, (y, m) in enumerate(stacked):
+            tensor[i][:, np.searchsorted(years, y)] = m
+        
+        pv = tensor @ self.discount_factors(years) if len(years) else np.zeros(tensor.shape[:2])
+        end_df = self.discount_factor(max(self.horizon))
+        pv_salvage = np.array([self._salvage_undiscounted(results[k]) for k in keys]) * end_df
+        pv_total_costs = pv[:, 0] + pv[:, 1] + pv[:, 2] + pv[:, 3] - pv_salvage
+        
+        lcoe = np.zeros(len(keys))
+        positive = pv[:, 8] > 0
+        lcoe[positive] = pv_total_costs[positive] / (pv[positive, 8] * 1e6)
+        
+        af = self.annuity_factor()
+        npv = {
+            k: NPVResult(
+                scenario_name=results[k].name,
+                pv_capex=float(pv[i, 0]),
+                pv_opex=float(pv[i, 1]),
+                pv_fuel=float(pv[i, 2]),
+                pv_ppa=float(pv[i, 3]),
+                pv_salvage=float(pv_salvage[i]),
+                pv_total_costs=float(pv_total_costs[i]),
+                pv_emission_costs=float(pv[i, 4]),
+                pv_health_benefits=float(pv[i, 5]),
+                pv_reliability_benefits=float(pv[i, 6]),
+                pv_environmental_benefits=float(pv[i, 7]),
+                lcoe_usd_per_kwh=float(lcoe[i]),
+                annual_avg_cost=float(pv_total_costs[i] * af),
+                annual_avg_capex=float(pv[i, 0] * af),
+                discount_rate=self.discount_rate,
             )
-            
-            cash_flows.append(total_savings - incremental_cost)
-        
-        # Use numpy_financial or scipy to calculate IRR
-        try:
-            import numpy_financial as npf
-            irr = npf.irr(cash_flows)
-        except ImportError:
-            # Fallback: bisection method
-            irr = self._irr_bisection(cash_flows)
-        
-        try:
-            if irr is None or np.isnan(irr) or np.isinf(irr):
-                return None
-            return float(irr)
-        except (ValueError, TypeError, AttributeError):  # MR-07 fix: no bare except
-            return None
-    
-    @staticmethod
-    def _irr_bisection(cash_flows, lo=-0.5, hi=2.0, tol=1e-6, max_iter=200):
-        """Compute IRR by bisection when numpy_financial is unavailable."""
-        def npv_at_rate(r):
-            return sum(cf / (1 + r) ** t for t, cf in enumerate(cash_flows))
-        
-        npv_lo = npv_at_rate(lo)
-        npv_hi = npv_at_rate(hi)
-        
-        if npv_lo * npv_hi > 0:
-            return None  # no sign change → no IRR in range
+            for i, k in enumerate(keys)
+        }
         
-        for _ in range(max_iter):
-            mid = (lo + hi) / 2
-            npv_mid = npv_at_rate(mid)
-            if abs(npv_mid) < tol:
-                return mid
-            if npv_lo * npv_mid < 0:
-                hi = mid
-                npv_hi = npv_mid
-            else:
-                lo = mid
-                npv_lo = npv_mid
-        return (lo + hi) / 2
+        table = ScenarioComparison(
+            keys=keys,
+            baseline=baseline,
+            pv=pv,
+            pv_salvage=pv_salvage,
+            pv_total_costs=pv_total_costs,
+            lcoe_usd_per_kwh=lcoe,
+            npv=npv,
+        )
+        
+        all_pairs = [(baseline, k) for k in keys if k != baseline and baseline in results]
+        all_pairs += [p for p in pairs if p not in all_pairs]
+        if all_pairs:
+            table.incremental = self._incremental_batch(results, keys, pv, all_pairs)
+        return table
+    
+    def _incremental_batch(
+        self,
+        results: Mapping[str, ScenarioResults],
+        keys: List[str],
+        pv: np.ndarray,
+        pairs: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], IncrementalResult]:
+        """Vectorised calculate_incremental() over many (base, alt) pairs."""
+        b = np.array([keys.index(base) for base, _ in pairs])
+        a = np.array([keys.index(alt) for _, alt in pairs])
+        
+        d_capex = pv[a, 0] - pv[b, 0]
+        d_opex = pv[a, 1] - pv[b, 1]
+        d_fuel = pv[a, 2] - pv[b, 2]
+        d_ppa = pv[a, 3] - pv[b, 3]
+        investment = d_capex + d_opex + d_ppa
+        
+        fuel_savings = pv[b, 2] - pv[a, 2]
+        emission_savings = pv[b, 4] - pv[a, 4]
+        health_savings = pv[a, 5] - pv[b, 5]          # L4
+        reliability_savings = pv[a, 6] - pv[b, 6]     # L20
+        environmental_savings = pv[a, 7] - pv[b, 7]   # A-MO-01
+        total_benefits = (
+            fuel_savings + emission_savings
+            + health_savings + reliability_savings
+            + environmental_savings
+        )
+        
+        # BCR — MR-05: inf when alt is cheaper than base on every dimension
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bcr = np.where(
+                investment > 0,
+                total_benefits / investment,
+                np.where(total_benefits > 0, np.inf, 1.0),
+            )
+        
+        flows = [self.incremental_cash_flows(results[base], results[alt]) for base, alt in pairs]
+        irr = irr_batch(np.vstack([f["net"] for f in flows]))
+        period = payback_periods(
+            np.vstack([f["investment"] for f in flows]),
+            np.vstack([f["fuel_savings"] for f in flows]),
+        )
+        horizon = np.asarray(self.horizon)
+        
+        out = {}
+        for j, (base, alt) in enumerate(pairs):
+            p = period[j]
+            out[(base, alt)] = IncrementalResult(
+                base_scenario=results[base].name,
+                alternative_scenario=results[alt].name,
+                incremental_pv_capex=float(d_capex[j]),
+                incremental_pv_opex=float(d_opex[j]),
+                incremental_pv_fuel=float(d_fuel[j]),
+                incremental_pv_ppa=float(d_ppa[j]),
+                incremental_pv_costs=float(investment[j]),
+                pv_fuel_savings=float(fuel_savings[j]),
+                pv_emission_savings=float(emission_savings[j]),
+                pv_health_savings=float(health_savings[j]),
+                pv_reliability_savings=float(reliability_savings[j]),
+                pv_environmental_savings=float(environmental_savings[j]),
+                pv_total_benefits=float(total_benefits[j]),
+                npv=float(total_benefits[j] - investment[j]),
+                bcr=float(bcr[j]),
+                irr=None if np.isnan(irr[j]) else float(irr[j]),
+                payback_years=None if np.isnan(p) else int(horizon[int(p) - 1] - self.base_year + 1),
+            )
+        return out
     
     def compare_all_scenarios(
         self,
@@ -751,116 +1337,60 @@ class CBACalculator:
         lng_transition_results: ScenarioResults = None,
     ) -> CBAComparison:
         """
-        Perform complete CBA comparison of all six scenarios.
-        """
-        # Calculate NPVs
-        sq_npv = self.calculate_npv(status_quo_results)
-        gt_npv = self.calculate_npv(green_results)
-        og_npv = self.calculate_npv(one_grid_results)
-        ig_npv = self.calculate_npv(islanded_green_results) if islanded_green_results else None
-        ns_npv = self.calculate_npv(nearshore_solar_results) if nearshore_solar_results else None
-        mx_npv = self.calculate_npv(maximum_re_results) if maximum_re_results else None
-        lng_npv = self.calculate_npv(lng_transition_results) if lng_transition_results else None
+        Perform complete CBA comparison of the seven named scenarios.
         
-        # Incremental analyses
-        green_vs_sq = self.calculate_incremental(
-            status_quo_results, green_results, sq_npv, gt_npv
-        )
-        og_vs_sq = self.calculate_incremental(
-            status_quo_results, one_grid_results, sq_npv, og_npv
-        )
-        og_vs_green = self.calculate_incremental(
-            green_results, one_grid_results, gt_npv, og_npv
-        )
-        ig_vs_sq = (
-            self.calculate_incremental(
-                status_quo_results, islanded_green_results, sq_npv, ig_npv
-            )
-            if islanded_green_results
-            else IncrementalResult(base_scenario="", alternative_scenario="")
-        )
-        ns_vs_sq = (
-            self.calculate_incremental(
-                status_quo_results, nearshore_solar_results, sq_npv, ns_npv
-            )
-            if nearshore_solar_results
-            else IncrementalResult(base_scenario="", alternative_scenario="")
-        )
-        mx_vs_sq = (
-            self.calculate_incremental(
-                status_quo_results, maximum_re_results, sq_npv, mx_npv
-            )
-            if maximum_re_results
-            else IncrementalResult(base_scenario="", alternative_scenario="")
-        )
-        lng_vs_sq = (
-            self.calculate_incremental(
-                status_quo_results, lng_transition_results, sq_npv, lng_npv
-            )
-            if lng_transition_results
-            else IncrementalResult(base_scenario="", alternative_scenario="")
-        )
-        
-        # Find least cost scenario
-        costs = {
-            "Status Quo": sq_npv.pv_total_costs,
-            "Full Integration": og_npv.pv_total_costs,
-            "National Grid": gt_npv.pv_total_costs,
+        Kept for backward compatibility — a fixed-field view over compare().
+        """
+        results = {
+            "bau": status_quo_results,
+            "full_integration": one_grid_results,
+            "national_grid": green_results,
+            "islanded_green": islanded_green_results,
+            "nearshore_solar": nearshore_solar_results,
+            "maximum_re": maximum_re_results,
+            "lng_transition": lng_transition_results,
         }
-        if ig_npv:
-            costs["Islanded Green"] = ig_npv.pv_total_costs
-        if ns_npv:
-            costs["Near-Shore Solar"] = ns_npv.pv_total_costs
-        if mx_npv:
-            costs["Maximum RE"] = mx_npv.pv_total_costs
-        if lng_npv:
-            costs["LNG Transition"] = lng_npv.pv_total_costs
-        least_cost_scenario = min(costs, key=costs.get)
-        
-        # Find recommended scenario (considering emissions)
-        total_costs_with_emissions = {
-            "Status Quo": sq_npv.pv_total_costs + sq_npv.pv_emission_costs,
-            "Full Integration": og_npv.pv_total_costs + og_npv.pv_emission_costs,
-            "National Grid": gt_npv.pv_total_costs + gt_npv.pv_emission_costs,
+        results = {k: v for k, v in results.items() if v is not None}
+        table = self.compare(results, pairs=[("national_grid", "full_integration")])
+        
+        labels = {
+            "bau": "Status Quo",
+            "full_integration": "Full Integration",
+            "national_grid": "National Grid",
+            "islanded_green": "Islanded Green",
+            "nearshore_solar": "Near-Shore Solar",
+            "maximum_re": "Maximum RE",
+            "lng_transition": "LNG Transition",
         }
-        if ig_npv:
-            total_costs_with_emissions["Islanded Green"] = ig_npv.pv_total_costs + ig_npv.pv_emission_costs
-        if ns_npv:
-            total_costs_with_emissions["Near-Shore Solar"] = ns_npv.pv_total_costs + ns_npv.pv_emission_costs
-        if mx_npv:
-            total_costs_with_emissions["Maximum RE"] = mx_npv.pv_total_costs + mx_npv.pv_emission_costs
-        if lng_npv:
-            total_costs_with_emissions["LNG Transition"] = lng_npv.pv_total_costs + lng_npv.pv_emission_costs
-        recommended = min(total_costs_with_emissions, key=total_costs_with_emissions.get)
-        
-        # Use dummy NPVResults for missing scenarios
-        if ig_npv is None:
-            ig_npv = NPVResult(scenario_name="Islanded Green")
-        if ns_npv is None:
-            ns_npv = NPVResult(scenario_name="Near-Shore Solar")
-        if mx_npv is None:
-            mx_npv = NPVResult(scenario_name="Maximum RE")
-        if lng_npv is None:
-            lng_npv = NPVResult(scenario_name="LNG Transition")
         
+        def npv_for(key):
+            # Dummy NPVResults for missing scenarios
+            return table.npv.get(key) or NPVResult(scenario_name=labels[key])
+        
+        def vs_bau(key):
+            return table.incremental.get(
+                ("bau", key), IncrementalResult(base_scenario="", alternative_scenario="")
+            )
+        
+        least_cost = table.least_cost_scenario
         return CBAComparison(
-            bau=sq_npv,
-            full_integration=og_npv,
-            national_grid=gt_npv,
-            islanded_green=ig_npv,
-            nearshore_solar=ns_npv,
-            maximum_re=mx_npv,
-            lng_transition=lng_npv,
-            fi_vs_bau=og_vs_sq,
-            ng_vs_bau=green_vs_sq,
-            fi_vs_ng=og_vs_green,
-            ig_vs_bau=ig_vs_sq,
-            ns_vs_bau=ns_vs_sq,
-            mx_vs_bau=mx_vs_sq,
-            lng_vs_bau=lng_vs_sq,
-            least_cost_scenario=least_cost_scenario,
-            least_cost_npv=costs[least_cost_scenario],
-            recommended_scenario=recommended,
+            bau=npv_for("bau"),
+            full_integration=npv_for("full_integration"),
+            national_grid=npv_for("national_grid"),
+            islanded_green=npv_for("islanded_green"),
+            nearshore_solar=npv_for("nearshore_solar"),
+            maximum_re=npv_for("maximum_re"),
+            lng_transition=npv_for("lng_transition"),
+            fi_vs_bau=vs_bau("full_integration"),
+            ng_vs_bau=vs_bau("national_grid"),
+            fi_vs_ng=table.incremental[("national_grid", "full_integration")],
+            ig_vs_bau=vs_bau("islanded_green"),
+            ns_vs_bau=vs_bau("nearshore_solar"),
+            mx_vs_bau=vs_bau("maximum_re"),
+            lng_vs_bau=vs_bau("lng_transition"),
+            least_cost_scenario=labels[least_cost],
+            least_cost_npv=table.npv[least_cost].pv_total_costs,
+            recommended_scenario=labels[table.recommended_scenario],
         )
 
 
@@ -616,25 +616,33 @@ class SensitivityAnalysis:
         """
         param = self.parameters[parameter_name]
         
-        # Create modified configs
-        config_low = self._modify_config(parameter_name, param.low_value)
-        config_high = self._modify_config(parameter_name, param.high_value)
-        
-        # Run scenarios
-        results_low = scenario_runner(config_low)
-        results_high = scenario_runner(config_high)
-        
-        # Calculate NPVs
-        # F-01 fix: Use economic cost (financial + emission costs) so SCC
-        # parameter variation actually affects the tornado diagram. Without
-        # emission costs, SCC has zero impact on pv_total_costs.
-        calc_low = CBACalculator(config_low)
-        calc_high = CBACalculator(config_high)
-        
-        npv_result_low = calc_low.calculate_npv(results_low)
-        npv_result_high = calc_high.calculate_npv(results_high)
-        npv_low = npv_result_low.pv_total_costs + npv_result_low.pv_emission_costs
-        npv_high = npv_result_high.pv_total_costs + npv_result_high.pv_emission_costs
+        if parameter_name == "discount_rate":
+            # Discounting does not change the cash flows: run once and sweep
+            sweep = CBACalculator(self.config).calculate_npv_sweep(
+                scenario_runner(self.config),
+                discount_rates=[param.low_value, param.high_value],
+            )
+            npv_low, npv_high = sweep.pv_economic_costs.tolist()
+        else:
+            # Create modified configs
+            config_low = self._modify_config(parameter_name, param.low_value)
+            config_high = self._modify_config(parameter_name, param.high_value)
+            
+            # Run scenarios
+            results_low = scenario_runner(config_low)
+            results_high = scenario_runner(config_high)
+            
+            # Calculate NPVs
+            # F-01 fix: Use economic cost (financial + emission costs) so SCC
+            # parameter variation actually affects the tornado diagram. Without
+            # emission costs, SCC has zero impact on pv_total_costs.
+            calc_low = CBACalculator(config_low)
+            calc_high = CBACalculator(config_high)
+            
+            npv_result_low = calc_low.calculate_npv(results_low)
+            npv_result_high = calc_high.calculate_npv(results_high)
+            npv_low = npv_result_low.pv_total_costs + npv_result_low.pv_emission_costs
+            npv_high = npv_result_high.pv_total_costs + npv_result_high.pv_emission_costs
         
         # Calculate impact measures
         npv_range = abs(npv_high - npv_low)
@@ -8,12 +8,15 @@ All values are loaded from parameters.csv via load_parameters_from_csv().
 Note: Values marked with # ESTIMATE need validation from experts/data sources.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 # yaml import removed — config loads from CSV, not YAML (L-BUG-3 fix)
 import csv
+import hashlib
 import logging
+import os
+import pickle
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +47,47 @@ TIME_HORIZONS = {
 # =============================================================================
 
 
+# =============================================================================
+# SUB-CONFIG BASE
+# =============================================================================
+
+class _ConfigSection:
+    """
+    Base of the sub-config dataclasses: counts attribute assignments.
+    
+    Config.fingerprint() reuses a section's digest while its revision and
+    its mutable containers (dicts, lists, nested sections) are unchanged,
+    so after one assignment only that sub-config is canonicalised and
+    rehashed.
+    """
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_revision", self.__dict__.get("_revision", 0) + 1)
+
+
+def _section_state(value):
+    """Cheap change token for a config field (see _ConfigSection)."""
+    if isinstance(value, _ConfigSection):
+        attrs = value.__dict__
+        revision = attrs.get("_revision", 0)
+        containers = attrs.get("_containers")
+        if containers is None or containers[0] != revision:
+            # Rescanned only after an assignment; stored without bumping _revision
+            containers = (revision, tuple(
+                k for k, v in attrs.items() if isinstance(v, (dict, list, set, _ConfigSection))
+            ))
+            attrs["_containers"] = containers
+        return (revision,) + tuple(_section_state(attrs[k]) for k in containers[1])
+    return _canonical(value)
+
+
 # =============================================================================
 # BASELINE DEMAND (2024)
 # =============================================================================
 
 @dataclass
-class DemandConfig:
+class DemandConfig(_ConfigSection):
     """Electricity demand parameters."""
     
     base_demand_gwh: float = 1200.0  # IRENA 2022 (1025 GWh) × 1.05^4; validated by 2018 Data Book
@@ -119,7 +157,7 @@ class DemandConfig:
 # =============================================================================
 
 @dataclass
-class TechnologyCosts:
+class TechnologyCosts(_ConfigSection):
     """Capital and operating costs for all technologies."""
     
     # Solar PV (utility scale) - IRENA RPGC 2024
@@ -233,7 +271,7 @@ class TechnologyCosts:
 # =============================================================================
 
 @dataclass
-class FuelConfig:
+class FuelConfig(_ConfigSection):
     """Diesel fuel parameters."""
     
     price_2026: float = 0.85  # USD/liter - Platts Dec 2025; STO import data
@@ -260,7 +298,7 @@ class FuelConfig:
 # =============================================================================
 
 @dataclass
-class PPAConfig:
+class PPAConfig(_ConfigSection):
     """Power Purchase Agreement parameters for One Grid scenario."""
     
     import_price_2030: float = 0.06  # USD/kWh - India wholesale + cable premium
@@ -294,7 +332,7 @@ class PPAConfig:
 # =============================================================================
 
 @dataclass
-class DispatchConfig:
+class DispatchConfig(_ConfigSection):
     """Hourly dispatch model parameters. All verified against GEP-OnSSET code."""
     
     # Battery — GEP-OnSSET onsset.py L194
@@ -336,7 +374,7 @@ class DispatchConfig:
 # =============================================================================
 
 @dataclass
-class CableOutageConfig:
+class CableOutageConfig(_ConfigSection):
     """Submarine cable outage parameters for supply security analysis."""
     
     # Outage rate — NorNed ~0.13/yr (2 in 15yr); Basslink ~0.18/yr (3 in 17yr)
@@ -350,7 +388,7 @@ class CableOutageConfig:
 # =============================================================================
 
 @dataclass
-class SupplySecurityConfig:
+class SupplySecurityConfig(_ConfigSection):
     """Diesel fleet standby reserve costs for supply security."""
     
     # Annual cost of maintaining idle diesel fleet — bottom-up engineering estimate
@@ -365,7 +403,7 @@ class SupplySecurityConfig:
 # =============================================================================
 
 @dataclass
-class ConnectionConfig:
+class ConnectionConfig(_ConfigSection):
     """Last-mile household connection costs (L11)."""
     
     cost_per_household: float = 200.0  # USD/HH — World Bank ESMAP 2019; ADB POISED PCR 2023
@@ -378,7 +416,7 @@ class ConnectionConfig:
 # =============================================================================
 
 @dataclass
-class TourismConfig:
+class TourismConfig(_ConfigSection):
     """Off-grid resort sector parameters (L6). NOT in public utility CBA;
     provides national emissions context and green premium revenue potential."""
     
@@ -393,7 +431,7 @@ class TourismConfig:
 # =============================================================================
 
 @dataclass
-class NearShoreConfig:
+class NearShoreConfig(_ConfigSection):
     """Near-shore and floating solar parameters for S5/S6 scenarios (D61).
     
     Uninhabited islands near Malé can host solar farms connected by short
@@ -419,7 +457,7 @@ class NearShoreConfig:
 # =============================================================================
 
 @dataclass
-class LNGConfig:
+class LNGConfig(_ConfigSection):
     """LNG transition parameters for S7 scenario (R9).
     
     Gulhifalhu LNG terminal replaces diesel for Greater Malé.
@@ -454,7 +492,7 @@ class LNGConfig:
 # =============================================================================
 
 @dataclass
-class WTEConfig:
+class WTEConfig(_ConfigSection):
     """Waste-to-energy parameters (R6).
     
     3 plants: 12 MW Thilafushi + 1.5 MW Addu + 0.5 MW Vandhoo = 14 MW baseload.
@@ -496,7 +534,7 @@ class WTEConfig:
 # =============================================================================
 
 @dataclass
-class WindConfig:
+class WindConfig(_ConfigSection):
     """Wind energy parameters.
     
     80 MW wind on Gulhifalhu/Thilafushi industrial islands using 2 MW turbines.
@@ -536,7 +574,7 @@ class WindConfig:
 # =============================================================================
 
 @dataclass
-class MCAConfig:
+class MCAConfig(_ConfigSection):
     """MCA criteria weights and qualitative expert-assigned scores (L17).
     
     Weights must sum to 1.0. Qualitative scores are 0-1 where 1 = best.
@@ -589,7 +627,7 @@ class MCAConfig:
 # =============================================================================
 
 @dataclass
-class FinancingConfig:
+class FinancingConfig(_ConfigSection):
     """Financing terms for supplementary fiscal analysis (L5).
     
     These params feed financing_analysis.py (standalone). They do NOT
@@ -622,7 +660,7 @@ class FinancingConfig:
 # =============================================================================
 
 @dataclass
-class EconomicsConfig:
+class EconomicsConfig(_ConfigSection):
     """Economic and CBA parameters."""
     
     # Discount rate
@@ -661,7 +699,7 @@ class EconomicsConfig:
 # =============================================================================
 
 @dataclass 
-class CurrentSystemConfig:
+class CurrentSystemConfig(_ConfigSection):
     """
     Current electricity system parameters (2024 baseline from GoM Energy Roadmap).
     
@@ -729,7 +767,7 @@ class CurrentSystemConfig:
 # =============================================================================
 
 @dataclass
-class GreenTransitionConfig:
+class GreenTransitionConfig(_ConfigSection):
     """Solar PV and battery deployment schedule for Green Transition.
     
     Endogenous RE deployment: solar+battery LCOE ($0.166/kWh) < diesel LCOE
@@ -769,7 +807,7 @@ class GreenTransitionConfig:
 # =============================================================================
 
 @dataclass
-class OneGridConfig:
+class OneGridConfig(_ConfigSection):
     """Undersea cable and import configuration for One Grid scenario."""
     
     # Cable parameters
@@ -855,7 +893,7 @@ SENSITIVITY_PARAMS = {
 # =============================================================================
 
 @dataclass
-class BenchmarksConfig:
+class BenchmarksConfig(_ConfigSection):
     """LCOE benchmarks from IRENA, ADB, and SIDS project reports.
     
     Used in report comparison charts. All values in USD/kWh.
@@ -875,7 +913,7 @@ class BenchmarksConfig:
 # =============================================================================
 
 @dataclass
-class DistributionalSharesConfig:
+class DistributionalSharesConfig(_ConfigSection):
     """Illustrative cost/benefit allocation shares for distributional analysis.
     
     These are policy assumptions — NOT model outputs. Used in the report
@@ -902,7 +940,7 @@ class DistributionalSharesConfig:
 # =============================================================================
 
 @dataclass
-class InvestmentPhasingConfig:
+class InvestmentPhasingConfig(_ConfigSection):
     """Illustrative investment phasing by technology and period.
     
     These are reference allocations — NOT computed by the model's
@@ -943,7 +981,7 @@ class InvestmentPhasingConfig:
 # =============================================================================
 
 @dataclass
-class TransportConfig:
+class TransportConfig(_ConfigSection):
     """Transport electrification parameters (P8 supplementary module).
     
     Models EV adoption via logistic S-curve across Low/Medium/High scenarios.
@@ -989,6 +1027,36 @@ class TransportConfig:
 # MAIN CONFIG CLASS
 # =============================================================================
 
+def _canonical(value):
+    """
+    Hashable, order-independent form of a config value for fingerprinting.
+    
+    Numbers are normalised to 12 significant digits so that 0.1 + 0.2 and
+    0.3, 5 and 5.0, or -0.0 and 0.0 fingerprint identically; dicts are
+    sorted by key and nested dataclasses are expanded field by field.
+    """
+    kind = type(value)
+    if kind is float or kind is int:
+        x = float(value)
+        return float(f"{x:.12g}") + 0.0 if x == x else "nan"
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if hasattr(value, "tolist"):  # numpy scalars and arrays
+        return _canonical(value.tolist())
+    if isinstance(value, (int, float)):
+        return _canonical(float(value))
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    if is_dataclass(value):
+        return (type(value).__name__,) + tuple(
+            (f.name, _canonical(getattr(value, f.name))) for f in fields(value)
+        )
+    return repr(value)
+
+
 @dataclass
 class Config:
     """Main configuration container."""
@@ -1116,6 +1184,8 @@ class Config:
         Floor: male_demand_min_share (0.45 from parameters.csv).
         Cap: 0.75 (physical upper bound — Malé can't be >75% of demand).
         
+        Read from the memoised per-horizon trajectory (_male_share_trajectory).
+        
         Args:
             year: Calendar year
             scenario_growth_rate: National demand growth rate (for compatibility)
@@ -1123,30 +1193,63 @@ class Config:
         Returns:
             Malé demand share for the given year (fraction, 0-1)
         """
-        base_share = self.current_system.male_electricity_share
-        
         t = year - self.base_year
         if t <= 0:
-            return base_share
+            return self.current_system.male_electricity_share
+        
+        shares = self._male_share_trajectory(year)
+        return shares[t]
+    
+    def _male_share_inputs(self) -> Tuple:
+        """Every parameter the Malé share trajectory depends on."""
+        d = self.demand
+        return (
+            self.base_year,
+            self.current_system.male_electricity_share,
+            d.male_demand_saturation_year,
+            d.male_growth_near_term,
+            d.male_growth_long_term,
+            d.male_post_peak_growth,
+            d.outer_growth_taper_year,
+            d.outer_growth_near_term,
+            d.outer_growth_long_term,
+            d.outer_post_peak_growth,
+            d.male_demand_min_share,
+        )
+    
+    def _male_share_trajectory(self, year: int) -> List[float]:
+        """
+        Memoised Malé demand share for every year from base_year to at least `year`.
+        
+        Cumulative Malé and outer-island demand are compounded once per
+        horizon (index t = year - base_year), so male_demand_share() and the
+        loss/efficiency blends are O(1) lookups. The table is rebuilt when
+        any growth input changes or a later year is requested.
+        """
+        key = self._male_share_inputs()
+        cached = self.__dict__.get("_male_share_cache")
+        if cached is not None and cached[0] == key and len(cached[1]) > year - self.base_year:
+            return cached[1]
+        
+        base_share = self.current_system.male_electricity_share
+        last_year = max(year, self.end_year)
+        floor = self.demand.male_demand_min_share
         
-        # Year-by-year cumulative calculation
         # Start with Malé at base_share and outer at (1 - base_share) of normalized demand
         male_demand = base_share
         outer_demand = 1.0 - base_share
-        
-        for y in range(self.base_year + 1, year + 1):
-            g_male = self._male_growth_rate(y)
-            g_outer = self._outer_growth_rate(y)
-            male_demand *= (1 + g_male)
-            outer_demand *= (1 + g_outer)
-        
-        total = male_demand + outer_demand
-        share = male_demand / total if total > 0 else base_share
-        
-        # Floor from parameters.csv (can't drop below — Malé remains capital)
-        floor = self.demand.male_demand_min_share
-        # Cap at 0.75 — Malé can't physically consume more than 75% of national demand
-        return max(floor, min(share, 0.75))
+        shares = [base_share]
+        for y in range(self.base_year + 1, last_year + 1):
+            male_demand *= (1 + self._male_growth_rate(y))
+            outer_demand *= (1 + self._outer_growth_rate(y))
+            total = male_demand + outer_demand
+            share = male_demand / total if total > 0 else base_share
+            # Floor from parameters.csv (can't drop below — Malé remains capital)
+            # Cap at 0.75 — Malé can't physically consume more than 75% of national demand
+            shares.append(max(floor, min(share, 0.75)))
+        
+        self._male_share_cache = (key, shares)
+        return shares
 
     def weighted_diesel_efficiency(self, year: int, scenario_growth_rate: float = 0.05) -> float:
         """
@@ -1191,6 +1294,56 @@ class Config:
         loss_male = self.technology.male_grid_loss_pct
         loss_outer = self.technology.outer_grid_loss_pct
         return share * loss_male + (1.0 - share) * loss_outer
+    
+    def _section_digest(self, name: str) -> str:
+        """
+        Memoised hash of one field of the config (a sub-config or a scalar).
+        
+        A sub-config's digest is reused while the same object is attached
+        and its _section_state() (assignment revision plus mutable
+        containers) is unchanged; only a changed sub-config is canonicalised
+        and rehashed. Scalar fields are cheap and always canonicalised.
+        """
+        value = getattr(self, name)
+        state = _section_state(value)
+        cache = self.__dict__.setdefault("_fingerprint_cache", {})
+        cached = cache.get(name)
+        if cached is not None and cached[0] is value and cached[1] == state:
+            return cached[2]
+        canonical = state if not isinstance(value, _ConfigSection) else _canonical(value)
+        digest = hashlib.sha256(repr((name, canonical)).encode()).hexdigest()
+        cache[name] = (value, state, digest)
+        return digest
+    
+    def fingerprint(self, sections: Optional[List[str]] = None) -> str:
+        """
+        Stable content hash of the configuration, for keying result caches.
+        
+        Two configs with the same parameter values (up to float noise) give
+        the same fingerprint in any process, regardless of how they were
+        built or copied.
+        
+        Args:
+            sections: Field names to include (e.g. ["demand", "fuel",
+                "economics"] or ["fuel.price_2026"]) to key a cache on only
+                the fields a consumer reads. Defaults to every field.
+        
+        Returns:
+            32-character hex digest
+        """
+        names = [f.name for f in fields(self)] if sections is None else sorted(set(sections))
+        digest = hashlib.sha256()
+        leaves = []
+        for name in names:
+            if "." in name:
+                # Single sub-config fields are cheap to canonicalise: hash them together
+                sub, attr = name.split(".", 1)
+                leaves.append((name, _canonical(getattr(getattr(self, sub), attr))))
+            else:
+                digest.update(self._section_digest(name).encode())
+        if leaves:
+            digest.update(repr(leaves).encode())
+        return digest.hexdigest()[:32]
 
 
 # =============================================================================
@@ -1265,9 +1418,9 @@ def _v(entry):
     return entry
 
 
-def get_config(load_from_csv: bool = True) -> Config:
+def _build_config(load_from_csv: bool = True) -> Config:
     """
-    Get configuration instance.
+    Build a configuration instance from scratch (uncached; see get_config).
     
     Args:
         load_from_csv: If True, override defaults with values from parameters.csv
@@ -2101,6 +2254,106 @@ def get_config(load_from_csv: bool = True) -> Config:
     return config
 
 
+# Per-process cache of the built Config. parameters.csv is re-hashed only
+# when its mtime/size change, and rebuilt only when the hash changes; each
+# get_config() call unpickles a private clone of the cached instance.
+PARAMETERS_SNAPSHOT = PARAMETERS_CSV.with_suffix(".snapshot.pkl")
+_CONFIG_CACHE: Dict[str, object] = {}
+
+
+def _parameters_digest(csv_path: Path = PARAMETERS_CSV) -> str:
+    """Hash of parameters.csv plus this module (the Config schema)."""
+    digest = hashlib.sha256()
+    digest.update(csv_path.read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def _load_config_snapshot(path: Path, digest: str) -> bool:
+    """Prime the cache from a snapshot file if it matches the current CSV."""
+    if not path.exists():
+        return False
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+        if not isinstance(snapshot, dict) or snapshot.get("digest") != digest:
+            return False
+        blob = snapshot["blob"]
+        if not isinstance(pickle.loads(blob), Config):
+            return False
+        sensitivity = {k: dict(v) for k, v in snapshot["sensitivity"].items()}
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, OSError,
+            KeyError, TypeError, ValueError):
+        # Missing or malformed entries: rebuild from the CSV instead
+        return False
+    _CONFIG_CACHE.update(digest=digest, blob=blob, sensitivity=sensitivity)
+    return True
+
+
+def _cached_config_blob() -> bytes:
+    """Pickled Config for the current parameters.csv, built at most once per version."""
+    st = PARAMETERS_CSV.stat()
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE.get("stat") != stat_key:
+        digest = _parameters_digest()
+        if _CONFIG_CACHE.get("digest") != digest and not _load_config_snapshot(PARAMETERS_SNAPSHOT, digest):
+            config = _build_config(load_from_csv=True)
+            _CONFIG_CACHE.update(
+                digest=digest,
+                blob=pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),
+                sensitivity={k: dict(v) for k, v in SENSITIVITY_PARAMS.items()},
+            )
+        _CONFIG_CACHE["stat"] = stat_key
+    
+    # Building the Config refreshes SENSITIVITY_PARAMS as a side effect; keep that contract
+    for key, vals in _CONFIG_CACHE["sensitivity"].items():
+        SENSITIVITY_PARAMS[key] = dict(vals)
+    return _CONFIG_CACHE["blob"]
+
+
+def get_config(load_from_csv: bool = True) -> Config:
+    """
+    Get configuration instance.
+    
+    parameters.csv is parsed once per process (and again only when the file
+    changes); every call returns an independent copy, so callers may mutate
+    the result freely.
+    
+    Args:
+        load_from_csv: If True, override defaults with values from parameters.csv
+    """
+    if not (load_from_csv and PARAMETERS_CSV.exists()):
+        return _build_config(load_from_csv)
+    return pickle.loads(_cached_config_blob())
+
+
+def clear_config_cache() -> None:
+    """Forget the cached Config (the next get_config() re-reads parameters.csv)."""
+    _CONFIG_CACHE.clear()
+
+
+def save_config_snapshot(path: Path = PARAMETERS_SNAPSHOT) -> Path:
+    """
+    Precompile parameters.csv into a pickled snapshot.
+    
+    get_config() in a fresh process loads the snapshot instead of parsing
+    the CSV, as long as neither parameters.csv nor this module has changed
+    since it was written (stale snapshots are ignored).
+    """
+    path = Path(path)
+    blob = _cached_config_blob()
+    snapshot = {
+        "digest": _CONFIG_CACHE["digest"],
+        "blob": blob,
+        "sensitivity": _CONFIG_CACHE["sensitivity"],
+    }
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return path
+
+
 def _update_sensitivity_params_from_csv(params: Dict):
     """Update SENSITIVITY_PARAMS from CSV Low/High columns."""
     global SENSITIVITY_PARAMS
@@ -2212,6 +2465,14 @@ def print_loaded_parameters():
 
 
 if __name__ == "__main__":
+    import sys
+    
+    if "--snapshot" in sys.argv:
+        # Pickle via the package module so the snapshot does not reference __main__
+        from model.config import save_config_snapshot as _save_snapshot
+        print(f"Config snapshot written to {_save_snapshot()}")
+        sys.exit(0)
+    
     # Test configuration
     print("Testing parameter loading from CSV...")
     
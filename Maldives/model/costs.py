@@ -248,13 +248,15 @@ class CostCalculator:
         """
         if solar_additions is not None and len(solar_additions) > 0:
             # MR-02: Vintage-weighted O&M — each cohort uses its install-year CAPEX
-            total_opex = 0.0
-            for install_year, mw in solar_additions.items():
-                if install_year <= year:
-                    # solar_capex_at_year returns total CAPEX for 1 MW; divide by 1000 to get $/kW
-                    vintage_capex_per_kw = self.solar_capex_at_year(install_year) / 1000 if mw > 0 else self.tech.solar_pv_capex
-                    total_opex += mw * 1000 * vintage_capex_per_kw * self.tech.solar_pv_opex_pct
-            return total_opex
+            install_years = np.fromiter(solar_additions.keys(), dtype=float)
+            mw = np.fromiter(solar_additions.values(), dtype=float)
+            # solar_capex_at_year returns total CAPEX for 1 MW; divide by 1000 to get $/kW
+            vintage_capex_per_kw = np.where(
+                mw > 0, self.solar_capex_at_year(install_years) / 1000, self.tech.solar_pv_capex
+            )
+            cohort_opex = mw * 1000 * vintage_capex_per_kw * self.tech.solar_pv_opex_pct
+            total_opex = self.vintage_sum(install_years, cohort_opex, np.atleast_1d(year))
+            return total_opex if np.ndim(year) else float(total_opex[0])
         else:
             # Fallback: base-year CAPEX (for status_quo / simple scenarios)
             # C-WC-05: include climate adaptation premium to match vintage path
@@ -294,22 +296,8 @@ class CostCalculator:
         hours_per_year = 8760
         capacity_factor = self.tech.solar_pv_capacity_factor
         
-        # Default climate values from config if not provided
-        if ambient_temp_c is None:
-            ambient_temp_c = self.tech.default_ambient_temp
-        if ghi_kwh_m2_day is None:
-            ghi_kwh_m2_day = self.tech.default_ghi
-        
         # --- C7: Temperature derating ---
-        # Cell temperature: T_cell = T_amb + NOCT_coeff × GHI (in kW/m²)
-        # GHI in kW/m²: daily kWh/m² / peak sun hours ~ kW/m² at peak
-        # OnSSET uses instantaneous W/m² but for annual average we use
-        # daily GHI / 24 * 1000 to get avg W/m², then /1000 for kW/m²
-        # Simplified: use daily GHI directly as proxy (GHI_kWh/m²/day ≈ peak kW/m² for ~5.5h)
-        ghi_kw_m2 = ghi_kwh_m2_day / 24  # Average over 24h in kW/m²
-        t_cell = ambient_temp_c + self.tech.pv_noct_coeff * ghi_kw_m2
-        k_t = self.tech.pv_temp_derating_coeff
-        temp_derating = max(0.0, 1.0 - k_t * (t_cell - 25.0))
+        temp_derating = self.solar_temp_derating(ambient_temp_c, ghi_kwh_m2_day)
         
         # --- C8: Annual degradation ---
         degradation_factor = 1.0
@@ -359,28 +347,145 @@ class CostCalculator:
         Returns:
             Total annual generation in GWh (sum of all vintage outputs)
         """
+        return float(self.solar_generation_profile(
+            np.array([year]), solar_additions, existing_mw=existing_mw,
+            existing_install_year=existing_install_year,
+            ambient_temp_c=ambient_temp_c, ghi_kwh_m2_day=ghi_kwh_m2_day,
+        )[0])
+    
+    # --- Vintage engine (C7, C8, MR-02) ---
+    
+    def solar_temp_derating(
+        self,
+        ambient_temp_c: float = None,
+        ghi_kwh_m2_day: float = None,
+    ) -> float:
+        """
+        C7: Temperature derating factor (IEC 61215; OnSSET L186).
+        
+        P_out = P_STC × (1 - k_t × (T_cell - 25)), T_cell = T_amb + NOCT_coeff × GHI_kW/m²
+        
+        Depends only on climate inputs, so vintage calculations evaluate it
+        once rather than per cohort.
+        """
+        # Default climate values from config if not provided
+        if ambient_temp_c is None:
+            ambient_temp_c = self.tech.default_ambient_temp
+        if ghi_kwh_m2_day is None:
+            ghi_kwh_m2_day = self.tech.default_ghi
+        
+        # Cell temperature: T_cell = T_amb + NOCT_coeff × GHI (in kW/m²)
+        # GHI in kW/m²: daily kWh/m² / peak sun hours ~ kW/m² at peak
+        # OnSSET uses instantaneous W/m² but for annual average we use
+        # daily GHI / 24 * 1000 to get avg W/m², then /1000 for kW/m²
+        # Simplified: use daily GHI directly as proxy (GHI_kWh/m²/day ≈ peak kW/m² for ~5.5h)
+        ghi_kw_m2 = ghi_kwh_m2_day / 24  # Average over 24h in kW/m²
+        t_cell = ambient_temp_c + self.tech.pv_noct_coeff * ghi_kw_m2
+        k_t = self.tech.pv_temp_derating_coeff
+        return max(0.0, 1.0 - k_t * (t_cell - 25.0))
+    
+    @staticmethod
+    def vintage_sum(
+        install_years: np.ndarray,
+        values: np.ndarray,
+        years: np.ndarray,
+        retention: float = 1.0,
+    ) -> np.ndarray:
+        """
+        Sum of cohort values in service in each year, aged by a geometric kernel.
+            
+            total[t] = Σ_{c: install_c ≤ years[t]} values_c × retention^(years[t] - install_c)
+        
+        With a geometric kernel the convolution collapses to one prefix sum:
+        cohorts are sorted by install year, discounted back to the first
+        vintage (values_c × retention^-(install_c - first)), cumulated, and each
+        year picks up its prefix and rolls it forward by retention^(t - first).
+        O((cohorts + years) log cohorts) instead of cohorts × years calls.
+        
+        Args:
+            install_years: Install year of each cohort
+            values: Cohort size (MW, or any per-cohort quantity such as O&M)
+            years: Years to evaluate
+            retention: Annual retention factor (1 - degradation); 1.0 = no ageing
+        
+        Returns:
+            Array aligned with `years`
+        """
+        install_years = np.asarray(install_years, dtype=float)
+        values = np.asarray(values, dtype=float)
+        years = np.asarray(years, dtype=float)
+        if install_years.size == 0 or years.size == 0:
+            return np.zeros(years.shape)
+        
+        order = np.argsort(install_years, kind="stable")
+        install_years = install_years[order]
+        values = values[order]
+        n_in_service = np.searchsorted(install_years, years, side="right")
+        
+        first = install_years[0]
+        span = max(install_years[-1], years.max()) - first
+        if retention == 1.0:
+            prefix = np.concatenate(([0.0], np.cumsum(values)))
+            return prefix[n_in_service]
+        if retention > 0 and retention ** -span < 1e8:
+            prefix = np.concatenate(([0.0], np.cumsum(values * retention ** -(install_years - first))))
+            return retention ** (years - first) * prefix[n_in_service]
+        
+        # Steep or zero retention: evaluate the kernel directly
+        age = years[:, None] - install_years[None, :]
+        kernel = np.where(age >= 0, retention ** np.maximum(age, 0), 0.0)
+        return kernel @ values
+    
+    def solar_generation_profile(
+        self,
+        years: np.ndarray,
+        solar_additions,
+        existing_mw: float = 0.0,
+        existing_install_year: int = None,
+        ambient_temp_c: float = None,
+        ghi_kwh_m2_day: float = None,
+    ) -> np.ndarray:
+        """
+        Vintaged solar generation (GWh) for every year in `years` at once.
+        
+        Array counterpart of solar_generation_vintaged(): each cohort degrades
+        from its own install year (C8), temperature derating (C7) is applied
+        once, and the cohort sum runs through vintage_sum().
+        
+        Args:
+            years: Years to evaluate
+            solar_additions: Dict {install_year: mw_added}, or an array of
+                             additions aligned with `years`
+            existing_mw: Pre-existing capacity (installed before base_year)
+            existing_install_year: When existing capacity was installed
+                                   (defaults to base_year)
+            ambient_temp_c: Annual average ambient temperature (°C)
+            ghi_kwh_m2_day: Average daily GHI in kWh/m²/day
+        
+        Returns:
+            Array of annual generation in GWh
+        """
+        years = np.asarray(years)
         if existing_install_year is None:
             existing_install_year = self.config.base_year
         
-        total_gwh = 0.0
+        if isinstance(solar_additions, dict):
+            install_years = np.fromiter(solar_additions.keys(), dtype=float)
+            mw_added = np.fromiter(solar_additions.values(), dtype=float)
+        else:
+            install_years = years
+            mw_added = np.asarray(solar_additions, dtype=float)
+        built = mw_added > 0
         
-        # Generation from pre-existing capacity
+        retention = 1.0 - self.tech.solar_pv_degradation
+        capacity_mw = self.vintage_sum(install_years[built], mw_added[built], years, retention)
         if existing_mw > 0:
-            total_gwh += self.solar_generation(
-                existing_mw, year=year, install_year=existing_install_year,
-                ambient_temp_c=ambient_temp_c, ghi_kwh_m2_day=ghi_kwh_m2_day,
-            )
-        
-        # Generation from each vintage of new additions
-        for install_yr, mw_added in solar_additions.items():
-            if mw_added > 0 and install_yr <= year:
-                total_gwh += self.solar_generation(
-                    mw_added, year=year, install_year=install_yr,
-                    ambient_temp_c=ambient_temp_c,
-                    ghi_kwh_m2_day=ghi_kwh_m2_day,
-                )
+            capacity_mw = capacity_mw + existing_mw * retention ** np.maximum(0, years - existing_install_year)
         
-        return total_gwh
+        gwh_per_mw = 8760 * self.tech.solar_pv_capacity_factor * self.solar_temp_derating(
+            ambient_temp_c, ghi_kwh_m2_day
+        ) / 1000
+        return capacity_mw * gwh_per_mw
     
     def solar_generation_climate_adjusted(
         self,
@@ -792,6 +897,78 @@ class CostCalculator:
     # Last-mile costs are covered by connection_cost_per_household ($200/HH).
     # See CBA_METHODOLOGY.md §13.4 and IMPROVEMENT_PLAN.md L25.
     
+    # =========================================================================
+    # WHOLE-HORIZON ARRAYS (BaseScenario.run_vectorized)
+    # =========================================================================
+    # solar_capex, battery_capex, solar_opex (without vintages), battery_opex,
+    # diesel_gen_capex/opex and connection_capex are elementwise already and
+    # accept arrays as-is. The methods below cover the ones that branch on
+    # scalar values.
+    
+    def loss_factor_array(
+        self,
+        years: np.ndarray,
+        scenario_growth_rate: float,
+        include_hvdc=False,
+    ) -> np.ndarray:
+        """
+        Gross-up factor of gross_up_for_losses() for each year (C2 + R5).
+        
+        Args:
+            years: Calendar years
+            scenario_growth_rate: Passed to weighted_distribution_loss()
+            include_hvdc: Bool, or bool array per year (cable operational)
+        
+        Returns:
+            Array of factors such that gross = net × factor
+        """
+        dist_loss = np.array([
+            self.config.weighted_distribution_loss(year, scenario_growth_rate)
+            for year in np.asarray(years).tolist()
+        ])
+        factor = 1.0 / (1.0 - dist_loss)
+        factor = np.where(include_hvdc, factor / (1.0 - self.tech.hvdc_cable_loss_pct), factor)
+        
+        if np.any(factor > 10.0):
+            raise ValueError(f"Implausible gross-up factor {factor.max():.2f} — check loss params")
+        
+        return factor
+    
+    def diesel_fuel_cost_array(
+        self,
+        generation_gwh: np.ndarray,
+        years: np.ndarray,
+        diesel_capacity_mw: np.ndarray,
+    ) -> np.ndarray:
+        """
+        diesel_fuel_cost() for each year (C9 two-part curve, elementwise).
+        
+        Years with zero diesel capacity fall back to the flat weighted
+        efficiency, as in diesel_fuel_consumption().
+        """
+        generation_kwh = np.asarray(generation_gwh, dtype=float) * 1_000_000
+        capacity_kw = np.asarray(diesel_capacity_mw, dtype=float) * 1000
+        idle_coeff = self.config.dispatch.fuel_curve_idle_coeff
+        prop_coeff = self.config.dispatch.fuel_curve_proportional_coeff
+        avg_load = (self.config.dispatch.diesel_min_load_fraction + 1.0) / 2
+        
+        running = (capacity_kw > 0) & (generation_kwh > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hours = np.where(running, np.minimum(8760, generation_kwh / (capacity_kw * avg_load)), 0)
+        two_part = capacity_kw * idle_coeff * hours + generation_kwh * prop_coeff
+        flat = generation_kwh / self.config.weighted_diesel_efficiency(2026)
+        liters_needed = np.where(capacity_kw > 0, two_part, flat)
+        
+        return liters_needed * self.fuel.get_price(np.asarray(years))
+    
+    def ppa_cost_array(self, import_gwh: np.ndarray, years: np.ndarray) -> np.ndarray:
+        """ppa_cost() for each year; zero before the cable is online."""
+        years = np.asarray(years)
+        online = years >= self.config.one_grid.cable_online_year
+        price_per_kwh = np.zeros(len(years))
+        price_per_kwh[online] = [self.ppa.get_price(year) for year in years[online].tolist()]
+        return np.asarray(import_gwh, dtype=float) * 1_000_000 * price_per_kwh
+    
     # =========================================================================
     # LCOE CALCULATION
     # =========================================================================
@@ -21,12 +21,27 @@ DEMAND SCOPE (R7):
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 from .config import Config, get_config
 
 
+def round_elementwise(values, ndigits: int = 1):
+    """
+    Built-in round() applied element by element.
+    
+    np.round scales by 10**ndigits before rounding, so values sitting on a
+    .x5 boundary can land on the other side of the one the year loop's
+    round() picks (862.6 instead of 862.5). The vectorised kernels use
+    this instead so run_vectorized() reproduces run() exactly.
+    """
+    arr = np.asarray(values, dtype=float)
+    out = np.fromiter((round(v, ndigits) for v in arr.ravel().tolist()),
+                      dtype=float, count=arr.size).reshape(arr.shape)
+    return out[()] if out.ndim == 0 else out
+
+
 @dataclass
 class DemandProjection:
     """Container for demand projection results."""
@@ -166,6 +181,29 @@ class DemandProjector:
         self._projection_cache[year] = projection
         return projection
     
+    def project_years(self, years) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Whole-horizon project_year(): (demand_gwh, peak_demand_mw) arrays.
+        
+        Same compound growth, per-capita saturation ceiling (A-M-01) and
+        rounding as project_year(), evaluated for all years at once.
+        """
+        years = np.asarray(years)
+        if len(years) and years.min() < self.config.base_year:
+            raise ValueError(f"Year {years.min()} is before base year {self.config.base_year}")
+        years_elapsed = years - self.config.base_year
+        
+        demand_gwh = self.base_demand * (1 + self.growth_rate) ** years_elapsed
+        
+        sat_ceiling = self.config.demand.demand_saturation_kwh_per_capita
+        pop_base = self.config.current_system.population_2026
+        pop_growth = self.config.current_system.population_growth_rate
+        population = pop_base * ((1 + pop_growth) ** years_elapsed)
+        demand_gwh = np.minimum(demand_gwh, sat_ceiling * population / 1e6)
+        
+        peak_demand_mw = (demand_gwh * 1000) / (8760 * self.load_factor)
+        return round_elementwise(demand_gwh, 1), round_elementwise(peak_demand_mw, 1)
+    
     def get_demand(self, year: int) -> float:
         """Get demand in GWh for a specific year."""
         return self.project_year(year).demand_gwh
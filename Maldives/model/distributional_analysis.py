@@ -24,7 +24,10 @@ Date: 2025
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import hashlib
+import inspect
 import json
+import os
 import warnings
 
 import numpy as np
@@ -35,6 +38,12 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+try:
+    import pyarrow  # noqa: F401 — enables the Parquet HIES frame cache
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 from model.config import Config, get_config
 
 
@@ -85,21 +94,81 @@ def _weighted_qcut(values: np.ndarray, weights: np.ndarray, n_quantiles: int) ->
         Integer array of quantile labels (1-based)
     """
     sorted_indices = np.argsort(values)
-    sorted_weights = weights[sorted_indices]
-    cumulative_weight = np.cumsum(sorted_weights)
-    total_weight = cumulative_weight[-1]
+    cumulative_weight = np.cumsum(weights[sorted_indices])
+    share = cumulative_weight / cumulative_weight[-1]
     
-    # Assign each observation to a quantile based on weighted cumulative share
+    # Quantile 1 = bottom 20%, ..., quantile n = top 20%
     labels = np.empty(len(values), dtype=int)
-    for i, idx in enumerate(sorted_indices):
-        share = cumulative_weight[i] / total_weight
-        # Quantile 1 = bottom 20%, ..., quantile n = top 20%
-        q = min(int(share * n_quantiles) + 1, n_quantiles)
-        labels[idx] = q
+    labels[sorted_indices] = np.minimum((share * n_quantiles).astype(int) + 1, n_quantiles)
     
     return labels
 
 
+def _weighted_group_stats(
+    df: pd.DataFrame,
+    by: List[str],
+    mean: Tuple[str, ...] = (),
+    median: Tuple[str, ...] = (),
+    share: Tuple[str, ...] = (),
+    where: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    Survey-weighted statistics for every group of `by`, in one pass.
+    
+    Rows are assigned a group code once; sums are then np.bincount
+    reductions and medians come from a single sort by (group, value),
+    so the cost does not grow with the number of groups.
+    
+    Args:
+        df: Household frame (weights in 'wgt')
+        by: Grouping columns (rows with a missing key are dropped)
+        mean: Columns to average → column <name>
+        median: Columns for the weighted median (as _weighted_median) → <name>_median
+        share: Boolean columns → <name>_share, weighted % of the group where True
+        where: Optional boolean row filter applied before grouping
+    
+    Returns:
+        DataFrame indexed by the sorted group keys, with 'n' (households),
+        'wgt' (sum of weights) and the requested statistics
+    """
+    by = list(by)
+    rows = df[by].notna().all(axis=1).to_numpy()
+    if where is not None:
+        rows = rows & np.asarray(where, dtype=bool)
+    sub = df[rows]
+    grouped = sub.groupby(by, sort=True)
+    codes = grouped.ngroup().to_numpy()
+    n = grouped.size()
+    n_groups = len(n)
+    
+    w = sub['wgt'].to_numpy(dtype=float)
+    wsum = np.bincount(codes, weights=w, minlength=n_groups)
+    stats = {'n': n.to_numpy(), 'wgt': wsum}
+    
+    def _per_weight(totals):
+        return np.divide(totals, wsum, out=np.zeros(n_groups), where=wsum > 0)
+    
+    for col in mean:
+        x = sub[col].to_numpy(dtype=float)
+        stats[col] = _per_weight(np.bincount(codes, weights=w * x, minlength=n_groups))
+    for col in share:
+        flag = sub[col].to_numpy(dtype=bool)
+        stats[f'{col}_share'] = _per_weight(np.bincount(codes, weights=w * flag, minlength=n_groups)) * 100
+    if median:
+        ends = np.cumsum(stats['n'])
+        starts = ends - stats['n']
+    for col in median:
+        x = sub[col].to_numpy(dtype=float)
+        order = np.lexsort((x, codes))
+        cumulative_weight = np.cumsum(w[order])
+        before = np.where(starts > 0, cumulative_weight[np.maximum(starts - 1, 0)], 0.0)
+        idx = np.searchsorted(cumulative_weight, before + wsum / 2.0)
+        idx = np.clip(idx, starts, ends - 1)
+        stats[f'{col}_median'] = x[order][idx]
+    
+    return pd.DataFrame(stats, index=n.index)
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -209,9 +278,15 @@ class DistributionalResults:
     concentration_coefficient: float  # Electricity expenditure concentration
     suits_index_by_scenario: Dict[str, float]  # Suits index for tariff change
 
+    # Sampling uncertainty (survey bootstrap): statistic → {estimate, se, ci_low, ci_high}
+    sampling_uncertainty: Optional[Dict[str, Dict[str, float]]] = None
+
+    # Time-dynamic burden and poverty series (run_household_microsimulation)
+    microsimulation: Optional[dict] = None
+
     def to_dict(self) -> dict:
         """Convert to JSON-serialisable dict."""
-        return {
+        d = {
             "baseline": {
                 "national_mean_elec_share_pct": round(self.national_mean_elec_share_pct, 2),
                 "national_mean_energy_share_pct": round(self.national_mean_energy_share_pct, 2),
@@ -341,13 +416,53 @@ class DistributionalResults:
                 "tariff_simulation": "Proportional LCOE change applied to baseline electricity bill",
             },
         }
+        if self.sampling_uncertainty is not None:
+            d["sampling_uncertainty"] = {
+                stat: {k: round(v, 4) if isinstance(v, float) else v for k, v in entry.items()}
+                for stat, entry in self.sampling_uncertainty.items()
+            }
+        if self.microsimulation is not None:
+            d["microsimulation"] = self.microsimulation
+        return d
 
 
 # =============================================================================
 # HIES DATA LOADING
 # =============================================================================
 
-def _load_hies_data(config: Config) -> pd.DataFrame:
+HIES_DIR = Path(__file__).parent.parent / "data" / "hies2019" / "Dataset" / "HIES2019_STATA format"
+HIES_CACHE_DIR = Path(__file__).parent.parent / "data" / "hies2019" / "cache"
+
+# Source files of the merged household frame (Usualmembers.dta is optional)
+HIES_SOURCE_FILES = ("master_exp.dta", "CombinedIncome_HHLevel.dta", "hhlevel.dta", "Usualmembers.dta")
+
+# Columns read by run_distributional_analysis(). The cached frame keeps every
+# merged column; analysis runs load only these.
+HIES_ANALYSIS_COLUMNS = (
+    'uqhh__id', 'atoll_code', 'atoll', 'maleatoll', 'geo', 'wgt',
+    'totalIncome', 'hhsize', 'pce', 'exp_quintile',
+    'elec_annual', 'elec_monthly', 'gas_annual', 'kerosene_annual', 'energy_annual',
+    'total_annual_exp', 'total_monthly_exp', 'elec_share', 'energy_share',
+    'has_elec', 'has_solar', 'head_sex', 'female_headed',
+)
+
+
+def _load_hies_data(config: Config, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load the merged HIES 2019 household frame for distributional analysis.
+    
+    Served from the columnar cache in HIES_CACHE_DIR when it matches the
+    source files; otherwise the .dta files are merged (_build_hies_frame)
+    and the cache is rebuilt.
+    
+    Args:
+        config: Model configuration
+        columns: Columns to load (default: all)
+    """
+    return load_hies_frame(columns)
+
+
+def _build_hies_frame(base: Path = HIES_DIR) -> pd.DataFrame:
     """
     Load and merge HIES 2019 microdata for distributional analysis.
     
@@ -362,8 +477,6 @@ def _load_hies_data(config: Config) -> pd.DataFrame:
     - pce, exp_quintile: per-capita expenditure and quintile
     - has_solar: whether HH uses solar (hh_usnslr == 1)
     """
-    base = Path(__file__).parent.parent / "data" / "hies2019" / "Dataset" / "HIES2019_STATA format"
-    
     if not base.exists():
         raise FileNotFoundError(
             f"HIES 2019 STATA data not found at {base}. "
@@ -472,76 +585,262 @@ def _load_hies_data(config: Config) -> pd.DataFrame:
     return m
 
 
+# =============================================================================
+# HIES FRAME CACHE
+# =============================================================================
+# The merged frame is written once to a typed columnar store and reloaded
+# column-by-column on later runs, skipping pd.read_stata and the merges.
+# Parquet is used when pyarrow is installed; otherwise each column is a
+# member of an uncompressed .npz, which np.load reads lazily.
+#
+# The cache is keyed on the sha256 of every source file plus the source of
+# the merge code. A manifest keeps each file's (size, mtime) next to its
+# hash so unchanged files are not re-hashed on every load.
+
+_HIES_MANIFEST = "hies_frame.json"
+_NA_SUFFIX = "__na"
+
+
+def _hies_build_code() -> str:
+    """Source of the code that derives the cached frame."""
+    return inspect.getsource(_build_hies_frame) + inspect.getsource(_weighted_qcut)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hies_source_hashes(base: Path, known: Optional[Dict[str, list]] = None) -> Dict[str, list]:
+    """[size, mtime_ns, sha256] per source file, re-hashing only files whose stat changed."""
+    known = known or {}
+    sources = {}
+    for name in HIES_SOURCE_FILES:
+        path = base / name
+        if not path.exists():
+            sources[name] = None
+            continue
+        st = path.stat()
+        entry = known.get(name)
+        if entry is not None and entry[:2] == [st.st_size, st.st_mtime_ns]:
+            sources[name] = entry
+        else:
+            sources[name] = [st.st_size, st.st_mtime_ns, _file_sha256(path)]
+    return sources
+
+
+def _hies_cache_key(sources: Dict[str, list]) -> str:
+    digest = hashlib.sha256(_hies_build_code().encode())
+    for name in HIES_SOURCE_FILES:
+        entry = sources[name]
+        digest.update(f"|{name}:{entry[2] if entry else '-'}".encode())
+    return digest.hexdigest()
+
+
+def _read_hies_manifest(cache_dir: Path) -> Optional[dict]:
+    path = cache_dir / _HIES_MANIFEST
+    if not path.exists():
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _column_arrays(name: str, series: pd.Series) -> Dict[str, np.ndarray]:
+    """Typed numpy arrays for one column (object columns get an NA mask)."""
+    if series.dtype.kind in "biufM":
+        return {name: series.to_numpy()}
+    values = series.astype(object)
+    missing = values.isna().to_numpy()
+    if not missing.any() and pd.api.types.infer_dtype(values) == "boolean":
+        return {name: values.to_numpy(dtype=bool)}
+    arrays = {name: values.where(~missing, "").astype(str).to_numpy(dtype=str)}
+    if missing.any():
+        arrays[name + _NA_SUFFIX] = missing
+    return arrays
+
+
+def _write_hies_frame(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_name(f"{path.stem}.tmp{os.getpid()}{path.suffix}")
+    if HAS_PYARROW:
+        df.to_parquet(tmp, index=False)
+    else:
+        arrays = {}
+        for col in df.columns:
+            arrays.update(_column_arrays(col, df[col]))
+        np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def _read_hies_frame(path: Path, dtypes: Dict[str, str], columns: List[str]) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    data = {}
+    with np.load(path, allow_pickle=False) as npz:
+        for col in columns:
+            values = npz[col]
+            if col + _NA_SUFFIX in npz.files:
+                values = values.astype(object)
+                values[npz[col + _NA_SUFFIX]] = np.nan
+            data[col] = pd.Series(values).astype(dtypes[col])
+    return pd.DataFrame(data)
+
+
+def build_hies_cache(
+    base: Path = HIES_DIR,
+    cache_dir: Path = HIES_CACHE_DIR,
+    force: bool = False,
+) -> Path:
+    """
+    Merge the HIES 2019 .dta files and write the frame to the columnar cache.
+    
+    A no-op when the cache already matches the source files (unless force).
+    
+    Returns:
+        Path of the cached frame
+    """
+    if not HAS_PANDAS:
+        raise ImportError("pandas is required for distributional analysis. Install with: pip install pandas")
+    base, cache_dir = Path(base), Path(cache_dir)
+    manifest = _read_hies_manifest(cache_dir)
+    sources = _hies_source_hashes(base, manifest["sources"] if manifest else None)
+    key = _hies_cache_key(sources)
+    if manifest is not None and not force and manifest["key"] == key:
+        path = cache_dir / manifest["file"]
+        if path.exists():
+            return path
+    
+    df = _build_hies_frame(base)
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"hies_frame-{key[:16]}{'.parquet' if HAS_PYARROW else '.npz'}"
+    _write_hies_frame(df, path)
+    manifest_path = cache_dir / _HIES_MANIFEST
+    if manifest is not None and manifest.get("file") != path.name:
+        (cache_dir / manifest["file"]).unlink(missing_ok=True)
+    tmp = manifest_path.with_suffix(f".tmp{os.getpid()}")
+    with open(tmp, "w") as f:
+        json.dump({
+            "key": key,
+            "file": path.name,
+            "sources": sources,
+            "n_households": len(df),
+            "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
+        }, f, indent=2)
+    os.replace(tmp, manifest_path)
+    return path
+
+
+def load_hies_frame(
+    columns: Optional[List[str]] = None,
+    base: Path = HIES_DIR,
+    cache_dir: Path = HIES_CACHE_DIR,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    Merged HIES 2019 household frame, read from the columnar cache.
+    
+    Args:
+        columns: Columns to load (default: all). Only these are read from disk.
+        base: Directory of the HIES 2019 .dta files
+        cache_dir: Cache directory (rebuilt when stale)
+        use_cache: False to merge from the .dta files without touching the cache
+    
+    Returns:
+        DataFrame with one row per household
+    """
+    if not use_cache:
+        df = _build_hies_frame(Path(base))
+        return df if columns is None else df[list(columns)]
+    path = build_hies_cache(base, cache_dir)
+    dtypes = _read_hies_manifest(Path(cache_dir))["dtypes"]
+    columns = list(dtypes) if columns is None else list(columns)
+    missing = [col for col in columns if col not in dtypes]
+    if missing:
+        raise KeyError(f"Columns not in the HIES frame: {missing}")
+    return _read_hies_frame(path, dtypes, columns)
+
+
 # =============================================================================
 # BASELINE PROFILE COMPUTATION
 # =============================================================================
 
+# Weighted means over all households in a quintile profile
+_QUINTILE_MEANS = ('elec_share', 'energy_share', 'total_monthly_exp', 'totalIncome')
+
+
+def _quintile_stats(
+    df: pd.DataFrame,
+    by: Tuple[str, ...] = (),
+    quintile_col: str = 'exp_quintile',
+) -> pd.DataFrame:
+    """Weighted quintile statistics (grouped by `by` first), plus bill stats among electrified HH."""
+    keys = [*by, quintile_col]
+    stats = _weighted_group_stats(df, keys, mean=_QUINTILE_MEANS)
+    bills = _weighted_group_stats(
+        df, keys, mean=('elec_monthly',), median=('elec_monthly',), where=df['has_elec'],
+    )
+    bills = bills[['n', 'elec_monthly', 'elec_monthly_median']].rename(columns={'n': 'n_elec'})
+    return stats.join(bills, how='left').fillna({col: 0 for col in bills.columns})
+
+
+def _quintile_profiles_from_stats(stats: pd.DataFrame) -> List[QuintileProfile]:
+    """QuintileProfile for Q1..Qn from _quintile_stats() rows (empty quintiles are zero)."""
+    stats = stats.reindex(range(1, N_QUINTILES + 1), fill_value=0)
+    return [
+        QuintileProfile(
+            quintile=q,
+            n_households=int(row.n),
+            n_with_electricity=int(row.n_elec),
+            mean_monthly_bill_mvr=row.elec_monthly,
+            # G-MO-01 fix: weighted median instead of unweighted pandas .median()
+            median_monthly_bill_mvr=row.elec_monthly_median,
+            mean_elec_share_pct=row.elec_share,
+            mean_energy_share_pct=row.energy_share,
+            mean_monthly_expenditure_mvr=row.total_monthly_exp,
+            mean_annual_income_mvr=row.totalIncome,
+        )
+        for q, row in zip(stats.index, stats.itertuples(index=False))
+    ]
+
+
 def _compute_quintile_profiles(
     df: pd.DataFrame,
     quintile_col: str = 'exp_quintile'
 ) -> List[QuintileProfile]:
     """Compute weighted electricity expenditure profiles by quintile."""
-    profiles = []
-    for q in range(1, N_QUINTILES + 1):
-        sub = df[df[quintile_col] == q]
-        sub_e = sub[sub['has_elec']]
-        wgt = sub['wgt']
-        
-        # Weighted means
-        w_elec_share = np.average(sub['elec_share'], weights=wgt) if len(sub) > 0 else 0
-        w_energy_share = np.average(sub['energy_share'], weights=wgt) if len(sub) > 0 else 0
-        w_monthly_exp = np.average(sub['total_monthly_exp'], weights=wgt) if len(sub) > 0 else 0
-        w_income = np.average(sub['totalIncome'], weights=wgt) if len(sub) > 0 else 0
-        
-        # Bill stats (among those with electricity)
-        if len(sub_e) > 0:
-            w_bill = np.average(sub_e['elec_monthly'], weights=sub_e['wgt'])
-            # G-MO-01 fix: Use weighted median instead of unweighted pandas .median()
-            med_bill = _weighted_median(sub_e['elec_monthly'].values, sub_e['wgt'].values)
-        else:
-            w_bill = 0
-            med_bill = 0
-        
-        profiles.append(QuintileProfile(
-            quintile=q,
-            n_households=len(sub),
-            n_with_electricity=len(sub_e),
-            mean_monthly_bill_mvr=w_bill,
-            median_monthly_bill_mvr=med_bill,
-            mean_elec_share_pct=w_elec_share,
-            mean_energy_share_pct=w_energy_share,
-            mean_monthly_expenditure_mvr=w_monthly_exp,
-            mean_annual_income_mvr=w_income,
-        ))
-    
-    return profiles
+    return _quintile_profiles_from_stats(_quintile_stats(df, quintile_col=quintile_col))
 
 
-def _compute_geo_profile(
-    df: pd.DataFrame,
-    geo_value: str,
-) -> GeoProfile:
-    """Compute weighted profile for a geography (Malé or Atoll)."""
-    sub = df[df['geo'] == geo_value]
-    sub_e = sub[sub['has_elec']]
-    wgt = sub['wgt']
-    
-    w_elec_share = np.average(sub['elec_share'], weights=wgt) if len(sub) > 0 else 0
-    w_bill = np.average(sub_e['elec_monthly'], weights=sub_e['wgt']) if len(sub_e) > 0 else 0
-    w_income = np.average(sub['totalIncome'], weights=wgt) if len(sub) > 0 else 0
-    
-    # Quintile profiles within this geography
-    quintile_profiles = _compute_quintile_profiles(sub)
-    
-    return GeoProfile(
-        geography=geo_value,
-        n_households=len(sub),
-        n_with_electricity=len(sub_e),
-        mean_monthly_bill_mvr=w_bill,
-        mean_elec_share_pct=w_elec_share,
-        mean_annual_income_mvr=w_income,
-        quintile_profiles=quintile_profiles,
-    )
+def _compute_geo_profiles(df: pd.DataFrame) -> Dict[str, GeoProfile]:
+    """Compute weighted profiles for Malé and the Atolls (with quintiles within each)."""
+    stats = _weighted_group_stats(df, ['geo'], mean=('elec_share', 'totalIncome'))
+    bills = _weighted_group_stats(df, ['geo'], mean=('elec_monthly',), where=df['has_elec'])
+    quintiles = _quintile_stats(df, by=('geo',))
+    
+    profiles = {}
+    for geo_value in ['Male', 'Atoll']:
+        row = stats.reindex([geo_value], fill_value=0).iloc[0]
+        bill = bills.reindex([geo_value], fill_value=0).iloc[0]
+        if geo_value in quintiles.index.get_level_values(0):
+            geo_quintiles = quintiles.xs(geo_value, level=0)
+        else:
+            geo_quintiles = quintiles.iloc[:0].droplevel(0)
+        profiles[geo_value] = GeoProfile(
+            geography=geo_value,
+            n_households=int(row['n']),
+            n_with_electricity=int(bill['n']),
+            mean_monthly_bill_mvr=bill['elec_monthly'],
+            mean_elec_share_pct=row['elec_share'],
+            mean_annual_income_mvr=row['totalIncome'],
+            quintile_profiles=_quintile_profiles_from_stats(geo_quintiles),
+        )
+    return profiles
 
 
 def _compute_atoll_profiles(df: pd.DataFrame) -> List[AtollProfile]:
@@ -570,25 +869,25 @@ def _compute_atoll_profiles(df: pd.DataFrame) -> List[AtollProfile]:
         39: 5.7,    # S (Addu/Seenu)
     }
     
-    profiles = []
-    for code in sorted(df['atoll_code'].dropna().unique()):
-        sub = df[(df['atoll_code'] == code) & (df['has_elec'])]
-        if len(sub) < 10:  # Skip atolls with too few observations
-            continue
-        
-        w_share = np.average(sub['elec_share'], weights=sub['wgt'])
-        w_bill = np.average(sub['elec_monthly'], weights=sub['wgt'])
-        w_inc = np.average(sub['totalIncome'], weights=sub['wgt'])
-        
-        profiles.append(AtollProfile(
+    has_elec = df['has_elec'].to_numpy(dtype=bool)
+    stats = _weighted_group_stats(
+        df, ['atoll_code'], mean=('elec_share', 'elec_monthly', 'totalIncome'), where=has_elec,
+    )
+    stats = stats[stats['n'] >= 10]  # Skip atolls with too few observations
+    names = df[has_elec].drop_duplicates('atoll_code').set_index('atoll_code')['atoll']
+    
+    profiles = [
+        AtollProfile(
             atoll_code=int(code),
-            atoll_name=str(sub['atoll'].iloc[0]),
-            n_households=len(sub),
-            mean_elec_share_pct=w_share,
-            mean_monthly_bill_mvr=w_bill,
-            mean_annual_income_mvr=w_inc,
+            atoll_name=str(names[code]),
+            n_households=int(row.n),
+            mean_elec_share_pct=row.elec_share,
+            mean_monthly_bill_mvr=row.elec_monthly,
+            mean_annual_income_mvr=row.totalIncome,
             poverty_rate_pct=POVERTY_RATES.get(int(code)),
-        ))
+        )
+        for code, row in zip(stats.index, stats.itertuples(index=False))
+    ]
     
     # Sort by electricity burden (highest first)
     profiles.sort(key=lambda x: x.mean_elec_share_pct, reverse=True)
@@ -613,154 +912,70 @@ def _compute_gender_profiles(df: pd.DataFrame) -> List[GenderProfile]:
     if 'female_headed' not in df.columns or df['head_sex'].sum() == 0:
         return []
     
+    # Energy poverty uses the >10% threshold; solar adoption is weighted (G-MO-03 fix)
+    stats = _weighted_group_stats(
+        df.assign(energy_poor=df['energy_share'] > 10.0), ['female_headed'],
+        mean=('elec_share', 'energy_share', 'totalIncome'), share=('energy_poor', 'has_solar'),
+    )
+    bills = _weighted_group_stats(df, ['female_headed'], mean=('elec_monthly',), where=df['has_elec'])
+    quintile_shares = _weighted_group_stats(df, ['female_headed', 'exp_quintile'], mean=('elec_share',))
+    total_wgt = df['wgt'].sum()
+    
     profiles = []
     for is_female, label in [(False, 'male_headed'), (True, 'female_headed')]:
-        sub = df[df['female_headed'] == is_female]
-        if len(sub) == 0:
+        if is_female not in stats.index:
             continue
-        
-        wgt = sub['wgt']
-        sub_e = sub[sub['has_elec']]
-        total_n = len(df)
-        
-        # Weighted means
-        w_bill = np.average(sub_e['elec_monthly'], weights=sub_e['wgt']) if len(sub_e) > 0 else 0
-        w_elec_share = np.average(sub['elec_share'], weights=wgt) if len(sub) > 0 else 0
-        w_energy_share = np.average(sub['energy_share'], weights=wgt) if len(sub) > 0 else 0
-        w_income = np.average(sub['totalIncome'], weights=wgt) if len(sub) > 0 else 0
-        
-        # Energy poverty (>10% threshold, weighted)
-        poor = sub['energy_share'] > 10.0
-        total_weight = wgt.sum()
-        poor_weight = sub.loc[poor, 'wgt'].sum()
-        ep_pct = (poor_weight / total_weight * 100) if total_weight > 0 else 0
-        
-        # Solar adoption (G-MO-03 fix: use survey weights)
-        solar_pct = (sub.loc[sub['has_solar'], 'wgt'].sum() / wgt.sum() * 100) if wgt.sum() > 0 else 0
+        row = stats.loc[is_female]
+        bill = bills['elec_monthly'].get(is_female, 0)
         
         # Quintile-level electricity shares within this gender group
-        q_shares = []
-        for q in range(1, N_QUINTILES + 1):
-            sq = sub[sub['exp_quintile'] == q]
-            if len(sq) > 0:
-                q_shares.append(float(np.average(sq['elec_share'], weights=sq['wgt'])))
-            else:
-                q_shares.append(0.0)
+        q_shares = quintile_shares.loc[is_female, 'elec_share'].reindex(range(1, N_QUINTILES + 1), fill_value=0.0)
         
         profiles.append(GenderProfile(
             gender=label,
-            n_households=len(sub),
+            n_households=int(row['n']),
             # G-LO-01 fix: use survey weights for population share
-            share_of_total_pct=(wgt.sum() / df['wgt'].sum() * 100) if df['wgt'].sum() > 0 else 0,
-            mean_monthly_bill_mvr=w_bill,
-            mean_elec_share_pct=w_elec_share,
-            mean_energy_share_pct=w_energy_share,
-            mean_annual_income_mvr=w_income,
-            energy_poverty_pct=ep_pct,
-            has_solar_pct=solar_pct,
-            quintile_elec_shares=q_shares,
+            share_of_total_pct=(row['wgt'] / total_wgt * 100) if total_wgt > 0 else 0,
+            mean_monthly_bill_mvr=bill,
+            mean_elec_share_pct=row['elec_share'],
+            mean_energy_share_pct=row['energy_share'],
+            mean_annual_income_mvr=row['totalIncome'],
+            energy_poverty_pct=row['energy_poor_share'],
+            has_solar_pct=row['has_solar_share'],
+            quintile_elec_shares=[float(v) for v in q_shares],
         ))
     
     return profiles
 
 
-def _simulate_gender_tariff_impacts(
-    df: pd.DataFrame,
-    scenario_lcoes: Dict[str, float],
-    bau_lcoe: float,
-) -> Dict[str, Dict[str, float]]:
-    """
-    Simulate electricity burden change by gender of household head under 
-    each scenario's LCOE.
-    
-    Returns: {scenario: {male_headed: new_share%, female_headed: new_share%}}
-    """
-    if 'female_headed' not in df.columns or df['head_sex'].sum() == 0:
-        return {}
-    
-    results = {}
-    for scenario, lcoe in scenario_lcoes.items():
-        if scenario == 'bau':
-            continue
-        
-        lcoe_ratio = lcoe / bau_lcoe if bau_lcoe > 0 else 1.0
-        
-        gender_impacts = {}
-        for is_female, label in [(False, 'male_headed'), (True, 'female_headed')]:
-            sub = df[(df['female_headed'] == is_female) & (df['has_elec'])]
-            if len(sub) == 0:
-                gender_impacts[label] = 0.0
-                continue
-            
-            w_bill = np.average(sub['elec_monthly'], weights=sub['wgt'])
-            w_total = np.average(sub['total_monthly_exp'], weights=sub['wgt'])
-            new_bill = w_bill * lcoe_ratio
-            new_share = (new_bill / w_total * 100) if w_total > 0 else 0
-            gender_impacts[label] = new_share
-        
-        results[scenario] = gender_impacts
-    
-    return results
-
+# =============================================================================
+# ENERGY POVERTY ANALYSIS
+# =============================================================================
 
-def _simulate_gender_energy_poverty(
+def _compute_energy_poverty(
     df: pd.DataFrame,
-    scenario_lcoes: Dict[str, float],
-    bau_lcoe: float,
     threshold_pct: float = 10.0,
-) -> Dict[str, Dict[str, float]]:
+) -> float:
     """
-    Simulate energy poverty headcount by gender under each scenario's LCOE.
+    Compute energy poverty headcount: share of HH spending >threshold% 
+    of total expenditure on energy (electricity + gas + kerosene).
     
-    Returns: {scenario: {male_headed: poverty%, female_headed: poverty%}}
+    Uses the international "10% rule" (Boardman 1991; Hills 2012).
     """
-    if 'female_headed' not in df.columns or df['head_sex'].sum() == 0:
-        return {}
-    
-    results = {}
-    for scenario, lcoe in scenario_lcoes.items():
-        if scenario == 'bau':
-            continue
-        
-        lcoe_ratio = lcoe / bau_lcoe if bau_lcoe > 0 else 1.0
-        
-        gender_poverty = {}
-        for is_female, label in [(False, 'male_headed'), (True, 'female_headed')]:
-            sub = df[df['female_headed'] == is_female]
-            if len(sub) == 0:
-                gender_poverty[label] = 0.0
-                continue
-            
-            sim_elec = sub['elec_annual'] * lcoe_ratio
-            sim_energy = sim_elec + sub['gas_annual'] + sub['kerosene_annual']
-            sim_share = np.where(
-                sub['total_annual_exp'] > 0,
-                sim_energy / sub['total_annual_exp'] * 100,
-                0
-            )
-            
-            poor = sim_share > threshold_pct
-            total_weight = sub['wgt'].sum()
-            poor_weight = sub.loc[poor, 'wgt'].sum()
-            gender_poverty[label] = (poor_weight / total_weight * 100) if total_weight > 0 else 0
-        
-        results[scenario] = gender_poverty
-    
-    return results
+    poor = df['energy_share'] > threshold_pct
+    # Weighted headcount
+    total_weight = df['wgt'].sum()
+    poor_weight = df.loc[poor, 'wgt'].sum()
+    return (poor_weight / total_weight * 100) if total_weight > 0 else 0
 
 
 # =============================================================================
-# SCENARIO TARIFF IMPACT SIMULATION
+# SCENARIO × HOUSEHOLD IMPACT ENGINE
 # =============================================================================
 
-def _simulate_tariff_impacts(
-    df: pd.DataFrame,
-    scenario_lcoes: Dict[str, float],
-    bau_lcoe: float,
-    config: Config,
-) -> Dict[str, List[TariffImpact]]:
+class TariffImpactEngine:
     """
-    Simulate electricity bill changes under each scenario.
+    Simulated electricity bills for every (scenario, household) pair.
     
     Methodology:
     - LCOE ratio = scenario_LCOE / BAU_LCOE
@@ -770,186 +985,635 @@ def _simulate_tariff_impacts(
     This is a first-order approximation. In reality, tariff structures 
     (block pricing, subsidies) mediate the passthrough, but LCOE ratio
     gives the economic cost change signal.
+    
+    Households are sorted by per-capita expenditure once. The
+    (scenarios × households) bill matrix is the outer product of the
+    LCOE-ratio vector and the baseline bills, evaluated in blocks of
+    `chunk_size` scenarios so that Monte Carlo sets of hundreds of ratio
+    draws stay within a few tens of MB. Impact tables, poverty headcounts
+    and progressivity indices are all reductions of that matrix.
+    
+    Usage:
+        engine = TariffImpactEngine.from_lcoes(df, scenario_lcoes, bau_lcoe)
+        engine.energy_poverty()      # (n_scenarios,) headcount %
+        engine.suits_indices()       # (n_scenarios,)
     """
-    exchange_rate = config.economics.exchange_rate_mvr_usd
     
-    impacts = {}
-    for scenario, lcoe in scenario_lcoes.items():
-        if scenario == 'bau':
-            continue
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        lcoe_ratios: np.ndarray,
+        scenarios: Optional[List[str]] = None,
+        chunk_size: int = 256,
+    ):
+        self.df = df
+        self.ratios = np.asarray(lcoe_ratios, dtype=float).ravel()
+        self.scenarios = list(scenarios) if scenarios is not None else [str(i) for i in range(len(self.ratios))]
+        if len(self.scenarios) != len(self.ratios):
+            raise ValueError(f"{len(self.scenarios)} scenario labels for {len(self.ratios)} LCOE ratios")
+        self.chunk_size = chunk_size
+        
+        # Sort by per-capita expenditure once (NaN last, as DataFrame.sort_values)
+        self.order = np.argsort(df['pce'].to_numpy(dtype=float))
+        
+        def _sorted(col):
+            return df[col].to_numpy(dtype=float)[self.order]
+        
+        self.wgt = _sorted('wgt')
+        self.elec_annual = _sorted('elec_annual')
+        self.elec_monthly = _sorted('elec_monthly')
+        self.gas_annual = _sorted('gas_annual')
+        self.kerosene_annual = _sorted('kerosene_annual')
+        self.total_annual_exp = _sorted('total_annual_exp')
+        self.elec_share = _sorted('elec_share')
+        self.energy_share = _sorted('energy_share')
+        self.has_elec = df['has_elec'].to_numpy(dtype=bool)[self.order]
+        self.exp_quintile = df['exp_quintile'].to_numpy()[self.order]
+        # Weighted fractional rank in the pce distribution
+        self.frac_rank = np.cumsum(self.wgt) / self.wgt.sum()
+        
+        self.has_gender = 'female_headed' in df.columns and df['head_sex'].sum() != 0
+        if self.has_gender:
+            self.female = df['female_headed'].to_numpy(dtype=bool)[self.order]
+    
+    @classmethod
+    def from_lcoes(
+        cls,
+        df: pd.DataFrame,
+        scenario_lcoes: Dict[str, float],
+        bau_lcoe: float,
+        chunk_size: int = 256,
+    ) -> "TariffImpactEngine":
+        """Engine over every non-BAU scenario in scenario_lcoes."""
+        scenarios = [sc for sc in scenario_lcoes if sc != 'bau']
+        ratios = [scenario_lcoes[sc] / bau_lcoe if bau_lcoe > 0 else 1.0 for sc in scenarios]
+        return cls(df, np.array(ratios, dtype=float), scenarios, chunk_size)
+    
+    def _chunks(self):
+        for start in range(0, len(self.ratios), self.chunk_size):
+            yield slice(start, start + self.chunk_size)
+    
+    def bills(self, rows: slice = slice(None)) -> np.ndarray:
+        """Annual electricity bills (scenarios[rows] × households, pce order)."""
+        return self.ratios[rows, None] * self.elec_annual
+    
+    def bill_changes(self, rows: slice = slice(None)) -> np.ndarray:
+        """Annual bill change vs BAU (scenarios[rows] × households, pce order)."""
+        return (self.ratios[rows, None] - 1) * self.elec_annual
+    
+    def _group_weights(self, onehot: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(households × groups) weight matrix for a membership matrix, and group weight totals."""
+        weights = onehot * self.wgt[:, None]
+        return weights, weights.sum(axis=0)
+    
+    def energy_poverty(self, threshold_pct: float = 10.0, by_gender: bool = False) -> np.ndarray:
+        """
+        Energy poverty headcount (% of weighted HH spending >threshold% on
+        energy) per scenario: shape (n_scenarios,), or (n_scenarios, 2) for
+        (male-headed, female-headed) when by_gender.
+        """
+        if by_gender:
+            onehot = np.stack([~self.female, self.female], axis=1)
+        else:
+            onehot = np.ones((len(self.wgt), 1), dtype=bool)
+        weights, totals = self._group_weights(onehot)
+        poor_weight = np.empty((len(self.ratios), weights.shape[1]))
+        has_exp = self.total_annual_exp > 0
+        for rows in self._chunks():
+            sim_energy = self.bills(rows) + self.gas_annual + self.kerosene_annual
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sim_share = np.where(has_exp, sim_energy / self.total_annual_exp * 100, 0)
+            poor_weight[rows] = (sim_share > threshold_pct) @ weights
+        headcount = np.divide(poor_weight * 100, totals, out=np.zeros_like(poor_weight), where=totals > 0)
+        return headcount if by_gender else headcount[:, 0]
+    
+    def quintile_bill_changes(self) -> np.ndarray:
+        """
+        Weighted mean monthly bill change (MVR) of electrified households per
+        expenditure quintile, shape (n_scenarios, N_QUINTILES).
+        """
+        quintiles = np.arange(1, N_QUINTILES + 1)
+        onehot = (self.exp_quintile[:, None] == quintiles) & self.has_elec[:, None]
+        weights, totals = self._group_weights(onehot)
+        change = np.empty((len(self.ratios), N_QUINTILES))
+        for rows in self._chunks():
+            change[rows] = ((self.ratios[rows, None] - 1) * self.elec_monthly) @ weights
+        return np.divide(change, totals, out=np.zeros_like(change), where=totals > 0)
+    
+    def suits_indices(self) -> np.ndarray:
+        """
+        Suits index of the bill change per scenario, shape (n_scenarios,).
+        
+        Suits index measures the progressivity of a tax/tariff change:
+        - S > 0: progressive (rich pay proportionally more)
+        - S = 0: proportional
+        - S < 0: regressive (poor pay proportionally more)
         
-        lcoe_ratio = lcoe / bau_lcoe if bau_lcoe > 0 else 1.0
+        Reference: Suits (1977) "Measurement of Tax Progressivity".
         
-        scenario_impacts = []
-        for geo in ['Male', 'Atoll']:
-            for q in range(1, N_QUINTILES + 1):
-                sub = df[(df['geo'] == geo) & (df['exp_quintile'] == q) & (df['has_elec'])]
-                if len(sub) == 0:
-                    continue
-                
-                w_bill = np.average(sub['elec_monthly'], weights=sub['wgt'])
-                w_share = np.average(sub['elec_share'], weights=sub['wgt'])
-                w_total_monthly = np.average(sub['total_monthly_exp'], weights=sub['wgt'])
-                
-                new_bill = w_bill * lcoe_ratio
-                change = new_bill - w_bill
-                change_pct = (lcoe_ratio - 1) * 100
-                
-                # New electricity share
-                # Monthly total expenditure stays same; only elec bill changes
-                new_share = (new_bill / w_total_monthly * 100) if w_total_monthly > 0 else 0
-                
-                scenario_impacts.append(TariffImpact(
+        For a tariff reduction (scenario LCOE < BAU LCOE), we measure the
+        progressivity of the *benefit* (bill reduction).
+        """
+        # np.trapezoid (NumPy >=2.0) replaces deprecated np.trapz
+        trapz_fn = getattr(np, 'trapezoid', None) or np.trapz
+        suits = np.zeros(len(self.ratios))
+        for rows in self._chunks():
+            change = self.bill_changes(rows)
+            total_change = np.abs((change * self.wgt).sum(axis=1))
+            nonzero = total_change > 0
+            # Lorenz curve of |bill change| against the population rank
+            cum_change = np.cumsum(np.abs(change[nonzero]) * self.wgt, axis=1) / total_change[nonzero, None]
+            area = trapz_fn(cum_change, self.frac_rank, axis=1)
+            suits[rows][nonzero] = 1 - 2 * area
+        return suits
+    
+    def concentration_coefficient(self) -> float:
+        """
+        Concentration coefficient of the baseline electricity share against
+        the per-capita expenditure ranking.
+        
+        CC = 2 × cov(electricity_share, cumulative_pop_rank) / mean(electricity_share)
+        
+        A negative CC means electricity spending is concentrated among the poor
+        (regressive consumption pattern). CC=0 means proportional.
+        
+        Reference: Kakwani (1977); O'Donnell et al. (2008) "Analyzing Health Equity".
+        """
+        mean_share = np.average(self.elec_share, weights=self.wgt)
+        if mean_share == 0:
+            return 0.0
+        cov = np.average(
+            self.elec_share * self.frac_rank, weights=self.wgt
+        ) - mean_share * np.average(self.frac_rank, weights=self.wgt)
+        return 2 * cov / mean_share
+    
+    def tariff_impacts(self) -> Dict[str, List[TariffImpact]]:
+        """
+        Bill change per geography × quintile cell (electrified HH) and scenario.
+        
+        Cell means are linear in the bill, so the new mean bill is the
+        (scenarios × cells) outer product of the LCOE ratios and the
+        baseline cell means.
+        """
+        stats = _weighted_group_stats(
+            self.df, ['geo', 'exp_quintile'],
+            mean=('elec_monthly', 'elec_share', 'total_monthly_exp'), where=self.df['has_elec'],
+        )
+        cells = [
+            (geo, q, stats.loc[(geo, q)])
+            for geo in ['Male', 'Atoll']
+            for q in range(1, N_QUINTILES + 1)
+            if (geo, q) in stats.index
+        ]
+        base_bill = np.array([row['elec_monthly'] for _, _, row in cells])
+        base_total = np.array([row['total_monthly_exp'] for _, _, row in cells])
+        new_bill = self.ratios[:, None] * base_bill
+        # Monthly total expenditure stays same; only elec bill changes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            new_share = np.where(base_total > 0, new_bill / base_total * 100, 0)
+        
+        impacts = {}
+        for s, scenario in enumerate(self.scenarios):
+            impacts[scenario] = [
+                TariffImpact(
                     quintile=q,
                     geography=geo,
-                    baseline_monthly_bill_mvr=w_bill,
-                    new_monthly_bill_mvr=new_bill,
-                    change_mvr=change,
-                    change_pct=change_pct,
-                    baseline_elec_share_pct=w_share,
-                    new_elec_share_pct=new_share,
-                ))
-        
-        impacts[scenario] = scenario_impacts
+                    baseline_monthly_bill_mvr=row['elec_monthly'],
+                    new_monthly_bill_mvr=new_bill[s, c],
+                    change_mvr=new_bill[s, c] - row['elec_monthly'],
+                    change_pct=(self.ratios[s] - 1) * 100,
+                    baseline_elec_share_pct=row['elec_share'],
+                    new_elec_share_pct=new_share[s, c],
+                )
+                for c, (geo, q, row) in enumerate(cells)
+            ]
+        return impacts
+    
+    def gender_tariff_impacts(self) -> Dict[str, Dict[str, float]]:
+        """
+        Electricity burden by gender of household head under each
+        scenario's LCOE: {scenario: {male_headed: new_share%, female_headed: new_share%}}.
+        """
+        if not self.has_gender:
+            return {}
+        bills = _weighted_group_stats(
+            self.df, ['female_headed'], mean=('elec_monthly', 'total_monthly_exp'), where=self.df['has_elec'],
+        ).reindex([False, True], fill_value=0)
+        base_bill = bills['elec_monthly'].to_numpy()
+        base_total = bills['total_monthly_exp'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            new_share = np.where(base_total > 0, self.ratios[:, None] * base_bill / base_total * 100, 0)
+        return {
+            scenario: {'male_headed': new_share[s, 0], 'female_headed': new_share[s, 1]}
+            for s, scenario in enumerate(self.scenarios)
+        }
     
-    return impacts
+    def gender_energy_poverty(self, threshold_pct: float = 10.0) -> Dict[str, Dict[str, float]]:
+        """Energy poverty headcount by gender: {scenario: {male_headed: %, female_headed: %}}."""
+        if not self.has_gender:
+            return {}
+        headcount = self.energy_poverty(threshold_pct, by_gender=True)
+        return {
+            scenario: {'male_headed': headcount[s, 0], 'female_headed': headcount[s, 1]}
+            for s, scenario in enumerate(self.scenarios)
+        }
 
 
 # =============================================================================
-# ENERGY POVERTY ANALYSIS
+# MONTE CARLO PROPAGATION
 # =============================================================================
 
-def _compute_energy_poverty(
-    df: pd.DataFrame,
-    threshold_pct: float = 10.0,
-) -> float:
+MC_LCOE_DRAWS_FILE = "monte_carlo_lcoe_draws.npz"
+
+
+def load_lcoe_draws(path: Path) -> Dict[str, np.ndarray]:
+    """Per-draw scenario LCOEs ($/kWh) saved by run_monte_carlo (one array per scenario)."""
+    with np.load(path, allow_pickle=False) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def run_distributional_monte_carlo(
+    lcoe_draws: Dict[str, np.ndarray],
+    df: Optional[pd.DataFrame] = None,
+    percentiles: Tuple[float, ...] = (5, 50, 95),
+    chunk_size: int = 256,
+) -> dict:
     """
-    Compute energy poverty headcount: share of HH spending >threshold% 
-    of total expenditure on energy (electricity + gas + kerosene).
+    Propagate Monte Carlo LCOE uncertainty into distributional outcomes.
     
-    Uses the international "10% rule" (Boardman 1991; Hills 2012).
+    Each draw's scenario LCOE is divided by the same draw's BAU LCOE, and
+    all (scenario, draw) ratios are evaluated against every household in
+    one TariffImpactEngine. The engine works through `chunk_size` ratios
+    at a time, so memory is bounded by chunk_size × households whatever
+    the number of draws; only summary quantiles are returned.
+    
+    Args:
+        lcoe_draws: {scenario: (n_draws,) LCOEs}, including 'bau'
+        df: HIES household frame (default: _load_hies_data())
+        percentiles: Percentiles reported for every outcome
+        chunk_size: Ratios evaluated per block
+    
+    Returns:
+        Dict with energy-poverty headcount and quintile bill-change
+        quantiles per scenario
     """
-    poor = df['energy_share'] > threshold_pct
-    # Weighted headcount
-    total_weight = df['wgt'].sum()
-    poor_weight = df.loc[poor, 'wgt'].sum()
-    return (poor_weight / total_weight * 100) if total_weight > 0 else 0
+    if not HAS_PANDAS:
+        raise ImportError("pandas is required for distributional analysis. Install with: pip install pandas")
+    if 'bau' not in lcoe_draws:
+        raise KeyError("BAU LCOE draws not found. Ensure 'bau' was recorded by the Monte Carlo run.")
+    if df is None:
+        df = _load_hies_data(get_config(), columns=list(HIES_ANALYSIS_COLUMNS))
+    
+    bau = np.asarray(lcoe_draws['bau'], dtype=float)
+    scenarios = [sc for sc in lcoe_draws if sc != 'bau']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.vstack([
+            np.where(bau > 0, np.asarray(lcoe_draws[sc], dtype=float) / bau, 1.0)
+            for sc in scenarios
+        ])  # (scenarios, draws)
+    
+    engine = TariffImpactEngine(df, ratios.ravel(), chunk_size=chunk_size)
+    poverty = engine.energy_poverty().reshape(ratios.shape)
+    bill_change = engine.quintile_bill_changes().reshape(*ratios.shape, N_QUINTILES)
+    
+    def _summary(values: np.ndarray) -> Dict[str, float]:
+        summary = {"mean": float(values.mean())}
+        for p in percentiles:
+            summary[f"p{p:g}"] = float(np.percentile(values, p))
+        return summary
+    
+    return {
+        "n_draws": int(ratios.shape[1]),
+        "n_households": len(df),
+        "energy_poverty_baseline_pct": float(_compute_energy_poverty(df)),
+        "scenarios": {
+            sc: {
+                "lcoe_ratio": _summary(ratios[s]),
+                "energy_poverty_pct": _summary(poverty[s]),
+                "quintile_bill_change_mvr": {
+                    f"Q{q + 1}": _summary(bill_change[s, :, q]) for q in range(N_QUINTILES)
+                },
+            }
+            for s, sc in enumerate(scenarios)
+        },
+    }
+
+
+def print_distributional_mc_summary(summary: dict) -> None:
+    """Print energy-poverty and Q1 bill-change bands (default P5/P50/P95) per scenario."""
+    print(f"\n--- Distributional Uncertainty ({summary['n_draws']:,} draws) ---")
+    print(f"  Baseline energy poverty: {summary['energy_poverty_baseline_pct']:.1f}%")
+    print(f"{'Scenario':<20} {'Poverty P5':>11} {'P50':>7} {'P95':>7} {'Q1 bill P5':>11} {'P50':>7} {'P95':>7}")
+    for sc, entry in summary["scenarios"].items():
+        pov = entry["energy_poverty_pct"]
+        q1 = entry["quintile_bill_change_mvr"]["Q1"]
+        print(f"  {sc:<18} {pov['p5']:>10.1f}% {pov['p50']:>6.1f}% {pov['p95']:>6.1f}% "
+              f"{q1['p5']:>11.0f} {q1['p50']:>7.0f} {q1['p95']:>7.0f}")
+
+
+def save_distributional_mc_results(summary: dict, output_dir: str) -> None:
+    """Save Monte Carlo distributional quantiles to JSON."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    filepath = output_path / "distributional_mc_results.json"
+    with open(filepath, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(f"  Distributional Monte Carlo results saved to {filepath}")
+
+
+# =============================================================================
+# SAMPLING UNCERTAINTY (SURVEY BOOTSTRAP)
+# =============================================================================
+# Rescaled bootstrap (Rao & Wu 1988) with atolls as strata. The analysis
+# frame carries no PSU identifiers, so households are the resampling units:
+# in each stratum of n_h households, n_h - 1 are drawn with replacement and
+# a household drawn r times gets weight wgt × r × n_h / (n_h - 1).
+# Single-household strata keep their weight. Quintile membership is held at
+# the full-sample assignment.
+#
+# Replicates are generated in fixed blocks, each from its own spawned
+# SeedSequence, so results do not depend on how blocks are spread across
+# worker processes.
+
+BOOTSTRAP_BLOCK = 250  # replicates per block (bounds the (block × households) arrays)
+
+
+def _bootstrap_inputs(engine: TariffImpactEngine, strata: np.ndarray) -> Dict[str, np.ndarray]:
+    """Household arrays (pce order) needed by _replicate_statistics()."""
+    return {
+        "wgt": engine.wgt,
+        "strata": strata,
+        "elec_share": engine.elec_share,
+        "energy_share": engine.energy_share,
+        "exp_quintile": engine.exp_quintile,
+        # (scenarios × households) annual bill change vs BAU
+        "bill_changes": engine.bill_changes(),
+    }
+
+
+def _replicate_weights(wgt: np.ndarray, strata: np.ndarray, n_replicates: int, rng) -> np.ndarray:
+    """(n_replicates × households) rescaled-bootstrap weights."""
+    factors = np.ones((n_replicates, len(wgt)))
+    for stratum in np.unique(strata):
+        members = np.flatnonzero(strata == stratum)
+        n_h = len(members)
+        if n_h < 2:
+            continue
+        draws = rng.integers(0, n_h, size=(n_replicates, n_h - 1))
+        offsets = np.arange(n_replicates)[:, None] * n_h
+        counts = np.bincount((draws + offsets).ravel(), minlength=n_replicates * n_h)
+        factors[:, members] = counts.reshape(n_replicates, n_h) * (n_h / (n_h - 1))
+    return factors * wgt
+
+
+def _replicate_statistics(data: Dict[str, np.ndarray], weights: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Distributional statistics for each row of a (replicates × households)
+    weight matrix (households in pce order). Row r of every output is the
+    statistic under weights[r]; with weights = wgt[None, :] these are the
+    point estimates of run_distributional_analysis().
+    """
+    trapz_fn = getattr(np, 'trapezoid', None) or np.trapz
+    total = weights.sum(axis=1)
+    frac_rank = np.cumsum(weights, axis=1) / total[:, None]
+    elec_share = data["elec_share"]
+
+    stats = {}
+    stats["national_elec_share_pct"] = weights @ elec_share / total
+    stats["energy_poverty_pct"] = weights @ (data["energy_share"] > 10.0) / total * 100
+
+    quintiles = data["exp_quintile"][:, None] == np.arange(1, N_QUINTILES + 1)
+    quintile_wgt = weights @ quintiles
+    stats["quintile_elec_share_pct"] = np.divide(
+        weights @ (quintiles * elec_share[:, None]), quintile_wgt,
+        out=np.zeros_like(quintile_wgt), where=quintile_wgt > 0,
+    )
+
+    # Concentration coefficient: 2 × cov(share, rank) / mean(share)
+    mean_share = stats["national_elec_share_pct"]
+    cov = (weights * frac_rank) @ elec_share / total - mean_share * (weights * frac_rank).sum(axis=1) / total
+    stats["concentration_coefficient"] = np.divide(
+        2 * cov, mean_share, out=np.zeros_like(cov), where=mean_share != 0,
+    )
+
+    # Suits index per scenario: 1 - 2 × area under the Lorenz curve of |bill change|
+    suits = np.zeros((len(weights), len(data["bill_changes"])))
+    for s, change in enumerate(data["bill_changes"]):
+        total_change = np.abs(weights @ change)
+        nonzero = total_change > 0
+        cum_change = np.cumsum(weights[nonzero] * np.abs(change), axis=1) / total_change[nonzero, None]
+        suits[nonzero, s] = 1 - 2 * trapz_fn(cum_change, frac_rank[nonzero], axis=1)
+    stats["suits_index"] = suits
+    return stats
 
 
-def _simulate_energy_poverty_by_scenario(
+def _bootstrap_block(data: Dict[str, np.ndarray], n_replicates: int, seed) -> Dict[str, np.ndarray]:
+    """Statistics for one block of replicates (runs in a worker process when n_jobs > 1)."""
+    rng = np.random.default_rng(seed)
+    weights = _replicate_weights(data["wgt"], data["strata"], n_replicates, rng)
+    return _replicate_statistics(data, weights)
+
+
+def bootstrap_distributional_statistics(
     df: pd.DataFrame,
     scenario_lcoes: Dict[str, float],
     bau_lcoe: float,
-    threshold_pct: float = 10.0,
-) -> Dict[str, float]:
-    """Simulate energy poverty headcount under each scenario's LCOE."""
-    results = {}
-    for scenario, lcoe in scenario_lcoes.items():
-        if scenario == 'bau':
-            continue
-        
-        lcoe_ratio = lcoe / bau_lcoe if bau_lcoe > 0 else 1.0
-        
-        # Simulate new energy expenditure (scale electricity by LCOE ratio)
-        sim_elec = df['elec_annual'] * lcoe_ratio
-        sim_energy = sim_elec + df['gas_annual'] + df['kerosene_annual']
-        sim_share = np.where(
-            df['total_annual_exp'] > 0,
-            sim_energy / df['total_annual_exp'] * 100,
-            0
-        )
-        
-        poor = sim_share > threshold_pct
-        total_weight = df['wgt'].sum()
-        poor_weight = df.loc[poor, 'wgt'].sum()
-        results[scenario] = (poor_weight / total_weight * 100) if total_weight > 0 else 0
-    
-    return results
+    n_replicates: int = 1000,
+    seed: int = 42,
+    n_jobs: int = 1,
+    confidence: float = 0.95,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Survey-bootstrap standard errors and percentile confidence intervals
+    for the HIES 2019 distributional statistics.
+
+    Args:
+        df: HIES household frame
+        scenario_lcoes: {scenario: LCOE} (Suits index for every non-BAU scenario)
+        bau_lcoe: BAU LCOE ($/kWh)
+        n_replicates: Bootstrap replicates B
+        seed: Seed for the replicate weights
+        n_jobs: Worker processes (replicate blocks are split across a pool when > 1)
+        confidence: Confidence level of the percentile intervals
+
+    Returns:
+        {statistic: {estimate, se, ci_low, ci_high, n_replicates}} with
+        statistics national_elec_share_pct, energy_poverty_pct,
+        concentration_coefficient, quintile_elec_share_pct_Q1..Q5 and
+        suits_index_<scenario>
+    """
+    engine = TariffImpactEngine.from_lcoes(df, scenario_lcoes, bau_lcoe)
+    strata = df['atoll_code'].fillna(-1).to_numpy()[engine.order]
+    data = _bootstrap_inputs(engine, strata)
+
+    sizes = [min(BOOTSTRAP_BLOCK, n_replicates - start) for start in range(0, n_replicates, BOOTSTRAP_BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if n_jobs > 1 and len(sizes) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes))) as pool:
+            blocks = list(pool.map(_bootstrap_block, [data] * len(sizes), sizes, seeds))
+    else:
+        blocks = [_bootstrap_block(data, size, sq) for size, sq in zip(sizes, seeds)]
+    replicates = {k: np.concatenate([b[k] for b in blocks]) for k in blocks[0]}
+    estimates = _replicate_statistics(data, engine.wgt[None, :])
+
+    def _columns(name: str, values: np.ndarray):
+        if values.ndim == 1:
+            return [(name, 0)]
+        if name == "quintile_elec_share_pct":
+            return [(f"{name}_Q{q + 1}", q) for q in range(N_QUINTILES)]
+        return [(f"{name}_{sc}", s) for s, sc in enumerate(engine.scenarios)]
+
+    tail = (1 - confidence) / 2 * 100
+    summary = {}
+    for name, values in replicates.items():
+        for label, col in _columns(name, values):
+            draws = values if values.ndim == 1 else values[:, col]
+            point = estimates[name][0] if values.ndim == 1 else estimates[name][0, col]
+            summary[label] = {
+                "estimate": float(point),
+                "se": float(draws.std(ddof=1)),
+                "ci_low": float(np.percentile(draws, tail)),
+                "ci_high": float(np.percentile(draws, 100 - tail)),
+                "n_replicates": n_replicates,
+            }
+    return summary
 
 
 # =============================================================================
-# PROGRESSIVITY METRICS
+# TIME-DYNAMIC HOUSEHOLD MICROSIMULATION
 # =============================================================================
 
-def _compute_concentration_coefficient(df: pd.DataFrame) -> float:
+def scenario_tariff_paths(
+    config: Config,
+    scenario_results: dict,
+    npv_results: Dict[str, dict],
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
     """
-    Compute the concentration coefficient of electricity expenditure
-    relative to total expenditure ranking.
-    
-    CC = 2 × cov(electricity_share, cumulative_pop_rank) / mean(electricity_share)
-    
-    A negative CC means electricity spending is concentrated among the poor
-    (regressive consumption pattern). CC=0 means proportional.
-    
-    Reference: Kakwani (1977); O'Donnell et al. (2008) "Analyzing Health Equity".
+    Annual household tariff ($/kWh) per scenario over the model horizon.
+
+    Cost of service in year t is the recurrent cost (O&M, fuel, PPA) per kWh
+    of demand in t plus the scenario's capital charge per kWh — the capital
+    share of its LCOE, (PV CAPEX − PV salvage) / PV total cost, spread
+    evenly — so its PV-weighted mean is the scenario LCOE. The tariff moves
+    one-for-one with the cost of service against BAU in the base year and
+    rises as the subsidy is phased out (get_subsidy_per_kwh):
+
+        tariff_s(t) = tariff_0 + [cost_s(t) − cost_BAU(t0)] + [subsidy(t0) − subsidy(t)]
+
+    floored at zero, where tariff_0 is the current retail tariff.
+
+    Args:
+        config: Model configuration
+        scenario_results: {scenario: ScenarioResults} (must include 'bau')
+        npv_results: {scenario: {lcoe, pv_total_costs, pv_opex, pv_fuel, pv_ppa, ...}}
+
+    Returns:
+        (years, {scenario: tariff per year})
     """
-    # Sort by per-capita expenditure
-    sorted_df = df.sort_values('pce').copy()
-    
-    # Weighted fractional rank
-    cumwgt = sorted_df['wgt'].cumsum()
-    total_wgt = sorted_df['wgt'].sum()
-    sorted_df['frac_rank'] = cumwgt / total_wgt
-    
-    # Concentration coefficient
-    mean_share = np.average(sorted_df['elec_share'], weights=sorted_df['wgt'])
-    if mean_share == 0:
-        return 0.0
-    
-    cov = np.average(
-        sorted_df['elec_share'] * sorted_df['frac_rank'],
-        weights=sorted_df['wgt']
-    ) - mean_share * np.average(sorted_df['frac_rank'], weights=sorted_df['wgt'])
-    
-    cc = 2 * cov / mean_share
-    return cc
+    cs = config.current_system
+    years = scenario_results['bau'].generation_mix.years
 
+    cost = {}
+    for sc, results in scenario_results.items():
+        if sc not in npv_results:
+            continue
+        npv = npv_results[sc]
+        pv_total = npv['pv_total_costs']
+        pv_capital = pv_total - npv['pv_opex'] - npv['pv_fuel'] - npv['pv_ppa']
+        capital_per_kwh = npv['lcoe'] * pv_capital / pv_total if pv_total else 0.0
+        costs = results.annual_costs
+        recurrent = costs.column('total_opex') + costs.column('total_fuel')
+        demand_kwh = results.generation_mix.column('total_demand_gwh') * 1e6
+        cost[sc] = np.divide(recurrent, demand_kwh, out=np.zeros(len(years)), where=demand_kwh > 0) + capital_per_kwh
+
+    subsidy = np.array([cs.get_subsidy_per_kwh(int(y)) for y in years])
+    subsidy_withdrawn = cs.get_subsidy_per_kwh(int(years[0])) - subsidy
+    reference = cost['bau'][0]
+    return years, {
+        sc: np.maximum(cs.current_retail_tariff + (c - reference) + subsidy_withdrawn, 0.0)
+        for sc, c in cost.items()
+    }
 
-def _compute_suits_index(
-    df: pd.DataFrame,
-    scenario_lcoe: float,
-    bau_lcoe: float,
-) -> float:
+
+def run_household_microsimulation(
+    config: Config,
+    scenario_results: dict,
+    npv_results: Dict[str, dict],
+    df: Optional[pd.DataFrame] = None,
+    chunk_size: int = 256,
+) -> dict:
     """
-    Compute the Suits index for a tariff change.
-    
-    Suits index measures the progressivity of a tax/tariff change:
-    - S > 0: progressive (rich pay proportionally more)
-    - S = 0: proportional
-    - S < 0: regressive (poor pay proportionally more)
-    
-    Reference: Suits (1977) "Measurement of Tax Progressivity".
-    
-    For a tariff reduction (scenario LCOE < BAU LCOE), we measure the
-    progressivity of the *benefit* (bill reduction).
+    Age HIES households over the horizon under each scenario's tariff path.
+
+    HIES 2019 households are taken as the base-year population. Each year:
+    - total expenditure (and gas/kerosene spending) grows with real GDP per
+      capita, (1 + GDP growth) / (1 + population growth);
+    - electricity use per household follows the scenario's residential
+      demand per capita, relative to the base year;
+    - the bill follows the scenario tariff (scenario_tariff_paths) relative
+      to the current retail tariff.
+
+    Household shares are scale-invariant, so every (scenario, year) cell is
+    one effective bill ratio, tariff ratio × kWh index / expenditure index,
+    and the (scenarios × years × households) array is evaluated by
+    TariffImpactEngine in blocks of `chunk_size` cells.
+
+    Returns:
+        Dict with years and, per scenario, the tariff path and annual series
+        of mean electricity share, energy poverty headcount, mean monthly
+        bill (electrified HH) and quintile electricity shares
     """
-    lcoe_ratio = scenario_lcoe / bau_lcoe if bau_lcoe > 0 else 1.0
-    
-    # Bill change per household
-    bill_change = df['elec_annual'] * (lcoe_ratio - 1)
-    
-    # Sort by per-capita expenditure
-    sorted_df = df.sort_values('pce').copy()
-    sorted_df['bill_change'] = bill_change.loc[sorted_df.index]
-    
-    # Weighted cumulative shares
-    total_wgt = sorted_df['wgt'].sum()
-    total_change = np.abs((sorted_df['bill_change'] * sorted_df['wgt']).sum())
-    
-    if total_change == 0:
-        return 0.0
-    
-    cumwgt = sorted_df['wgt'].cumsum() / total_wgt
-    cum_change = (np.abs(sorted_df['bill_change']) * sorted_df['wgt']).cumsum() / total_change
-    
-    # Suits index = 1 - 2 × area under Lorenz curve of bill changes
-    # Approximate area under curve using trapezoidal rule
-    # np.trapezoid (NumPy >=2.0) replaces deprecated np.trapz
-    trapz_fn = getattr(np, 'trapezoid', None) or np.trapz
-    area = trapz_fn(cum_change, cumwgt)
-    suits = 1 - 2 * area
-    
-    return suits
+    if df is None:
+        df = _load_hies_data(config, columns=list(HIES_ANALYSIS_COLUMNS))
+    cs = config.current_system
+    years, tariffs = scenario_tariff_paths(config, scenario_results, npv_results)
+    scenarios = list(tariffs)
+    elapsed = years - years[0]
+    population_index = (1 + cs.population_growth_rate) ** elapsed
+    expenditure_index = ((1 + config.financing.gdp_growth_rate) / (1 + cs.population_growth_rate)) ** elapsed
+
+    bill_index = np.empty((len(scenarios), len(years)))
+    for s, sc in enumerate(scenarios):
+        results = scenario_results[sc]
+        residential = results.sectoral_demand.column('residential_gwh') if len(results.sectoral_demand) else (
+            results.generation_mix.column('total_demand_gwh')
+        )
+        kwh_index = residential / residential[0] / population_index
+        bill_index[s] = tariffs[sc] / cs.current_retail_tariff * kwh_index
+
+    engine = TariffImpactEngine(df, (bill_index / expenditure_index).ravel(), chunk_size=chunk_size)
+    poverty = engine.energy_poverty().reshape(bill_index.shape)
+
+    # Mean shares and bills are linear in the bill, so they scale the base-year means
+    share_ratio = bill_index / expenditure_index
+    national_share = np.average(df['elec_share'], weights=df['wgt'])
+    quintile_share = _weighted_group_stats(df, ['exp_quintile'], mean=('elec_share',))['elec_share'].reindex(
+        range(1, N_QUINTILES + 1), fill_value=0.0,
+    ).to_numpy()
+    electrified = df['has_elec'].to_numpy(dtype=bool)
+    base_bill = np.average(df.loc[electrified, 'elec_monthly'], weights=df.loc[electrified, 'wgt'])
+
+    return {
+        "years": [int(y) for y in years],
+        "assumptions": {
+            "current_retail_tariff_usd_kwh": cs.current_retail_tariff,
+            "expenditure_growth_per_capita": float(expenditure_index[1] - 1) if len(years) > 1 else 0.0,
+            "subsidy_usd_kwh": [cs.get_subsidy_per_kwh(int(y)) for y in years],
+        },
+        "scenarios": {
+            sc: {
+                "tariff_usd_kwh": tariffs[sc].tolist(),
+                "mean_elec_share_pct": (share_ratio[s] * national_share).tolist(),
+                "energy_poverty_pct": poverty[s].tolist(),
+                "mean_monthly_bill_mvr": (bill_index[s] * base_bill).tolist(),
+                "quintile_elec_share_pct": {
+                    f"Q{q + 1}": (share_ratio[s] * quintile_share[q]).tolist() for q in range(N_QUINTILES)
+                },
+            }
+            for s, sc in enumerate(scenarios)
+        },
+    }
 
 
 # =============================================================================
@@ -960,6 +1624,9 @@ def run_distributional_analysis(
     config: Config,
     cba_results: dict,
     scenario_summaries: dict,
+    bootstrap_replicates: int = 1000,
+    n_jobs: int = 1,
+    scenario_results: Optional[dict] = None,
 ) -> DistributionalResults:
     """
     Run the full distributional analysis.
@@ -968,6 +1635,11 @@ def run_distributional_analysis(
         config: Model configuration (from get_config())
         cba_results: Output from CBA (with npv_results containing LCOEs)
         scenario_summaries: Scenario summary dict (total costs, emissions, etc.)
+        bootstrap_replicates: Survey-bootstrap replicates for confidence
+            intervals (0 to skip)
+        n_jobs: Worker processes for the bootstrap
+        scenario_results: {scenario: ScenarioResults}; when given, households
+            are also simulated year by year (run_household_microsimulation)
     
     Returns:
         DistributionalResults with all analysis outputs
@@ -982,7 +1654,7 @@ def run_distributional_analysis(
     
     # 1. Load HIES microdata
     print("  Loading HIES 2019 microdata...")
-    df = _load_hies_data(config)
+    df = _load_hies_data(config, columns=list(HIES_ANALYSIS_COLUMNS))
     print(f"    ✓ {len(df):,} households loaded ({df['has_elec'].sum():,} with electricity)")
     
     # 2. Extract scenario LCOEs from CBA results
@@ -1016,8 +1688,9 @@ def run_distributional_analysis(
     # 3. Compute baseline profiles
     print("  Computing baseline expenditure profiles...")
     quintile_profiles = _compute_quintile_profiles(df)
-    male_profile = _compute_geo_profile(df, 'Male')
-    atoll_profile = _compute_geo_profile(df, 'Atoll')
+    geo_profiles = _compute_geo_profiles(df)
+    male_profile = geo_profiles['Male']
+    atoll_profile = geo_profiles['Atoll']
     atoll_profiles = _compute_atoll_profiles(df)
     
     # National statistics
@@ -1036,7 +1709,8 @@ def run_distributional_analysis(
     
     # 4. Tariff impact simulation
     print("  Simulating tariff impacts by scenario...")
-    tariff_impacts = _simulate_tariff_impacts(df, scenario_lcoes, bau_lcoe, config)
+    engine = TariffImpactEngine.from_lcoes(df, scenario_lcoes, bau_lcoe)
+    tariff_impacts = engine.tariff_impacts()
     
     for scenario, impacts in tariff_impacts.items():
         q1_atoll = [ti for ti in impacts if ti.quintile == 1 and ti.geography == 'Atoll']
@@ -1049,9 +1723,7 @@ def run_distributional_analysis(
     # 5. Energy poverty
     print("  Computing energy poverty headcounts...")
     energy_poverty_baseline = _compute_energy_poverty(df)
-    energy_poverty_scenarios = _simulate_energy_poverty_by_scenario(
-        df, scenario_lcoes, bau_lcoe
-    )
+    energy_poverty_scenarios = dict(zip(engine.scenarios, engine.energy_poverty()))
     
     print(f"    Baseline energy poverty (>10% threshold): {energy_poverty_baseline:.1f}%")
     for sc, pov in energy_poverty_scenarios.items():
@@ -1059,11 +1731,8 @@ def run_distributional_analysis(
     
     # 6. Progressivity metrics
     print("  Computing progressivity metrics...")
-    concentration_coeff = _compute_concentration_coefficient(df)
-    suits_indices = {}
-    for sc, lcoe in scenario_lcoes.items():
-        if sc != 'bau':
-            suits_indices[sc] = _compute_suits_index(df, lcoe, bau_lcoe)
+    concentration_coeff = engine.concentration_coefficient()
+    suits_indices = dict(zip(engine.scenarios, engine.suits_indices()))
     
     print(f"    Concentration coefficient: {concentration_coeff:.4f}")
     for sc, si in suits_indices.items():
@@ -1073,8 +1742,8 @@ def run_distributional_analysis(
     # 7. Gender-disaggregated analysis (P5)
     print("  Computing gender-disaggregated profiles (P5)...")
     gender_profiles = _compute_gender_profiles(df)
-    gender_tariff = _simulate_gender_tariff_impacts(df, scenario_lcoes, bau_lcoe)
-    gender_poverty = _simulate_gender_energy_poverty(df, scenario_lcoes, bau_lcoe)
+    gender_tariff = engine.gender_tariff_impacts()
+    gender_poverty = engine.gender_energy_poverty()
     
     if gender_profiles:
         for gp in gender_profiles:
@@ -1083,7 +1752,27 @@ def run_distributional_analysis(
     else:
         print("    ⚠ Gender data not available — skipping")
     
-    # 8. Build results
+    # 8. Sampling uncertainty (survey bootstrap)
+    sampling_uncertainty = None
+    if bootstrap_replicates > 0:
+        print(f"  Bootstrapping sampling uncertainty ({bootstrap_replicates:,} replicates)...")
+        sampling_uncertainty = bootstrap_distributional_statistics(
+            df, scenario_lcoes, bau_lcoe, n_replicates=bootstrap_replicates, n_jobs=n_jobs,
+        )
+        cc = sampling_uncertainty["concentration_coefficient"]
+        print(f"    Concentration coefficient 95% CI: [{cc['ci_low']:.4f}, {cc['ci_high']:.4f}]")
+
+    # 9. Time-dynamic microsimulation (annual tariff paths, subsidy phase-out)
+    microsimulation = None
+    if scenario_results is not None:
+        print("  Simulating household burden over the horizon...")
+        microsimulation = run_household_microsimulation(config, scenario_results, npv_results, df)
+        last = microsimulation["years"][-1]
+        for sc, series in microsimulation["scenarios"].items():
+            print(f"    {sc}: {last} burden {series['mean_elec_share_pct'][-1]:.1f}%, "
+                  f"energy poverty {series['energy_poverty_pct'][-1]:.1f}%")
+
+    # 10. Build results
     results = DistributionalResults(
         national_mean_elec_share_pct=national_elec_share,
         national_mean_energy_share_pct=national_energy_share,
@@ -1104,6 +1793,8 @@ def run_distributional_analysis(
         energy_poverty_by_scenario=energy_poverty_scenarios,
         concentration_coefficient=concentration_coeff,
         suits_index_by_scenario=suits_indices,
+        sampling_uncertainty=sampling_uncertainty,
+        microsimulation=microsimulation,
     )
     
     print("  ✓ Distributional analysis complete")
@@ -1219,3 +1910,25 @@ def save_distributional_results(results: DistributionalResults, output_dir: str)
         json.dump(results.to_dict(), f, indent=2, cls=_NumpyEncoder)
     
     print(f"  Distributional results saved to {filepath}")
+
+
+if __name__ == "__main__":
+    import sys
+    
+    if "--build-hies-cache" in sys.argv:
+        # Merge the .dta files once; later runs read the columnar cache
+        from model.distributional_analysis import build_hies_cache as _build_cache
+        print(f"HIES frame cache: {_build_cache(force='--force' in sys.argv)}")
+        sys.exit(0)
+    
+    if "--monte-carlo" in sys.argv:
+        # Quantiles of distributional outcomes over the saved Monte Carlo LCOE draws
+        output_dir = Path(__file__).parent.parent / "outputs"
+        draws = load_lcoe_draws(output_dir / MC_LCOE_DRAWS_FILE)
+        summary = run_distributional_monte_carlo(draws)
+        print_distributional_mc_summary(summary)
+        save_distributional_mc_results(summary, str(output_dir))
+        sys.exit(0)
+    
+    print("Usage: python -m model.distributional_analysis --build-hies-cache [--force]")
+    print("       python -m model.distributional_analysis --monte-carlo")
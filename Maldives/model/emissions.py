@@ -6,6 +6,7 @@ Calculates CO2 emissions for each scenario and monetizes using social cost of ca
 """
 
 import pandas as pd
+import numpy as np
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -98,6 +99,14 @@ class EmissionsCalculator:
         
         return emissions_tonnes
     
+    def import_emissions_array(self, import_gwh: np.ndarray, years: np.ndarray) -> np.ndarray:
+        """import_emissions() for each year; zero before the cable is online."""
+        years = np.asarray(years)
+        online = years >= self.config.one_grid.cable_online_year
+        emission_factor = self.ppa.get_india_emission_factor(years)
+        import_kwh = np.asarray(import_gwh, dtype=float) * 1_000_000
+        return np.where(online, import_kwh * emission_factor / 1000, 0.0)
+    
     def solar_lifecycle_emissions(self, capacity_mw: float) -> float:
         """
         Calculate lifecycle emissions from solar PV manufacturing.
@@ -15,6 +15,11 @@ Outputs (per scenario):
 - Annual debt service schedule (grace period + amortisation)
 - Fiscal burden metrics (debt service / GDP, total interest paid)
 
+Schedules come from an array engine (amortisation_matrices) that
+amortises any number of loans as (loans × years) matrices;
+aggregate_debt_portfolio sums them into portfolios against projected
+GDP, and debt_service_grid stress-tests a grid of financing terms.
+
 All parameters flow from parameters.csv → config.py → get_config().
 No hardcoded values.
 
@@ -33,7 +38,9 @@ import json
 import math
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from model.config import Config, get_config
 
@@ -77,6 +84,67 @@ class LoanSchedule:
         return max(p.total_payment for p in self.annual_payments)
 
 
+@dataclass
+class LoanMatrices:
+    """
+    Debt service for many loans on a common calendar-year axis.
+
+    Every matrix is (loans × years); `active` marks the years each loan has
+    a scheduled payment row (1..maturity after disbursement).
+    """
+    years: np.ndarray  # (years,) calendar years
+    principal: np.ndarray  # (loans,) face value
+    interest_rate: np.ndarray
+    maturity_years: np.ndarray
+    grace_years: np.ndarray
+    outstanding: np.ndarray  # start of year
+    interest: np.ndarray
+    principal_payment: np.ndarray
+    active: np.ndarray
+
+    @property
+    def total(self) -> np.ndarray:
+        return self.interest + self.principal_payment
+
+    def to_schedule(self, i: int, loan_name: str) -> LoanSchedule:
+        """LoanSchedule (one DebtServiceYear per active year) for loan i."""
+        schedule = LoanSchedule(
+            loan_name=loan_name,
+            principal=float(self.principal[i]),
+            interest_rate=float(self.interest_rate[i]),
+            maturity_years=int(self.maturity_years[i]),
+            grace_years=int(self.grace_years[i]),
+        )
+        total = self.total[i]
+        schedule.annual_payments = [
+            DebtServiceYear(
+                year=int(self.years[c]),
+                outstanding_principal=float(self.outstanding[i, c]),
+                interest_payment=float(self.interest[i, c]),
+                principal_payment=float(self.principal_payment[i, c]),
+                total_payment=float(total[c]),
+            )
+            for c in np.flatnonzero(self.active[i])
+        ]
+        return schedule
+
+
+@dataclass
+class PortfolioDebtService:
+    """Debt service of loan portfolios (portfolios × years) against projected GDP."""
+    years: np.ndarray  # (years,) calendar years
+    gdp: np.ndarray  # (years,) projected GDP, USD
+    service: np.ndarray  # (portfolios × years) interest + principal
+    interest: np.ndarray
+    active: np.ndarray  # any loan in the portfolio has a payment row that year
+    total_interest_paid: np.ndarray  # (portfolios,)
+    peak_annual_service: np.ndarray
+    peak_year: np.ndarray  # -1 if the portfolio has no payments
+    peak_service_pct_gdp: np.ndarray  # peak service / GDP in the peak year
+    max_service_pct_gdp: np.ndarray  # highest annual service / GDP ratio
+    avg_annual_service: np.ndarray  # mean over active years
+
+
 @dataclass
 class ScenarioFinancing:
     """Complete financing picture for one scenario."""
@@ -225,6 +293,168 @@ def calculate_grant_element(
     return 1.0 - pv
 
 
+def amortisation_matrices(
+    principal,
+    interest_rate,
+    maturity_years,
+    grace_years,
+    start_year,
+) -> LoanMatrices:
+    """
+    Debt service schedules for many loans at once.
+
+    Same terms as build_loan_schedule, applied elementwise: interest-only
+    during grace, then equal principal repayments plus interest on the
+    outstanding balance, with payments in years start_year + 1 ..
+    start_year + maturity. Arguments are scalars or equal-length arrays.
+    The recursion steps over loan-relative years with every loan updated
+    in one array operation, so each schedule is bit-identical to the
+    scalar loop.
+
+    Returns:
+        LoanMatrices on the calendar years spanned by all loans
+    """
+    principal, rate, maturity, grace, start = (
+        np.ravel(a) for a in np.broadcast_arrays(
+            np.asarray(principal, dtype=float),
+            np.asarray(interest_rate, dtype=float),
+            np.asarray(maturity_years, dtype=np.int64),
+            np.asarray(grace_years, dtype=np.int64),
+            np.asarray(start_year, dtype=np.int64),
+        )
+    )
+    n_loans = principal.size
+    n_rel = int(maturity.max(initial=0))
+
+    amort_years = maturity - grace
+    amort_years = np.where(amort_years <= 0, 1, amort_years)  # safety
+    principal_per_year = principal / amort_years
+    has_loan = principal > 0
+
+    shape = (n_loans, n_rel)
+    outstanding = np.zeros(shape)
+    interest = np.zeros(shape)
+    prin_payment = np.zeros(shape)
+    active = np.zeros(shape, dtype=bool)
+
+    balance = np.where(has_loan, principal, 0.0)
+    for t in range(1, n_rel + 1):
+        live = has_loan & (t <= maturity)
+        payment = np.where(t <= grace, 0.0, principal_per_year)
+        active[:, t - 1] = live
+        outstanding[:, t - 1] = np.where(live, balance, 0.0)
+        interest[:, t - 1] = np.where(live, balance * rate, 0.0)
+        prin_payment[:, t - 1] = np.where(live, payment, 0.0)
+        # avoid float rounding below zero
+        balance = np.where(live, np.maximum(balance - payment, 0.0), balance)
+
+    # Shift loan-relative years onto a common calendar axis
+    first = int(start.min()) + 1 if n_loans else 1
+    offset = start - (first - 1)
+    n_years = int((offset + n_rel).max(initial=0))
+    years = np.arange(first, first + n_years)
+    if n_loans and np.any(offset):
+        rows = np.arange(n_loans)[:, None]
+        cols = offset[:, None] + np.arange(n_rel)
+        calendar = []
+        for rel in (outstanding, interest, prin_payment, active):
+            cal = np.zeros((n_loans, n_years), dtype=rel.dtype)
+            cal[rows, cols] = rel
+            calendar.append(cal)
+        outstanding, interest, prin_payment, active = calendar
+
+    return LoanMatrices(
+        years=years,
+        principal=principal,
+        interest_rate=rate,
+        maturity_years=maturity,
+        grace_years=grace,
+        outstanding=outstanding,
+        interest=interest,
+        principal_payment=prin_payment,
+        active=active,
+    )
+
+
+def aggregate_debt_portfolio(
+    loans: LoanMatrices,
+    config: Config,
+    portfolio: Optional[np.ndarray] = None,
+    n_portfolios: Optional[int] = None,
+) -> PortfolioDebtService:
+    """
+    Sum loans into portfolios and measure debt service against GDP.
+
+    GDP is projected from config.financing.gdp_billion_usd at the base
+    year with gdp_growth_rate (G-MO-02: year-specific GDP).
+
+    Args:
+        loans: Output of amortisation_matrices()
+        config: Model configuration
+        portfolio: (loans,) portfolio index of each loan; None puts every
+            loan in one national portfolio
+        n_portfolios: Number of portfolios (default: max index + 1)
+    """
+    fin = config.financing
+    n_loans = loans.principal.size
+    if portfolio is None:
+        portfolio = np.zeros(n_loans, dtype=np.int64)
+    portfolio = np.asarray(portfolio, dtype=np.int64)
+    if n_portfolios is None:
+        n_portfolios = int(portfolio.max(initial=-1)) + 1
+
+    # Loans are summed in their given order within each portfolio
+    order = np.argsort(portfolio, kind="stable")
+    counts = np.bincount(portfolio, minlength=n_portfolios)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    used = counts > 0
+    shape = (n_portfolios, loans.years.size)
+    service = np.zeros(shape)
+    interest = np.zeros(shape)
+    active = np.zeros(shape, dtype=bool)
+    if used.any() and loans.years.size:
+        service[used] = np.add.reduceat(loans.total[order], starts[used], axis=0)
+        interest[used] = np.add.reduceat(loans.interest[order], starts[used], axis=0)
+        active[used] = np.logical_or.reduceat(loans.active[order], starts[used], axis=0)
+
+    base_gdp = fin.gdp_billion_usd * 1e9
+    years = loans.years
+    gdp = base_gdp * (1 + fin.gdp_growth_rate) ** np.maximum(years - config.base_year, 0)
+
+    # Peak = first year of highest service among years with payment rows
+    n_active = active.sum(axis=1)
+    peak = np.zeros(n_portfolios)
+    peak_year = np.full(n_portfolios, -1, dtype=np.int64)
+    gdp_at_peak = np.full(n_portfolios, base_gdp)
+    max_pct = np.zeros(n_portfolios)
+    avg = np.zeros(n_portfolios)
+    rows = np.flatnonzero(n_active > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if rows.size:
+            masked = np.where(active[rows], service[rows], -np.inf)
+            col = masked.argmax(axis=1)
+            peak[rows] = masked[np.arange(rows.size), col]
+            peak_year[rows] = years[col]
+            gdp_at_peak[rows] = gdp[col]
+            max_pct[rows] = (service[rows] / gdp * 100).max(axis=1)
+            avg[rows] = service[rows].sum(axis=1) / n_active[rows]
+        peak_pct = np.where(gdp_at_peak > 0, peak / gdp_at_peak * 100, 0.0)
+
+    return PortfolioDebtService(
+        years=loans.years,
+        gdp=gdp,
+        service=service,
+        interest=interest,
+        active=active,
+        total_interest_paid=interest.sum(axis=1),
+        peak_annual_service=peak,
+        peak_year=peak_year,
+        peak_service_pct_gdp=peak_pct,
+        max_service_pct_gdp=max_pct,
+        avg_annual_service=avg,
+    )
+
+
 def build_loan_schedule(
     loan_name: str,
     principal: float,
@@ -239,44 +469,8 @@ def build_loan_schedule(
     - Grace period: interest-only payments
     - Amortisation period: equal principal repayments + interest on outstanding
     """
-    schedule = LoanSchedule(
-        loan_name=loan_name,
-        principal=principal,
-        interest_rate=interest_rate,
-        maturity_years=maturity_years,
-        grace_years=grace_years,
-    )
-
-    if principal <= 0:
-        return schedule
-
-    amort_years = maturity_years - grace_years
-    if amort_years <= 0:
-        amort_years = 1  # safety
-
-    principal_per_year = principal / amort_years
-    outstanding = principal
-
-    for t in range(1, maturity_years + 1):
-        year = start_year + t
-        interest = outstanding * interest_rate
-        if t <= grace_years:
-            prin_payment = 0.0
-        else:
-            prin_payment = principal_per_year
-        total = interest + prin_payment
-
-        schedule.annual_payments.append(DebtServiceYear(
-            year=year,
-            outstanding_principal=outstanding,
-            interest_payment=interest,
-            principal_payment=prin_payment,
-            total_payment=total,
-        ))
-        outstanding -= prin_payment
-        outstanding = max(0, outstanding)  # avoid float rounding below zero
-
-    return schedule
+    loans = amortisation_matrices(principal, interest_rate, maturity_years, grace_years, start_year)
+    return loans.to_schedule(0, loan_name)
 
 
 def calculate_wacc(
@@ -315,7 +509,6 @@ def analyse_scenario(
         config: Model configuration
     """
     fin = config.financing
-    gdp = fin.gdp_billion_usd * 1e9  # to USD
 
     # --- Split CAPEX ---
     adb_capex = nominal_capex * fin.adb_eligible_share
@@ -341,44 +534,24 @@ def analyse_scenario(
     # over construction period, but this gives a clean illustrative schedule)
     start_year = config.base_year
 
-    adb_loan = build_loan_schedule(
-        loan_name="ADB SIDS Concessional",
-        principal=adb_capex,
-        interest_rate=fin.adb_sids_rate,
-        maturity_years=fin.adb_sids_maturity,
-        grace_years=fin.adb_sids_grace,
-        start_year=start_year,
-    )
-
-    commercial_loan = build_loan_schedule(
-        loan_name="Commercial",
-        principal=commercial_capex,
-        interest_rate=fin.commercial_interest_rate,
-        maturity_years=fin.commercial_maturity,
-        grace_years=fin.commercial_grace,
+    loans = amortisation_matrices(
+        principal=[adb_capex, commercial_capex],
+        interest_rate=[fin.adb_sids_rate, fin.commercial_interest_rate],
+        maturity_years=[fin.adb_sids_maturity, fin.commercial_maturity],
+        grace_years=[fin.adb_sids_grace, fin.commercial_grace],
         start_year=start_year,
     )
+    adb_loan = loans.to_schedule(0, "ADB SIDS Concessional")
+    commercial_loan = loans.to_schedule(1, "Commercial")
 
     # --- Fiscal metrics ---
-    total_interest = adb_loan.total_interest_paid + commercial_loan.total_interest_paid
-
-    # Combined annual service (overlay the two schedules)
-    combined_by_year: Dict[int, float] = {}
-    for payment in adb_loan.annual_payments + commercial_loan.annual_payments:
-        combined_by_year[payment.year] = combined_by_year.get(payment.year, 0) + payment.total_payment
-
-    peak_service = max(combined_by_year.values()) if combined_by_year else 0.0
-    avg_service = sum(combined_by_year.values()) / len(combined_by_year) if combined_by_year else 0.0
-    # G-MO-02: Use year-specific GDP — project GDP forward from base year
-    base_year = config.base_year
-    gdp_growth = fin.gdp_growth_rate
-    if combined_by_year:
-        peak_year = max(combined_by_year, key=combined_by_year.get)
-        years_forward = peak_year - base_year
-        gdp_at_peak = gdp * (1 + gdp_growth) ** max(years_forward, 0)
-    else:
-        gdp_at_peak = gdp
-    peak_pct_gdp = (peak_service / gdp_at_peak * 100) if gdp_at_peak > 0 else 0.0
+    # Combined annual service (overlay the two schedules) against
+    # year-specific GDP (G-MO-02)
+    portfolio = aggregate_debt_portfolio(loans, config)
+    total_interest = float(portfolio.total_interest_paid[0])
+    peak_service = float(portfolio.peak_annual_service[0])
+    avg_service = float(portfolio.avg_annual_service[0])
+    peak_pct_gdp = float(portfolio.peak_service_pct_gdp[0])
 
     # --- L21-22: Tariff / subsidy / fiscal context ---
     cs = config.current_system
@@ -426,6 +599,77 @@ def analyse_scenario(
     )
 
 
+# =============================================================================
+# DEBT SERVICE STRESS TESTS
+# =============================================================================
+
+FINANCING_TERMS = (
+    "adb_share",
+    "adb_rate",
+    "adb_maturity",
+    "adb_grace",
+    "commercial_rate",
+    "commercial_maturity",
+    "commercial_grace",
+)
+
+
+def debt_service_grid(
+    nominal_capex: float,
+    config: Config,
+    **terms,
+) -> Tuple[Dict[str, np.ndarray], PortfolioDebtService]:
+    """
+    Debt service of one CAPEX programme across a grid of financing terms.
+
+    Each keyword in FINANCING_TERMS takes a scalar or a sequence of values
+    (unset terms use the config); the grid is the full cross product, and
+    every structure is the ADB + commercial split used by analyse_scenario.
+    All 2 × structures loans are amortised in one call.
+
+    Example:
+        grid, debt = debt_service_grid(
+            capex, config,
+            adb_rate=np.linspace(0.01, 0.04, 10),
+            adb_grace=range(0, 10),
+            adb_maturity=range(20, 40, 2),
+            commercial_rate=np.linspace(0.05, 0.14, 10),
+        )  # 10,000 structures
+        worst = debt.peak_service_pct_gdp.argmax()
+
+    Returns:
+        (grid, debt): grid maps each term to its (structures,) values;
+        debt is the PortfolioDebtService with one portfolio per structure
+    """
+    fin = config.financing
+    defaults = {
+        "adb_share": fin.adb_eligible_share,
+        "adb_rate": fin.adb_sids_rate,
+        "adb_maturity": fin.adb_sids_maturity,
+        "adb_grace": fin.adb_sids_grace,
+        "commercial_rate": fin.commercial_interest_rate,
+        "commercial_maturity": fin.commercial_maturity,
+        "commercial_grace": fin.commercial_grace,
+    }
+    unknown = set(terms) - set(FINANCING_TERMS)
+    if unknown:
+        raise ValueError(f"Unknown financing terms: {sorted(unknown)} (expected {FINANCING_TERMS})")
+
+    axes = [np.atleast_1d(np.asarray(terms.get(k, defaults[k]))) for k in FINANCING_TERMS]
+    grid = {k: m.ravel() for k, m in zip(FINANCING_TERMS, np.meshgrid(*axes, indexing="ij"))}
+    n = grid["adb_share"].size
+
+    loans = amortisation_matrices(
+        principal=np.concatenate([nominal_capex * grid["adb_share"], nominal_capex * (1 - grid["adb_share"])]),
+        interest_rate=np.concatenate([grid["adb_rate"], grid["commercial_rate"]]),
+        maturity_years=np.concatenate([grid["adb_maturity"], grid["commercial_maturity"]]),
+        grace_years=np.concatenate([grid["adb_grace"], grid["commercial_grace"]]),
+        start_year=config.base_year,
+    )
+    structure = np.tile(np.arange(n), 2)
+    return grid, aggregate_debt_portfolio(loans, config, structure, n)
+
+
 # =============================================================================
 # ENTRY POINTS
 # =============================================================================
@@ -0,0 +1,480 @@
+"""
+Maldives Energy CBA - Stage Pipeline
+====================================
+
+Runs the run_cba workflow as a DAG of stages with declared inputs:
+
+    scenarios ─┬─ cba ─┬─ financing ──────┐
+               │       ├─ mca ────────────┤
+               │       └─ distributional ─┤
+               └─ ddr ────────────────────┤
+    learning ─────────────────────────────┤
+    climate ──────────────────────────────┼─ report
+    transport ────────────────────────────┘
+
+Each stage's output is cached on disk under a key built from
+  - the parameters.csv rows the stage reads (its category slice),
+  - the model code version (hash of the package sources),
+  - any data files it reads (size + mtime), and
+  - the keys of its upstream stages,
+so a rerun only recomputes stages whose inputs changed. Changing an MCA
+weight, for example, re-runs only `mca` and `report`. Stages whose inputs
+are ready at the same time (financing, mca, distributional; learning,
+climate, transport) run concurrently with --jobs > 1.
+
+Console output of each stage is captured and replayed in declaration
+order, so cached and fresh runs print the same report.
+
+Usage:
+    python -m model.pipeline [--output OUTPUT_DIR] [--jobs N] [--no-cache]
+"""
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from model.config import Config, get_config, PARAMETERS_CSV
+
+
+MODEL_DIR = Path(__file__).parent
+HIES_DIR = MODEL_DIR.parent / "data" / "hies2019" / "Dataset"
+
+# parameters.csv categories read only by downstream stages. Every other
+# category feeds the scenario engine, so it is part of every stage's slice.
+DOWNSTREAM_CATEGORIES = (
+    "MCA ",               # MCA Weights, MCA Scores *
+    "Transport ",         # Transport Fleet / EV / Energy / Costs / Health / CO2
+    "Financing",
+    "Distributional",
+    "Investment Phasing",
+    "Benchmarks",
+)
+
+
+# =============================================================================
+# STAGE DEFINITION
+# =============================================================================
+
+@dataclass
+class Stage:
+    """One node of the pipeline DAG."""
+    name: str
+    func: Callable                  # func(config, **{input: value}) -> value
+    inputs: Tuple[str, ...] = ()
+    categories: Tuple[str, ...] = ()  # downstream-only category prefixes also read
+    data_files: Tuple[Path, ...] = ()
+    show: Optional[Callable] = None   # show(results, config): summary printed after the log
+    cache: bool = True
+
+
+def _is_downstream(category: str) -> bool:
+    return category.startswith(DOWNSTREAM_CATEGORIES)
+
+
+def _parameter_rows(csv_path: Path = PARAMETERS_CSV) -> Dict[str, List[str]]:
+    """parameters.csv rows grouped by Category (comment rows dropped)."""
+    rows: Dict[str, List[str]] = {}
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or not row[0] or row[0].startswith("#") or row[0] == "Category":
+                continue
+            rows.setdefault(row[0].strip(), []).append("\x1f".join(row))
+    return rows
+
+
+def code_version(package_dir: Path = MODEL_DIR) -> str:
+    """Hash of every .py source in the model package."""
+    digest = hashlib.sha256()
+    for path in sorted(package_dir.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        digest.update(str(path.relative_to(package_dir)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _files_signature(paths: Tuple[Path, ...]) -> str:
+    """Size + mtime of each data file under the given paths (files or directories)."""
+    entries = []
+    for root in paths:
+        files = sorted(p for p in Path(root).rglob("*") if p.is_file()) if Path(root).is_dir() else [Path(root)]
+        for path in files:
+            if path.exists():
+                st = path.stat()
+                entries.append(f"{path}:{st.st_size}:{st.st_mtime_ns}")
+    return "\n".join(entries)
+
+
+# =============================================================================
+# STAGE FUNCTIONS
+# =============================================================================
+# Module-level so they can be shipped to pool workers.
+
+def _stage_scenarios(config: Config) -> dict:
+    from model.run_cba import run_scenarios
+    return run_scenarios(config)
+
+
+def _stage_cba(config: Config, scenarios: dict) -> dict:
+    from model.run_cba import run_cba
+    return run_cba(config, scenarios)
+
+
+def _stage_ddr(config: Config, scenarios: dict) -> dict:
+    from model.run_cba import run_ddr_comparison
+    return run_ddr_comparison(config, scenarios)
+
+
+def _stage_learning(config: Config) -> dict:
+    from model.run_cba import run_learning_curve_comparison
+    return run_learning_curve_comparison(config)
+
+
+def _stage_climate(config: Config) -> dict:
+    from model.run_cba import run_climate_scenario_comparison
+    return run_climate_scenario_comparison(config)
+
+
+def _stage_financing(config: Config, scenarios: dict, cba: dict) -> dict:
+    from model.financing_analysis import run_financing_analysis
+    return run_financing_analysis(config, scenarios, cba)
+
+
+def _stage_mca(config: Config, scenarios: dict, cba: dict) -> dict:
+    from model.run_cba import _build_cba_output
+    from model.cba.mca_analysis import run_mca, weight_sensitivity, smaa_analysis
+    summaries = {k: v["summary"] for k, v in scenarios.items()}
+    cba_output = _build_cba_output(cba, config, scenarios)
+    return {
+        "mca": run_mca(cba_output, summaries, config),
+        "weight_sensitivity": weight_sensitivity(cba_output, summaries, config),
+        "smaa": smaa_analysis(cba_output, summaries, config),
+    }
+
+
+def _stage_distributional(config: Config, scenarios: dict, cba: dict) -> Optional[dict]:
+    from model.run_cba import _build_cba_output
+    from model.distributional_analysis import run_distributional_analysis
+    summaries = {k: v["summary"] for k, v in scenarios.items()}
+    try:
+        return run_distributional_analysis(
+            config, _build_cba_output(cba, config, scenarios), summaries,
+            scenario_results={k: v["results"] for k, v in scenarios.items()},
+        )
+    except FileNotFoundError as e:
+        print(f"\n  ⚠ Distributional analysis skipped: {e}")
+        return None
+
+
+def _stage_transport(config: Config) -> dict:
+    from model.transport_analysis import run_transport_analysis
+    return run_transport_analysis(config)
+
+
+def _stage_report(
+    config: Config,
+    output_dir: str,
+    scenarios: dict,
+    cba: dict,
+    ddr: dict,
+    learning: dict,
+    climate: dict,
+    financing: dict,
+    mca: dict,
+    distributional: Optional[dict],
+    transport: dict,
+) -> str:
+    """Write every output file, reusing the upstream stage results."""
+    from model.run_cba import save_results
+    from model.financing_analysis import save_financing_results
+    from model.distributional_analysis import save_distributional_results
+    from model.transport_analysis import save_transport_results
+
+    mca_output = dict(mca["mca"], weight_sensitivity=mca["weight_sensitivity"], smaa=mca["smaa"])
+    save_results(scenarios, cba, output_dir, config, ddr_results=ddr, mca_output=mca_output)
+    save_financing_results(financing, output_dir)
+    if distributional is not None:
+        save_distributional_results(distributional, output_dir)
+    save_transport_results(transport, output_dir)
+
+    output_path = Path(output_dir)
+    with open(output_path / "learning_curve_results.json", "w") as f:
+        json.dump(learning, f, indent=2)
+    print(f"  Learning curve results saved to {output_path / 'learning_curve_results.json'}")
+    with open(output_path / "climate_scenario_results.json", "w") as f:
+        json.dump(climate, f, indent=2)
+    print(f"  Climate scenario results saved to {output_path / 'climate_scenario_results.json'}")
+    return str(output_path)
+
+
+def _show_cba(results: dict, config: Config) -> None:
+    from model.run_cba import (
+        print_scenario_summary, print_cba_summary, print_generation_trajectory,
+        print_solar_land_summary, print_sectoral_demand, print_resort_emissions_context,
+    )
+    scenario_data = results["scenarios"]
+    print_scenario_summary(scenario_data)
+    print_cba_summary(results["cba"], config)
+    print_generation_trajectory(scenario_data)
+    print_solar_land_summary(scenario_data, config)
+    print_sectoral_demand(scenario_data, config)
+    print_resort_emissions_context(config)
+
+
+def _show_financing(results: dict, config: Config) -> None:
+    from model.financing_analysis import print_financing_summary
+    print_financing_summary(results["financing"], config)
+
+
+def _show_mca(results: dict, config: Config) -> None:
+    from model.cba.mca_analysis import print_mca_results
+    print_mca_results(results["mca"]["mca"])
+
+
+def _show_distributional(results: dict, config: Config) -> None:
+    from model.distributional_analysis import print_distributional_summary
+    if results["distributional"] is not None:
+        print_distributional_summary(results["distributional"])
+
+
+def _show_transport(results: dict, config: Config) -> None:
+    from model.transport_analysis import print_transport_summary
+    print_transport_summary(results["transport"])
+
+
+def build_stages(output_dir: str = "outputs") -> List[Stage]:
+    """The run_cba workflow as pipeline stages, in report order."""
+    return [
+        Stage("scenarios", _stage_scenarios),
+        Stage("cba", _stage_cba, inputs=("scenarios",), show=_show_cba),
+        Stage("ddr", _stage_ddr, inputs=("scenarios",)),
+        Stage("learning", _stage_learning),
+        Stage("climate", _stage_climate),
+        Stage("financing", _stage_financing, inputs=("scenarios", "cba"),
+              categories=("Financing",), show=_show_financing),
+        Stage("mca", _stage_mca, inputs=("scenarios", "cba"),
+              categories=("MCA ", "Transport "), show=_show_mca),
+        Stage("distributional", _stage_distributional, inputs=("scenarios", "cba"),
+              data_files=(HIES_DIR,), show=_show_distributional),
+        Stage("transport", _stage_transport, categories=("Transport ",), show=_show_transport),
+        Stage("report", partial(_stage_report, output_dir=output_dir),
+              inputs=("scenarios", "cba", "ddr", "learning", "climate",
+                      "financing", "mca", "distributional", "transport"),
+              categories=DOWNSTREAM_CATEGORIES, cache=False),
+    ]
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def _execute(func: Callable, config: Config, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+    """Run one stage with its console output captured."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        value = func(config, **inputs)
+    return value, log.getvalue()
+
+
+class Pipeline:
+    """
+    Dependency-ordered stage runner with a content-addressed disk cache.
+
+    Stages must be listed in a valid topological order (each stage after
+    its inputs). The config is loaded from parameters.csv so that the
+    cache keys, which hash parameters.csv slices, describe it exactly.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        cache_dir: Optional[Path] = None,
+        jobs: int = 1,
+        use_cache: bool = True,
+        csv_path: Path = PARAMETERS_CSV,
+    ):
+        seen = set()
+        for stage in stages:
+            missing = [name for name in stage.inputs if name not in seen]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' listed before its inputs {missing}")
+            seen.add(stage.name)
+
+        self.stages = stages
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.jobs = (os.cpu_count() or 1) if jobs <= 0 else jobs
+        self.use_cache = use_cache and self.cache_dir is not None
+        self.csv_path = Path(csv_path)
+        self.config = get_config()
+        self.status: Dict[str, str] = {}
+
+    def stage_keys(self) -> Dict[str, str]:
+        """Cache key per stage: parameters slice + code version + data files + upstream keys."""
+        rows = _parameter_rows(self.csv_path)
+        version = code_version()
+        core = [line for cat in sorted(rows) if not _is_downstream(cat) for line in rows[cat]]
+        core_digest = hashlib.sha256("\n".join(core).encode()).hexdigest()
+
+        keys: Dict[str, str] = {}
+        for stage in self.stages:
+            extra = [line for cat in sorted(rows)
+                     if _is_downstream(cat) and cat.startswith(stage.categories) and stage.categories
+                     for line in rows[cat]]
+            digest = hashlib.sha256()
+            for part in (stage.name, version, core_digest, "\n".join(extra),
+                         _files_signature(stage.data_files),
+                         *(keys[name] for name in stage.inputs)):
+                digest.update(part.encode())
+                digest.update(b"\x1e")
+            keys[stage.name] = digest.hexdigest()[:20]
+        return keys
+
+    def _cache_path(self, stage: Stage, key: str) -> Path:
+        return self.cache_dir / stage.name / f"{key}.pkl"
+
+    def _load(self, stage: Stage, key: str) -> Optional[Tuple[Any, str]]:
+        if not (self.use_cache and stage.cache):
+            return None
+        path = self._cache_path(stage, key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _store(self, stage: Stage, key: str, entry: Tuple[Any, str]) -> None:
+        if not (self.use_cache and stage.cache):
+            return
+        path = self._cache_path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every stage whose key is not cached, wave by wave.
+
+        Returns:
+            Dict stage name -> stage output
+        """
+        keys = self.stage_keys()
+        entries: Dict[str, Tuple[Any, str]] = {}
+        results: Dict[str, Any] = {}
+        shown = 0
+        pending = list(self.stages)
+
+        pool = None
+        if self.jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=self.jobs)
+        try:
+            while pending:
+                ready = [s for s in pending if all(name in entries for name in s.inputs)]
+                to_run = []
+                for stage in ready:
+                    hit = self._load(stage, keys[stage.name])
+                    if hit is not None:
+                        entries[stage.name] = hit
+                        self.status[stage.name] = "cached"
+                    else:
+                        to_run.append(stage)
+
+                def inputs_of(stage):
+                    return {name: entries[name][0] for name in stage.inputs}
+
+                if pool is not None and len(to_run) > 1:
+                    futures = [pool.submit(_execute, s.func, self.config, inputs_of(s)) for s in to_run]
+                    fresh = [future.result() for future in futures]
+                else:
+                    fresh = [_execute(s.func, self.config, inputs_of(s)) for s in to_run]
+                for stage, entry in zip(to_run, fresh):
+                    entries[stage.name] = entry
+                    self.status[stage.name] = "ran"
+                    self._store(stage, keys[stage.name], entry)
+
+                pending = [s for s in pending if s.name not in entries]
+
+                # Replay logs in declaration order as far as stages are complete
+                while shown < len(self.stages) and self.stages[shown].name in entries:
+                    stage = self.stages[shown]
+                    value, log = entries[stage.name]
+                    results[stage.name] = value
+                    sys.stdout.write(log)
+                    if stage.show is not None:
+                        stage.show(results, self.config)
+                    shown += 1
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return results
+
+
+def main():
+    """Run the full CBA workflow through the stage pipeline."""
+    from model.run_cba import print_header
+
+    parser = argparse.ArgumentParser(description="Maldives Energy CBA Model (stage pipeline)")
+    parser.add_argument(
+        "--output", "-o",
+        default="outputs",
+        help="Output directory for results",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for independent stages (1 = sequential, 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Stage cache directory (default: OUTPUT/.pipeline_cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute every stage and leave the cache untouched",
+    )
+
+    args = parser.parse_args()
+    cache_dir = Path(args.cache_dir) if args.cache_dir else Path(args.output) / ".pipeline_cache"
+
+    print_header()
+    pipeline = Pipeline(build_stages(args.output), cache_dir=cache_dir,
+                        jobs=args.jobs, use_cache=not args.no_cache)
+    config = pipeline.config
+    print("Loading configuration...")
+    print(f"  Time horizon: {config.base_year}-{config.end_year}")
+    print(f"  Discount rate: {config.economics.discount_rate:.1%}")
+    print()
+    pipeline.run()
+
+    print("=" * 70)
+    print("  PIPELINE STAGES")
+    print("=" * 70)
+    for stage in pipeline.stages:
+        print(f"  {stage.name:<16} {pipeline.status.get(stage.name, '-')}")
+    print("=" * 70)
+    print("  MODEL RUN COMPLETE")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ energy transition scenarios:
 4. Islanded Green - Individual island RE systems (no grids)
 
 Usage:
-    python run_cba.py [--output OUTPUT_DIR] [--sensitivity] [--monte-carlo N]
+    python run_cba.py [--output OUTPUT_DIR] [--sensitivity] [--monte-carlo N] [--jobs N]
 
 Author: CBA Model Team
 Date: 2024
@@ -36,7 +36,7 @@ from model.scenarios.nearshore_solar import NearShoreSolarScenario
 from model.scenarios.maximum_re import MaximumREScenario
 from model.scenarios.lng_transition import LNGTransitionScenario
 from model.cba import CBACalculator, CBAComparison, SensitivityAnalysis
-from model.cba.mca_analysis import run_mca, print_mca_results, weight_sensitivity
+from model.cba.mca_analysis import run_mca, print_mca_results, weight_sensitivity, smaa_analysis
 from model.financing_analysis import (
     run_financing_analysis,
     print_financing_summary,
@@ -64,145 +64,120 @@ def print_header():
     print()
 
 
-def run_scenarios(config: Config) -> dict:
+# Scenario registry in report order: (key, class, progress label)
+SCENARIOS = [
+    ("bau", StatusQuoScenario, "BAU (Diesel)"),
+    ("full_integration", FullIntegrationScenario, "Full Integration (India + inter-island + RE)"),
+    ("national_grid", NationalGridScenario, "National Grid (inter-island + RE, no India)"),
+    ("islanded_green", IslandedGreenScenario, "Islanded Green (per-island RE, no grids)"),
+    ("nearshore_solar", NearShoreSolarScenario, "Near-Shore Solar (NG + uninhabited island solar)"),
+    ("maximum_re", MaximumREScenario, "Maximum RE (near-shore + floating solar)"),
+    ("lng_transition", LNGTransitionScenario, "LNG Transition (Malé LNG + outer island RE)"),
+]
+
+# Per-process state for pool workers: config and BAU results arrive once
+# through the pool initializer rather than with every task.
+_worker_config = None
+_worker_baseline = None
+
+
+def _init_scenario_worker(config: Config, baseline_results) -> None:
+    global _worker_config, _worker_baseline
+    _worker_config = config
+    _worker_baseline = baseline_results
+
+
+def _run_scenario(scenario_cls, config: Config = None, baseline_results=None):
+    """
+    Run one scenario and, when a baseline is given, its benefits vs BAU.
+    
+    Inside a pool worker, config and baseline default to the values shipped
+    by _init_scenario_worker().
+    """
+    config = config or _worker_config
+    baseline_results = baseline_results if baseline_results is not None else _worker_baseline
+    scenario = scenario_cls(config)
+    scenario.run()
+    summary = scenario.get_summary()
+    if baseline_results is not None:
+        # L4: populates annual_benefits incl. health
+        scenario.calculate_benefits_vs_baseline(baseline_results)
+    return scenario, summary
+
+
+def run_scenarios(config: Config, jobs: int = 1) -> dict:
     """
-    Run all four scenarios and return results.
+    Run all seven scenarios and return results.
+    
+    S1 (BAU) runs first in this process; S2-S7 are independent given the
+    BAU results and run either in sequence (jobs=1) or in a process pool of
+    `jobs` workers (jobs <= 0: one per CPU). Each worker receives config and
+    BAU results once. The returned dict is always in SCENARIOS order.
     """
     print("Running scenarios...")
     print("-" * 50)
     
+    def report(i, label, summary):
+        print(f"  {i}. {label}...")
+        print(f"     ✓ Complete (Total costs: ${summary['total_costs_million']:,.0f}M)")
+    
     # S1: BAU / Status Quo
-    print("  1. BAU (Diesel)...")
-    sq = StatusQuoScenario(config)
-    sq_results = sq.run()
-    sq_summary = sq.get_summary()
-    print(f"     ✓ Complete (Total costs: ${sq_summary['total_costs_million']:,.0f}M)")
-    
-    # S2: Full Integration
-    print("  2. Full Integration (India + inter-island + RE)...")
-    fi = FullIntegrationScenario(config)
-    fi_results = fi.run()
-    fi_summary = fi.get_summary()
-    print(f"     ✓ Complete (Total costs: ${fi_summary['total_costs_million']:,.0f}M)")
-    
-    # S3: National Grid
-    print("  3. National Grid (inter-island + RE, no India)...")
-    ng = NationalGridScenario(config)
-    ng_results = ng.run()
-    ng_summary = ng.get_summary()
-    print(f"     ✓ Complete (Total costs: ${ng_summary['total_costs_million']:,.0f}M)")
-    
-    # S4: Islanded Green
-    print("  4. Islanded Green (per-island RE, no grids)...")
-    ig = IslandedGreenScenario(config)
-    ig_results = ig.run()
-    ig_summary = ig.get_summary()
-    print(f"     ✓ Complete (Total costs: ${ig_summary['total_costs_million']:,.0f}M)")
-    
-    # S5: Near-Shore Solar
-    print("  5. Near-Shore Solar (NG + uninhabited island solar)...")
-    ns = NearShoreSolarScenario(config)
-    ns_results = ns.run()
-    ns_summary = ns.get_summary()
-    print(f"     ✓ Complete (Total costs: ${ns_summary['total_costs_million']:,.0f}M)")
-    
-    # S6: Maximum RE
-    print("  6. Maximum RE (near-shore + floating solar)...")
-    mx = MaximumREScenario(config)
-    mx_results = mx.run()
-    mx_summary = mx.get_summary()
-    print(f"     ✓ Complete (Total costs: ${mx_summary['total_costs_million']:,.0f}M)")
-    
-    # S7: LNG Transition
-    print("  7. LNG Transition (Malé LNG + outer island RE)...")
-    lng = LNGTransitionScenario(config)
-    lng_results = lng.run()
-    lng_summary = lng.get_summary()
-    print(f"     ✓ Complete (Total costs: ${lng_summary['total_costs_million']:,.0f}M)")
-    
-    # L4: Calculate benefits vs BAU baseline (populates annual_benefits incl. health)
-    print("  Calculating benefits vs BAU baseline...")
-    fi.calculate_benefits_vs_baseline(sq_results)
-    ng.calculate_benefits_vs_baseline(sq_results)
-    ig.calculate_benefits_vs_baseline(sq_results)
-    ns.calculate_benefits_vs_baseline(sq_results)
-    mx.calculate_benefits_vs_baseline(sq_results)
-    lng.calculate_benefits_vs_baseline(sq_results)
-    print(f"     ✓ Benefits calculated (fuel savings, emissions, health)")
+    (bau_key, bau_cls, bau_label), alternatives = SCENARIOS[0], SCENARIOS[1:]
+    sq, sq_summary = _run_scenario(bau_cls, config)
+    report(1, bau_label, sq_summary)
+    
+    # S2-S7, with benefits vs BAU baseline computed alongside each run
+    if jobs is not None and jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs or 1, len(alternatives))
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_scenario_worker,
+            initargs=(config, sq.results),
+        ) as pool:
+            runs = list(pool.map(_run_scenario, [cls for _, cls, _ in alternatives]))
+    else:
+        runs = [_run_scenario(cls, config, sq.results) for _, cls, _ in alternatives]
+    
+    scenario_data = {bau_key: {"scenario": sq, "results": sq.results, "summary": sq_summary}}
+    for i, ((key, _, label), (scenario, summary)) in enumerate(zip(alternatives, runs), start=2):
+        report(i, label, summary)
+        scenario_data[key] = {
+            "scenario": scenario,
+            "results": scenario.results,
+            "summary": summary,
+        }
+    print(f"     ✓ Benefits vs BAU calculated (fuel savings, emissions, health)"
+          + (f" [{jobs} workers]" if jobs > 1 else ""))
     
     print()
     
-    return {
-        "bau": {
-            "scenario": sq,
-            "results": sq_results,
-            "summary": sq_summary,
-        },
-        "full_integration": {
-            "scenario": fi,
-            "results": fi_results,
-            "summary": fi_summary,
-        },
-        "national_grid": {
-            "scenario": ng,
-            "results": ng_results,
-            "summary": ng_summary,
-        },
-        "islanded_green": {
-            "scenario": ig,
-            "results": ig_results,
-            "summary": ig_summary,
-        },
-        "nearshore_solar": {
-            "scenario": ns,
-            "results": ns_results,
-            "summary": ns_summary,
-        },
-        "maximum_re": {
-            "scenario": mx,
-            "results": mx_results,
-            "summary": mx_summary,
-        },
-        "lng_transition": {
-            "scenario": lng,
-            "results": lng_results,
-            "summary": lng_summary,
-        },
-    }
+    return scenario_data
 
 
 def run_cba(config: Config, scenario_data: dict) -> dict:
     """
-    Run CBA calculations for 6 scenarios.
-    Returns both per-scenario NPV results and the full CBAComparison object.
+    Run CBA calculations for every scenario in scenario_data.
+    Returns both per-scenario NPV results and the full ScenarioComparison object.
     """
     print("Running CBA calculations...")
     print("-" * 50)
     
     calculator = CBACalculator(config)
     
-    # Use compare_all_scenarios to get full incremental analysis with IRR/payback
-    comparison = calculator.compare_all_scenarios(
-        status_quo_results=scenario_data["bau"]["results"],
-        green_results=scenario_data["national_grid"]["results"],
-        one_grid_results=scenario_data["full_integration"]["results"],
-        islanded_green_results=scenario_data["islanded_green"]["results"],
-        nearshore_solar_results=scenario_data["nearshore_solar"]["results"],
-        maximum_re_results=scenario_data["maximum_re"]["results"],
-        lng_transition_results=scenario_data["lng_transition"]["results"],
+    # One vectorised pass over every scenario: NPVs plus incremental
+    # analysis (IRR/payback/BCR) vs BAU and FI vs NG
+    comparison = calculator.compare(
+        {name: data["results"] for name, data in scenario_data.items()},
+        baseline="bau",
+        pairs=[("national_grid", "full_integration")],
     )
     
     # Build results dict for backwards compatibility
     results = {}
-    for name, npv_obj in [
-        ("bau", comparison.bau),
-        ("full_integration", comparison.full_integration),
-        ("national_grid", comparison.national_grid),
-        ("islanded_green", comparison.islanded_green),
-        ("nearshore_solar", comparison.nearshore_solar),
-        ("maximum_re", comparison.maximum_re),
-        ("lng_transition", comparison.lng_transition),
-    ]:
+    for name, npv_obj in comparison.npv.items():
         results[name] = {
             "npv_result": npv_obj,
             "summary": scenario_data[name]["summary"],
@@ -213,7 +188,7 @@ def run_cba(config: Config, scenario_data: dict) -> dict:
     
     print(f"  ✓ NPV calculations complete")
     print(f"  ✓ Incremental analysis complete (IRR, payback, BCR)")
-    print(f"  ✓ All 7 scenarios analyzed")
+    print(f"  ✓ All {len(comparison.keys)} scenarios analyzed")
     print()
     
     return results
@@ -528,16 +503,20 @@ def run_ddr_comparison(config: Config, scenario_data: dict) -> dict:
     print(f"  {'Scenario':<22} {'Constant 6%':>14} {'DDR (3.5%→)':>14} {'Δ PV Costs':>14} {'Δ %':>8}")
     print("  " + "-" * 74)
     
+    econ = config.economics
+    ddr_schedule = (econ.ddr_rate_0_30, econ.ddr_rate_31_75, econ.ddr_rate_76_125)
+    
     for name in scenario_names:
         if name not in scenario_data:
             continue
         results = scenario_data[name]["results"]
         
-        # Constant rate NPV (already computed, but re-compute for consistency)
-        npv_constant = calc.calculate_npv(results)
-        
-        # DDR NPV
-        npv_ddr = calc.calculate_npv_declining(results)
+        # Constant-rate and DDR NPVs from one discount sweep over the cash flows
+        npv_constant, npv_ddr = calc.calculate_npv_sweep(
+            results,
+            discount_rates=[econ.discount_rate],
+            ddr_schedules=[ddr_schedule],
+        ).to_npv_results()
         
         delta = npv_ddr.pv_total_costs - npv_constant.pv_total_costs
         pct = (delta / npv_constant.pv_total_costs * 100) if npv_constant.pv_total_costs != 0 else 0
@@ -825,14 +804,7 @@ def _build_cba_output(cba_results: dict, config: Config, scenario_data: dict) ->
         }
     comparison = cba_results.get("_comparison")
     if comparison:
-        for label, incr in [
-            ("full_integration", comparison.fi_vs_bau),
-            ("national_grid", comparison.ng_vs_bau),
-            ("islanded_green", comparison.ig_vs_bau),
-            ("nearshore_solar", comparison.ns_vs_bau),
-            ("maximum_re", comparison.mx_vs_bau),
-            ("lng_transition", comparison.lng_vs_bau),
-        ]:
+        for label, incr in comparison.vs_baseline().items():
             cba_output["incremental_vs_bau"][label] = {
                 "npv_savings": incr.npv,
                 "additional_capex": incr.incremental_pv_capex,
@@ -849,8 +821,20 @@ def _build_cba_output(cba_results: dict, config: Config, scenario_data: dict) ->
     return cba_output
 
 
-def save_results(scenario_data: dict, cba_results: dict, output_dir: str, config: Config):
-    """Save results to files."""
+def save_results(
+    scenario_data: dict,
+    cba_results: dict,
+    output_dir: str,
+    config: Config,
+    ddr_results: dict = None,
+    mca_output: dict = None,
+):
+    """
+    Save results to files.
+    
+    ddr_results and mca_output (incl. "weight_sensitivity" and "smaa") are recomputed
+    here unless the caller already has them, as the stage pipeline does.
+    """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
@@ -886,17 +870,10 @@ def save_results(scenario_data: dict, cba_results: dict, output_dir: str, config
             "lcoe": npv.lcoe_usd_per_kwh,
         }
     
-    # Serialize full incremental analysis from CBAComparison (includes IRR, payback, BCR)
+    # Serialize full incremental analysis from ScenarioComparison (includes IRR, payback, BCR)
     comparison = cba_results.get("_comparison")
     if comparison:
-        for label, incr in [
-            ("full_integration", comparison.fi_vs_bau),
-            ("national_grid", comparison.ng_vs_bau),
-            ("islanded_green", comparison.ig_vs_bau),
-            ("nearshore_solar", comparison.ns_vs_bau),
-            ("maximum_re", comparison.mx_vs_bau),
-            ("lng_transition", comparison.lng_vs_bau),
-        ]:
+        for label, incr in comparison.vs_baseline().items():
             cba_output["incremental_vs_bau"][label] = {
                 "npv_savings": incr.npv,
                 "additional_capex": incr.incremental_pv_capex,
@@ -914,13 +891,14 @@ def save_results(scenario_data: dict, cba_results: dict, output_dir: str, config
             }
         
         # Also save FI vs NG incremental
+        fi_vs_ng = comparison.incremental[("national_grid", "full_integration")]
         cba_output["incremental_fi_vs_ng"] = {
-            "npv_savings": comparison.fi_vs_ng.npv,
-            "additional_capex": comparison.fi_vs_ng.incremental_pv_capex,
-            "fuel_savings": comparison.fi_vs_ng.pv_fuel_savings,
-            "bcr": comparison.fi_vs_ng.bcr,
-            "irr": comparison.fi_vs_ng.irr,
-            "payback_years": comparison.fi_vs_ng.payback_years,
+            "npv_savings": fi_vs_ng.npv,
+            "additional_capex": fi_vs_ng.incremental_pv_capex,
+            "fuel_savings": fi_vs_ng.pv_fuel_savings,
+            "bcr": fi_vs_ng.bcr,
+            "irr": fi_vs_ng.irr,
+            "payback_years": fi_vs_ng.payback_years,
         }
     
     # Add recommendation
@@ -1148,16 +1126,18 @@ def save_results(scenario_data: dict, cba_results: dict, output_dir: str, config
     }
     
     # P1: Declining discount rate comparison
-    ddr_results = run_ddr_comparison(config, scenario_data)
+    if ddr_results is None:
+        ddr_results = run_ddr_comparison(config, scenario_data)
     cba_output["declining_discount_rate"] = ddr_results
     
     with open(output_path / "cba_results.json", "w") as f:
         json.dump(cba_output, f, indent=2)
     
     # L17: Save MCA results
-    mca_output = run_mca(cba_output, summaries, config)
-    ws = weight_sensitivity(cba_output, summaries, config)
-    mca_output["weight_sensitivity"] = ws
+    if mca_output is None:
+        mca_output = run_mca(cba_output, summaries, config)
+        mca_output["weight_sensitivity"] = weight_sensitivity(cba_output, summaries, config)
+        mca_output["smaa"] = smaa_analysis(cba_output, summaries, config)
     with open(output_path / "mca_results.json", "w") as f:
         json.dump(mca_output, f, indent=2)
     
@@ -1183,6 +1163,12 @@ def main():
         default=0,
         help="Number of Monte Carlo iterations (0 to skip)",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for scenarios S2-S7 (1 = sequential, 0 = one per CPU)",
+    )
     
     args = parser.parse_args()
     
@@ -1197,7 +1183,7 @@ def main():
     print()
     
     # Run scenarios
-    scenario_data = run_scenarios(config)
+    scenario_data = run_scenarios(config, jobs=args.jobs)
     
     # Run CBA
     cba_results = run_cba(config, scenario_data)
@@ -1233,7 +1219,8 @@ def main():
     # L15: Distributional analysis (uses HIES 2019 microdata)
     try:
         dist_results = run_distributional_analysis(
-            config, cba_output_for_mca, summaries
+            config, cba_output_for_mca, summaries,
+            scenario_results={k: v["results"] for k, v in scenario_data.items()},
         )
         print_distributional_summary(dist_results)
     except FileNotFoundError as e:
@@ -7,6 +7,7 @@ to characterize uncertainty in scenario rankings.
 
 Usage:
     python -m model.run_monte_carlo
+    python -m model.run_monte_carlo --mca    # also MCA rank probabilities (L17)
 """
 
 import sys
@@ -30,8 +31,21 @@ from model.scenarios.islanded_green import IslandedGreenScenario
 from model.scenarios.nearshore_solar import NearShoreSolarScenario
 from model.scenarios.maximum_re import MaximumREScenario
 from model.scenarios.lng_transition import LNGTransitionScenario
-from model.cba import CBACalculator
+from model.cba import CBACalculator, irr_batch, payback_periods
 from model.config import SENSITIVITY_PARAMS
+from model.cba.mca_analysis import (
+    MC_MCA_DRAWS_FILE,
+    mca_metric_draws,
+    mca_summary_fields,
+    run_mca_monte_carlo,
+    print_mca_mc_summary,
+)
+from model.distributional_analysis import (
+    MC_LCOE_DRAWS_FILE,
+    run_distributional_monte_carlo,
+    print_distributional_mc_summary,
+    save_distributional_mc_results,
+)
 
 
 def _build_distributions():
@@ -315,36 +329,103 @@ def sample_config(base_config: Config, param_distributions: dict, presampled_val
     return config, params
 
 
-def run_iteration(config: Config) -> Dict[str, float]:
-    """Run all 7 scenarios with given config and return NPVs."""
-    bau = StatusQuoScenario(config).run()
-    fi = FullIntegrationScenario(config).run()
-    ng = NationalGridScenario(config).run()
-    ig = IslandedGreenScenario(config).run()
-    ns = NearShoreSolarScenario(config).run()
-    mx = MaximumREScenario(config).run()
-    lng = LNGTransitionScenario(config).run()
+# Alternatives compared against BAU, in reporting order
+ALTERNATIVES = (
+    ("full_integration", FullIntegrationScenario),
+    ("national_grid", NationalGridScenario),
+    ("islanded_green", IslandedGreenScenario),
+    ("nearshore_solar", NearShoreSolarScenario),
+    ("maximum_re", MaximumREScenario),
+    ("lng_transition", LNGTransitionScenario),
+)
+
+
+def run_iteration(
+    config: Config,
+    cash_flows: Dict[str, List[Dict[str, np.ndarray]]] = None,
+    lcoes: Dict[str, List[float]] = None,
+    mca_metrics: Dict[str, List[Dict[str, float]]] = None,
+) -> Dict[str, float]:
+    """Run all 7 scenarios with given config and return NPVs.
+    
+    If `cash_flows` is given, each alternative's incremental streams vs BAU
+    (CBACalculator.incremental_cash_flows) are appended to cash_flows[key],
+    so EIRR and payback can be solved for every draw in one batched call
+    after the loop. Benefit streams count there only where BAU carries them
+    too, and BAU never does, so the streams are cost and fuel savings only
+    and the per-scenario benefits are not computed for them.
+    
+    If `lcoes` is given, each scenario's LCOE ($/kWh) is appended to
+    lcoes[key] for the distributional Monte Carlo.
+    
+    If `mca_metrics` is given, each scenario's MCA inputs (the
+    MCA_SUMMARY_FIELDS and, for alternatives, NPV savings vs BAU with
+    benefits included, as in run_cba) are appended to mca_metrics[key].
+    Benefits are then computed before the NPV, so the one NPVResult
+    serves both the cost ranking and the incremental analysis.
+    """
+    bau_scenario = StatusQuoScenario(config)
+    bau = bau_scenario.run()
     
     calc = CBACalculator(config)
     # F-01 fix: Use economic cost (financial + emission costs) so SCC
     # parameter variation affects scenario rankings in Monte Carlo.
-    bau_r = calc.calculate_npv(bau);   bau_npv = bau_r.pv_total_costs + bau_r.pv_emission_costs
-    fi_r  = calc.calculate_npv(fi);    fi_npv  = fi_r.pv_total_costs  + fi_r.pv_emission_costs
-    ng_r  = calc.calculate_npv(ng);    ng_npv  = ng_r.pv_total_costs  + ng_r.pv_emission_costs
-    ig_r  = calc.calculate_npv(ig);    ig_npv  = ig_r.pv_total_costs  + ig_r.pv_emission_costs
-    ns_r  = calc.calculate_npv(ns);    ns_npv  = ns_r.pv_total_costs  + ns_r.pv_emission_costs
-    mx_r  = calc.calculate_npv(mx);    mx_npv  = mx_r.pv_total_costs  + mx_r.pv_emission_costs
-    lng_r = calc.calculate_npv(lng);   lng_npv = lng_r.pv_total_costs + lng_r.pv_emission_costs
-    
-    return {
-        "bau": bau_npv,
-        "full_integration": fi_npv,
-        "national_grid": ng_npv,
-        "islanded_green": ig_npv,
-        "nearshore_solar": ns_npv,
-        "maximum_re": mx_npv,
-        "lng_transition": lng_npv,
-    }
+    bau_r = calc.calculate_npv(bau)
+    npvs = {"bau": bau_r.pv_total_costs + bau_r.pv_emission_costs}
+    if lcoes is not None:
+        lcoes.setdefault("bau", []).append(bau_r.lcoe_usd_per_kwh)
+    if mca_metrics is not None:
+        mca_metrics.setdefault("bau", []).append(mca_summary_fields(bau))
+    
+    for key, scenario_cls in ALTERNATIVES:
+        scenario = scenario_cls(config)
+        results = scenario.run()
+        if mca_metrics is not None:
+            # Benefit streams leave the cost PVs unchanged; they are only
+            # needed for the MCA's NPV savings.
+            scenario.calculate_benefits_vs_baseline(bau)
+        npv_r = calc.calculate_npv(results)
+        npvs[key] = npv_r.pv_total_costs + npv_r.pv_emission_costs
+        if lcoes is not None:
+            lcoes.setdefault(key, []).append(npv_r.lcoe_usd_per_kwh)
+        
+        if cash_flows is not None:
+            cash_flows.setdefault(key, []).append(calc.incremental_cash_flows(bau, results))
+        if mca_metrics is not None:
+            incr = calc.calculate_incremental(bau, results, bau_r, npv_r)
+            mca_metrics.setdefault(key, []).append({"npv_savings": incr.npv, **mca_summary_fields(results)})
+    
+    return npvs
+
+
+def summarise_eirr_payback(cash_flows: Dict[str, List[Dict[str, np.ndarray]]]) -> Dict:
+    """
+    EIRR and fuel-only payback distributions across all draws.
+    
+    Stacks each alternative's per-draw cash flows into a (draws × years)
+    matrix and solves all draws with one irr_batch / payback_periods call.
+    """
+    summary = {}
+    for key, rows in cash_flows.items():
+        net = np.vstack([r["net"] for r in rows])
+        investment = np.vstack([r["investment"] for r in rows])
+        fuel_savings = np.vstack([r["fuel_savings"] for r in rows])
+        
+        entry = {}
+        for metric, values in (
+            ("eirr", irr_batch(net)),
+            ("payback_years", payback_periods(investment, fuel_savings)),
+        ):
+            defined = values[~np.isnan(values)]
+            entry[metric] = {
+                "share_defined": len(defined) / len(values),
+                "mean": float(defined.mean()) if len(defined) else None,
+                "p5": float(np.percentile(defined, 5)) if len(defined) else None,
+                "p50": float(np.percentile(defined, 50)) if len(defined) else None,
+                "p95": float(np.percentile(defined, 95)) if len(defined) else None,
+            }
+        summary[key] = entry
+    return summary
 
 
 def rank_scenarios(npvs: Dict[str, float]) -> str:
@@ -363,7 +444,16 @@ def percentile(data: List[float], p: float) -> float:
     return sorted_data[f] * (c - k) + sorted_data[c] * (k - f)
 
 
-def main():
+def main(mca: bool = False):
+    """
+    Run the Monte Carlo simulation.
+    
+    Args:
+        mca: Also collect each draw's MCA inputs and compute MCA rank
+            probabilities over draws × sampled weights (L17). Off by
+            default: the extra benefit and incremental calculations per
+            draw roughly double the run time.
+    """
     print("=" * 70)
     print("  MALDIVES ENERGY CBA - MONTE CARLO SIMULATION (7 SCENARIOS)")
     print("=" * 70)
@@ -388,6 +478,9 @@ def main():
     lng_results = []
     rankings = []
     all_params = []
+    cash_flows = {}  # per-draw incremental streams for batched EIRR/payback
+    lcoe_draws = {}  # per-draw LCOEs for distributional Monte Carlo
+    mca_draws = {} if mca else None  # per-draw MCA inputs for MCA rank probabilities
     
     # Item-6: Convergence diagnostics — running mean of FI NPV
     convergence_trace = []  # (iteration, running_mean_fi, running_std_fi)
@@ -418,7 +511,7 @@ def main():
         
         # F-03: Use pre-sampled (correlated) parameter draws
         config, params = sample_config(base_config, param_distributions, presampled_values=presampled[i])
-        npvs = run_iteration(config)
+        npvs = run_iteration(config, cash_flows, lcoe_draws, mca_draws)
         
         bau_results.append(npvs["bau"])
         fi_results.append(npvs["full_integration"])
@@ -518,6 +611,19 @@ def main():
         prob_beats = sum(1 for b, a in zip(bau_results, results) if a < b) / len(bau_results) * 100
         print(f"  {scenario_labels[key]:<25}: {prob_beats:>5.1f}%")
     
+    # EIRR / payback distributions — one batched solve per alternative
+    eirr_payback = summarise_eirr_payback(cash_flows)
+    print("\n--- EIRR and Fuel-Only Payback vs BAU ---")
+    print(f"{'Scenario':<25} {'EIRR P5':>9} {'P50':>9} {'P95':>9} {'Payback P50':>13}")
+    for key, entry in eirr_payback.items():
+        eirr = entry["eirr"]
+        payback = entry["payback_years"]
+        eirr_txt = (
+            f"{eirr['p5']:>9.1%} {eirr['p50']:>9.1%} {eirr['p95']:>9.1%}"
+            if eirr["p50"] is not None else f"{'N/A':>9} {'N/A':>9} {'N/A':>9}"
+        )
+        payback_txt = f"{payback['p50']:>10.0f} yr" if payback["p50"] is not None else f"{'N/A':>13}"
+        print(f"  {scenario_labels[key]:<23} {eirr_txt} {payback_txt}")
     
     # Save results
     output_dir = Path(__file__).parent.parent / "outputs"  # H-I-01: relative to script, not CWD
@@ -561,6 +667,7 @@ def main():
             "maximum_re": sum(1 for b, a in zip(bau_results, mx_results) if a < b) / len(bau_results),
             "lng_transition": sum(1 for b, a in zip(bau_results, lng_results) if a < b) / len(bau_results),
         },
+        "eirr_payback_vs_bau": eirr_payback,
         "savings_fi_vs_bau": {
             "mean": mean_savings,
             "p5": p5_savings,
@@ -602,6 +709,30 @@ def main():
     
     print(f"\nResults saved to {output_dir / 'monte_carlo_results.json'}")
     
+    # L17: MCA rank probabilities over the draws × sampled criterion weights
+    if mca:
+        mca_scenarios, mca_criteria, mca_raw = mca_metric_draws(mca_draws, base_config)
+        np.savez(
+            output_dir / MC_MCA_DRAWS_FILE,
+            raw=mca_raw, scenarios=np.array(mca_scenarios), criteria=np.array(mca_criteria),
+        )
+        mca_mc = run_mca_monte_carlo(mca_raw, mca_scenarios, mca_criteria, base_config)
+        print_mca_mc_summary(mca_mc)
+        with open(output_dir / "mca_mc_results.json", "w") as f:
+            json.dump(mca_mc, f, indent=2)
+        print(f"MCA rank probabilities saved to {output_dir / 'mca_mc_results.json'}")
+    
+    # L15: Propagate the LCOE draws into distributional outcomes (HIES 2019)
+    lcoe_path = output_dir / MC_LCOE_DRAWS_FILE
+    np.savez(lcoe_path, **{k: np.asarray(v) for k, v in lcoe_draws.items()})
+    print(f"Per-draw LCOEs saved to {lcoe_path}")
+    try:
+        dist_mc = run_distributional_monte_carlo(lcoe_draws)
+        print_distributional_mc_summary(dist_mc)
+        save_distributional_mc_results(dist_mc, str(output_dir))
+    except FileNotFoundError as e:
+        print(f"\n  ⚠ Distributional Monte Carlo skipped: {e}")
+    
     print()
     print("=" * 70)
     print("  MONTE CARLO SIMULATION COMPLETE")
@@ -609,4 +740,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(mca="--mca" in sys.argv)
@@ -10,7 +10,11 @@ This script runs the CBA for all 7 scenarios across 3 time horizons:
 This allows comparison of how results change with different planning horizons.
 
 Usage:
-    python run_multi_horizon.py [--output OUTPUT_DIR]
+    python run_multi_horizon.py [--output OUTPUT_DIR] [--reuse-prefix]
+
+--reuse-prefix runs each scenario once on the 50-year horizon and derives
+the 20- and 30-year results by truncation (deployment up to a year does not
+depend on the horizon end); NPV, salvage and LCOE are recomputed per horizon.
 
 Author: CBA Model Team
 Date: 2026
@@ -34,6 +38,7 @@ from model.config import (
     END_YEAR_20, END_YEAR_30, END_YEAR_50,
     TIME_HORIZONS
 )
+from model.scenarios import ScenarioResults
 from model.scenarios.status_quo import StatusQuoScenario
 from model.scenarios.green_transition import NationalGridScenario
 from model.scenarios.one_grid import FullIntegrationScenario
@@ -139,21 +144,16 @@ def create_config_for_horizon(horizon_key: str) -> Config:
     return config
 
 
-def run_scenario_for_horizon(
-    scenario_key: str, 
+def summarize_horizon(
+    scenario_key: str,
     horizon_key: str,
-    config: Config
+    config: Config,
+    results: ScenarioResults,
 ) -> HorizonResult:
-    """Run a single scenario for a single horizon."""
-    label, ScenarioClass = SCENARIO_CLASSES[scenario_key]
+    """HorizonResult for scenario results covering exactly config.time_horizon."""
     horizon = HORIZONS[horizon_key]
     
-    # Run scenario
-    scenario = ScenarioClass(config)
-    results = scenario.run()
-    summary = scenario.get_summary()
-    
-    # Calculate NPV
+    # Calculate NPV (salvage at config.end_year, annuity and LCOE for this horizon)
     calculator = CBACalculator(config)
     npv = calculator.calculate_npv(results)
     
@@ -161,18 +161,39 @@ def run_scenario_for_horizon(
         scenario_name=scenario_key,
         horizon_name=horizon_key,
         years=horizon["years"],
-        total_costs_million=summary["total_costs_million"],
+        total_costs_million=results.get_total_costs() / 1e6,
         pv_total_costs_million=npv.pv_total_costs / 1e6,
         pv_capex_million=npv.pv_capex / 1e6,
         pv_fuel_million=npv.pv_fuel / 1e6,
         lcoe_usd_kwh=npv.lcoe_usd_per_kwh,
-        total_emissions_mtco2=summary["total_emissions_mtco2"],
-        final_re_share=summary["final_re_share"],
+        total_emissions_mtco2=results.get_total_emissions() / 1e6,
+        final_re_share=float(results.generation_mix.column("re_share")[-1]),
     )
 
 
-def run_all_horizons() -> Dict[str, Dict[str, HorizonResult]]:
-    """Run all scenarios across all horizons."""
+def run_scenario_for_horizon(
+    scenario_key: str, 
+    horizon_key: str,
+    config: Config
+) -> HorizonResult:
+    """Run a single scenario for a single horizon."""
+    _, ScenarioClass = SCENARIO_CLASSES[scenario_key]
+    results = ScenarioClass(config).run()
+    return summarize_horizon(scenario_key, horizon_key, config, results)
+
+
+def run_all_horizons(reuse_prefix: bool = False) -> Dict[str, Dict[str, HorizonResult]]:
+    """
+    Run all scenarios across all horizons.
+    
+    Args:
+        reuse_prefix: Run each scenario once on the longest horizon and derive
+            the shorter horizons by truncating its results. Scenarios flagged
+            horizon_dependent are still run separately for every horizon.
+    """
+    if reuse_prefix:
+        return _run_all_horizons_by_prefix()
+    
     results = {}
     
     for horizon_key in HORIZONS:
@@ -190,6 +211,36 @@ def run_all_horizons() -> Dict[str, Dict[str, HorizonResult]]:
     return results
 
 
+def _run_all_horizons_by_prefix() -> Dict[str, Dict[str, HorizonResult]]:
+    """run_all_horizons(reuse_prefix=True): one long run per scenario."""
+    configs = {h_key: create_config_for_horizon(h_key) for h_key in HORIZONS}
+    longest = max(configs, key=lambda h_key: configs[h_key].end_year)
+    results = {h_key: {} for h_key in HORIZONS}
+    
+    print(f"\n--- Running {HORIZONS[longest]['label']} (shorter horizons by truncation) ---")
+    for scenario_key, (label, ScenarioClass) in SCENARIO_CLASSES.items():
+        print(f"  {label}...", end=" ", flush=True)
+        if ScenarioClass.horizon_dependent:
+            long_results = None
+        else:
+            long_results = ScenarioClass(configs[longest]).run()
+        
+        for h_key, config in configs.items():
+            if long_results is None:
+                result = run_scenario_for_horizon(scenario_key, h_key, config)
+            else:
+                scenario_results = (
+                    long_results if h_key == longest else long_results.truncated(config.end_year)
+                )
+                result = summarize_horizon(scenario_key, h_key, config, scenario_results)
+            results[h_key][scenario_key] = result
+        
+        pv_costs = " / ".join(f"${results[h][scenario_key].pv_total_costs_million:,.0f}M" for h in HORIZONS)
+        print(f"✓ (PV Costs: {pv_costs})")
+    
+    return results
+
+
 def print_comparison_table(results: Dict[str, Dict[str, HorizonResult]]):
     """Print comparison table across horizons."""
     
@@ -384,6 +435,11 @@ def main():
         default="outputs",
         help="Output directory for results",
     )
+    parser.add_argument(
+        "--reuse-prefix",
+        action="store_true",
+        help="Run each scenario once on the longest horizon and truncate for shorter ones",
+    )
     args = parser.parse_args()
     
     # Print header
@@ -391,7 +447,7 @@ def main():
     
     # Run all horizons
     print("Running scenarios across all horizons...")
-    results = run_all_horizons()
+    results = run_all_horizons(reuse_prefix=args.reuse_prefix)
     
     # Print results
     print_comparison_table(results)
@@ -30,6 +30,7 @@ from model.scenarios.islanded_green import IslandedGreenScenario
 from model.scenarios.nearshore_solar import NearShoreSolarScenario
 from model.scenarios.maximum_re import MaximumREScenario
 from model.scenarios.lng_transition import LNGTransitionScenario
+from model.scenarios.cache import get_scenario_cache
 from model.cba import CBACalculator, SensitivityAnalysis
 
 
@@ -43,25 +44,30 @@ def print_header():
 
 
 def run_scenario_with_config(config: Config, scenario_name: str):
-    """Run a specific scenario with given config."""
+    """
+    Run a specific scenario with given config.
+    
+    Served from the process-wide scenario cache: a one-way variation of a
+    parameter the scenario never reads reuses the base-case run.
+    """
     if scenario_name == "bau":
-        scenario = StatusQuoScenario(config)
+        scenario_cls = StatusQuoScenario
     elif scenario_name == "full_integration":
-        scenario = FullIntegrationScenario(config)
+        scenario_cls = FullIntegrationScenario
     elif scenario_name == "national_grid":
-        scenario = NationalGridScenario(config)
+        scenario_cls = NationalGridScenario
     elif scenario_name == "islanded_green":
-        scenario = IslandedGreenScenario(config)
+        scenario_cls = IslandedGreenScenario
     elif scenario_name == "nearshore_solar":
-        scenario = NearShoreSolarScenario(config)
+        scenario_cls = NearShoreSolarScenario
     elif scenario_name == "maximum_re":
-        scenario = MaximumREScenario(config)
+        scenario_cls = MaximumREScenario
     elif scenario_name == "lng_transition":
-        scenario = LNGTransitionScenario(config)
+        scenario_cls = LNGTransitionScenario
     else:
         raise ValueError(f"Unknown scenario: {scenario_name}")
     
-    return scenario.run()
+    return get_scenario_cache().run(scenario_cls, config)
 
 
 def modify_config(base_config: Config, param_name: str, value: float) -> Config:
@@ -268,6 +274,11 @@ def _economic_cost(calc: CBACalculator, results) -> float:
     return npv_r.pv_total_costs + npv_r.pv_emission_costs
 
 
+def _economic_cost_sweep(calc: CBACalculator, results, rates: List[float]) -> List[float]:
+    """Economic cost (F-01) of one scenario at several constant discount rates."""
+    return calc.calculate_npv_sweep(results, discount_rates=rates).pv_economic_costs.tolist()
+
+
 def run_one_way_sensitivity(base_config: Config) -> Dict:
     """
     Run one-way sensitivity for all parameters.
@@ -318,43 +329,55 @@ def run_one_way_sensitivity(base_config: Config) -> Dict:
     for param_key, param_info in PARAMETERS.items():
         print(f"  Testing: {param_info['name']}...")
         
-        # Low value
-        config_low = modify_config(base_config, param_key, param_info["low"])
-        bau_low = run_scenario_with_config(config_low, "bau")
-        fi_low = run_scenario_with_config(config_low, "full_integration")
-        ng_low = run_scenario_with_config(config_low, "national_grid")
-        ig_low = run_scenario_with_config(config_low, "islanded_green")
-        ns_low = run_scenario_with_config(config_low, "nearshore_solar")
-        mx_low = run_scenario_with_config(config_low, "maximum_re")
-        lng_low = run_scenario_with_config(config_low, "lng_transition")
+        if param_key == "discount_rate":
+            # Discounting is post-processing on the cash flows: sweep the
+            # base-case runs instead of re-running every scenario twice
+            rates = [param_info["low"], param_info["high"]]
+            bau_npv_low, bau_npv_high = _economic_cost_sweep(calc, bau_base, rates)
+            fi_npv_low, fi_npv_high = _economic_cost_sweep(calc, fi_base, rates)
+            ng_npv_low, ng_npv_high = _economic_cost_sweep(calc, ng_base, rates)
+            ig_npv_low, ig_npv_high = _economic_cost_sweep(calc, ig_base, rates)
+            ns_npv_low, ns_npv_high = _economic_cost_sweep(calc, ns_base, rates)
+            mx_npv_low, mx_npv_high = _economic_cost_sweep(calc, mx_base, rates)
+            lng_npv_low, lng_npv_high = _economic_cost_sweep(calc, lng_base, rates)
+        else:
+            # Low value
+            config_low = modify_config(base_config, param_key, param_info["low"])
+            bau_low = run_scenario_with_config(config_low, "bau")
+            fi_low = run_scenario_with_config(config_low, "full_integration")
+            ng_low = run_scenario_with_config(config_low, "national_grid")
+            ig_low = run_scenario_with_config(config_low, "islanded_green")
+            ns_low = run_scenario_with_config(config_low, "nearshore_solar")
+            mx_low = run_scenario_with_config(config_low, "maximum_re")
+            lng_low = run_scenario_with_config(config_low, "lng_transition")
         
-        calc_low = CBACalculator(config_low)
-        bau_npv_low = _economic_cost(calc_low, bau_low)
-        fi_npv_low = _economic_cost(calc_low, fi_low)
-        ng_npv_low = _economic_cost(calc_low, ng_low)
-        ig_npv_low = _economic_cost(calc_low, ig_low)
-        ns_npv_low = _economic_cost(calc_low, ns_low)
-        mx_npv_low = _economic_cost(calc_low, mx_low)
-        lng_npv_low = _economic_cost(calc_low, lng_low)
+            calc_low = CBACalculator(config_low)
+            bau_npv_low = _economic_cost(calc_low, bau_low)
+            fi_npv_low = _economic_cost(calc_low, fi_low)
+            ng_npv_low = _economic_cost(calc_low, ng_low)
+            ig_npv_low = _economic_cost(calc_low, ig_low)
+            ns_npv_low = _economic_cost(calc_low, ns_low)
+            mx_npv_low = _economic_cost(calc_low, mx_low)
+            lng_npv_low = _economic_cost(calc_low, lng_low)
         
-        # High value
-        config_high = modify_config(base_config, param_key, param_info["high"])
-        bau_high = run_scenario_with_config(config_high, "bau")
-        fi_high = run_scenario_with_config(config_high, "full_integration")
-        ng_high = run_scenario_with_config(config_high, "national_grid")
-        ig_high = run_scenario_with_config(config_high, "islanded_green")
-        ns_high = run_scenario_with_config(config_high, "nearshore_solar")
-        mx_high = run_scenario_with_config(config_high, "maximum_re")
-        lng_high = run_scenario_with_config(config_high, "lng_transition")
+            # High value
+            config_high = modify_config(base_config, param_key, param_info["high"])
+            bau_high = run_scenario_with_config(config_high, "bau")
+            fi_high = run_scenario_with_config(config_high, "full_integration")
+            ng_high = run_scenario_with_config(config_high, "national_grid")
+            ig_high = run_scenario_with_config(config_high, "islanded_green")
+            ns_high = run_scenario_with_config(config_high, "nearshore_solar")
+            mx_high = run_scenario_with_config(config_high, "maximum_re")
+            lng_high = run_scenario_with_config(config_high, "lng_transition")
         
-        calc_high = CBACalculator(config_high)
-        bau_npv_high = _economic_cost(calc_high, bau_high)
-        fi_npv_high = _economic_cost(calc_high, fi_high)
-        ng_npv_high = _economic_cost(calc_high, ng_high)
-        ig_npv_high = _economic_cost(calc_high, ig_high)
-        ns_npv_high = _economic_cost(calc_high, ns_high)
-        mx_npv_high = _economic_cost(calc_high, mx_high)
-        lng_npv_high = _economic_cost(calc_high, lng_high)
+            calc_high = CBACalculator(config_high)
+            bau_npv_high = _economic_cost(calc_high, bau_high)
+            fi_npv_high = _economic_cost(calc_high, fi_high)
+            ng_npv_high = _economic_cost(calc_high, ng_high)
+            ig_npv_high = _economic_cost(calc_high, ig_high)
+            ns_npv_high = _economic_cost(calc_high, ns_high)
+            mx_npv_high = _economic_cost(calc_high, mx_high)
+            lng_npv_high = _economic_cost(calc_high, lng_high)
         
         # Store results
         results["bau"][param_key] = {
@@ -434,6 +457,9 @@ def run_one_way_sensitivity(base_config: Config) -> Dict:
             "range": abs(lng_npv_high - lng_npv_low),
         }
     
+    stats = get_scenario_cache().stats()
+    print(f"  Scenario cache: {stats['hits']} hits / {stats['misses']} runs "
+          f"(~{stats['seconds_saved']:.1f}s saved)")
     print()
     return results
 
@@ -14,14 +14,17 @@ Active scenarios:
   S7 LNG Transition (LNGTransitionScenario) — 140 MW LNG on Gulhifalhu
 """
 
+import numbers
+import operator
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import MISSING, dataclass, field, fields
 import pandas as pd
 import numpy as np
 
 from ..config import Config, get_config
-from ..demand import DemandProjector, SectoralDemand
+from ..demand import DemandProjector, SectoralDemand, round_elementwise
 from ..costs import CostCalculator, AnnualCosts
 from ..emissions import EmissionsCalculator, AnnualEmissions
 
@@ -98,6 +101,21 @@ class GenerationMix:
         }
 
 
+def _share_column(part: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """part / total, 0 where total is 0 — array form of the *_share properties."""
+    return np.divide(part, total, out=np.zeros(np.shape(total)), where=total != 0)
+
+
+# Array forms of record properties that branch on scalar values. AnnualTable
+# evaluates these on whole columns instead of looping the property per row.
+_COLUMN_PROPERTIES: Dict[Tuple[type, str], Callable] = {
+    (GenerationMix, "diesel_share"): lambda v: _share_column(v.diesel_gwh, v.total_generation_gwh),
+    (GenerationMix, "re_share"): lambda v: _share_column(v.solar_gwh + v.wte_gwh + v.wind_gwh, v.total_generation_gwh),
+    (GenerationMix, "import_share"): lambda v: _share_column(v.import_gwh, v.total_generation_gwh),
+    (GenerationMix, "lng_share"): lambda v: _share_column(v.lng_gwh, v.total_generation_gwh),
+}
+
+
 @dataclass
 class AnnualBenefits:
     """Benefits for a single year."""
@@ -160,53 +178,477 @@ class AnnualBenefits:
         }
 
 
+# Row-proxy classes generated by _row_class(), one per record dataclass
+_ROW_CLASSES: Dict[type, type] = {}
+
+
+def _row_class(record_cls: type) -> type:
+    """
+    Subclass of a per-year record dataclass whose fields live in an AnnualTable.
+    
+    Field reads and writes go straight to the table's column arrays, so all
+    existing properties and methods (total, to_dict, ...) work unchanged.
+    A row is bound to its year, not to an array position, so it stays
+    valid when the table later grows or shifts. Rows compare equal to
+    plain records (and other rows) with the same field values; copying
+    or pickling a row yields a plain, detached record_cls instance.
+    """
+    row_cls = _ROW_CLASSES.get(record_cls)
+    if row_cls is not None:
+        return row_cls
+    
+    names = [f.name for f in fields(record_cls)]
+    
+    compared = [f.name for f in fields(record_cls) if f.compare]
+    
+    def column_property(k):
+        def fget(self):
+            table = self._table
+            i = table._index(self._year)  # may flush and reallocate _data
+            return table._data.item(k, i)
+        
+        def fset(self, value):
+            table = self._table
+            i = table._index(self._year)
+            table._data[k, i] = value
+            table._revision += 1
+            if table._columns:
+                table._columns.clear()
+        
+        return property(fget, fset)
+    
+    def __eq__(self, other):
+        if not isinstance(other, record_cls):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in compared)
+    
+    value_names = [name for name in names if name != "year"]
+    namespace = {name: column_property(k) for k, name in enumerate(value_names)}
+    namespace["year"] = property(lambda self: self._year)
+    namespace["__slots__"] = ("_table", "_year")
+    namespace["__eq__"] = __eq__
+    namespace["__hash__"] = None
+    namespace["_fields"] = tuple(value_names)
+    namespace["_field_index"] = {name: k for k, name in enumerate(value_names)}
+    namespace["__reduce__"] = lambda self: (record_cls, tuple(getattr(self, n) for n in names))
+    
+    row_cls = type(f"{record_cls.__name__}Row", (record_cls,), namespace)
+    _ROW_CLASSES[record_cls] = row_cls
+    return row_cls
+
+
+class _ColumnView:
+    """Record stand-in whose attributes are whole columns (vectorised properties)."""
+    
+    def __init__(self, table: "AnnualTable"):
+        self._table = table
+    
+    def __getattr__(self, name):
+        return self._table.column(name)
+
+
+class AnnualTable(MutableMapping):
+    """
+    Struct-of-arrays store for one per-year record type.
+    
+    Behaves like the Dict[int, record] it replaces — `table[year]` returns a
+    row proxy that is an instance of the record class — but every field is
+    one row of a (fields × years) float64 block indexed by year offset
+    (year - start_year). column() exposes those rows directly.
+    
+    Unlike a dict, `table[year] = record` stores a copy: the record's field
+    values are taken at assignment, and later changes to that record do
+    not reach the table (write through `table[year].field = ...` instead).
+    Copied values are buffered and scattered into the block in one batch
+    on the next read, so a scenario run pays one array write per table.
+    
+    Keys must be integral years; other keys raise KeyError.
+    
+    Columns (fields and derived properties) are computed once and cached
+    until the next write; `revision` counts writes, so callers can key
+    their own caches on (table, revision).
+    """
+    
+    def __init__(self, record_cls: type):
+        self.record_cls = record_cls
+        self._row_cls = _row_class(record_cls)
+        self.fields = self._row_cls._fields
+        self._field_index = self._row_cls._field_index
+        self.start_year: Optional[int] = None
+        self._data = np.zeros((len(self.fields), 0))
+        self._present = np.zeros(0, dtype=bool)
+        self._pending: Dict[int, Tuple[float, ...]] = {}
+        self._layout = None  # cached (years, selector) — see _stored()
+        self._columns: Dict[Optional[str], np.ndarray] = {}  # cached column() results; None: stored block
+        self._revision = 0
+    
+    def __getstate__(self):
+        # Row classes are generated at runtime; rebuild rather than pickle
+        if self._pending:
+            self._flush()
+        state = self.__dict__.copy()
+        del state["_row_cls"]
+        state["_columns"] = {}
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._row_cls = _row_class(self.record_cls)
+    
+    # --- storage -------------------------------------------------------------
+    
+    def reserve(self, start_year: int, n_years: int) -> None:
+        """Pre-size the columns for `n_years` from `start_year` (avoids regrowth)."""
+        self._offset(start_year)
+        self._offset(start_year + n_years - 1)
+    
+    def _offset(self, year: int) -> int:
+        """Offset of `year`, growing (or shifting) the arrays to cover it."""
+        if self.start_year is None:
+            self.start_year = year
+        shift = max(0, self.start_year - year)
+        needed = year - self.start_year + shift + 1
+        capacity = len(self._present)
+        if shift or needed > capacity:
+            size = max(needed, 2 * capacity) if not shift else capacity + shift
+            
+            data = np.zeros((len(self.fields), size))
+            data[:, shift:shift + capacity] = self._data
+            present = np.zeros(size, dtype=bool)
+            present[shift:shift + capacity] = self._present
+            self._data, self._present = data, present
+            self._changed()
+            self.start_year -= shift
+        return year - self.start_year
+    
+    def _changed(self) -> None:
+        """Drop cached layout and columns after a write."""
+        self._layout = None
+        self._columns.clear()
+        self._revision += 1
+    
+    @property
+    def revision(self) -> int:
+        """Number of writes so far (changes whenever any stored value may have)."""
+        return self._revision
+    
+    def compact(self) -> None:
+        """Write buffered records into the block and drop them."""
+        if self._pending:
+            self._flush()
+    
+    def assign(self, years, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Write whole columns for `years` in one go (array form of table[year] = record).
+        
+        Values are arrays aligned with `years` or scalars; fields missing from
+        `columns` take the record class default.
+        """
+        if self._pending:
+            self._flush()
+        years = np.asarray(years, dtype=np.int64)
+        if len(years) == 0:
+            return
+        self._offset(int(years.min()))
+        self._offset(int(years.max()))
+        offsets = years - self.start_year
+        for f in fields(self.record_cls):
+            if f.name == "year":
+                continue
+            if f.name in columns:
+                value = columns[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                raise KeyError(f"{self.record_cls.__name__}.{f.name} has no default and no column")
+            self._data[self._field_index[f.name], offsets] = value
+        self._present[offsets] = True
+        self._changed()
+    
+    def _flush(self) -> None:
+        """Scatter buffered records into the block in one write."""
+        pending, self._pending = self._pending, {}
+        self._offset(min(pending))
+        self._offset(max(pending))
+        offsets = np.fromiter(pending, dtype=np.int64, count=len(pending)) - self.start_year
+        self._data[:, offsets] = np.array(list(pending.values()), dtype=float).T
+        self._present[offsets] = True
+        self._changed()
+    
+    @staticmethod
+    def _key(year) -> int:
+        """`year` as an int; non-integral keys (2030.7, "2030") raise KeyError."""
+        try:
+            return operator.index(year)
+        except TypeError:
+            if isinstance(year, numbers.Real) and float(year).is_integer():
+                return int(year)
+            raise KeyError(year) from None
+    
+    def _index(self, year) -> int:
+        if self._pending:
+            self._flush()
+        if self.start_year is not None:
+            i = self._key(year) - self.start_year
+            if 0 <= i < len(self._present) and self._present[i]:
+                return i
+        raise KeyError(year)
+    
+    def __getitem__(self, year):
+        self._index(year)
+        row = object.__new__(self._row_cls)
+        row._table = self
+        row._year = self._key(year)
+        return row
+    
+    def __setitem__(self, year, record) -> None:
+        # Copy the values now: later changes to `record` must not leak in
+        self._pending[self._key(year)] = tuple(getattr(record, name) for name in self.fields)
+    
+    def __delitem__(self, year) -> None:
+        self._present[self._index(year)] = False
+        self._changed()
+    
+    def _stored(self) -> Tuple[np.ndarray, object]:
+        """(years, selector) of stored rows; selector is a slice when contiguous."""
+        if self._pending:
+            self._flush()
+        if self._layout is None:
+            offsets = np.flatnonzero(self._present)
+            n = len(offsets)
+            selector = slice(0, n) if n == 0 or offsets[-1] == n - 1 else self._present.copy()
+            years = offsets.astype(np.int64) + (self.start_year or 0)
+            years.flags.writeable = False
+            self._layout = (years, selector)
+        return self._layout
+    
+    def __iter__(self) -> Iterator[int]:
+        for year in self._stored()[0].tolist():
+            yield year
+    
+    def __len__(self) -> int:
+        return len(self._stored()[0])
+    
+    def __contains__(self, year) -> bool:
+        try:
+            self._index(year)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+    
+    def __repr__(self) -> str:
+        return f"AnnualTable({self.record_cls.__name__}, {len(self)} years)"
+    
+    # --- columnar access -----------------------------------------------------
+    
+    @property
+    def years(self) -> np.ndarray:
+        """Stored years in ascending order."""
+        return self._stored()[0]
+    
+    def column(self, name: str) -> np.ndarray:
+        """
+        One value per stored year (ascending), for a field or a property.
+        
+        Fields come back as a read-only view of the underlying array (no
+        copy) when the stored years are contiguous. Properties of the record
+        class are evaluated on whole columns at once — through
+        _COLUMN_PROPERTIES for those that branch on scalar values, with a
+        per-row loop as the last resort. Results are cached until the next
+        write, so repeated extraction (NPV, summaries, frames) and derived
+        properties built from other columns are lookups.
+        """
+        values = self._columns.get(name)
+        if values is not None and not self._pending:
+            return values
+        if name == "year":
+            return self.years
+        selector = self._stored()[1]  # flushes pending writes (and the cache) first
+        
+        k = self._field_index.get(name)
+        if k is not None:
+            # Row of the stored block (sliced once per layout, read-only rows)
+            block = self._columns.get(None)
+            if block is None:
+                block = self._columns[None] = self._data[:, selector]
+                block.flags.writeable = False
+            values = block[k]
+        else:
+            values = self._derived_column(name)
+            values.flags.writeable = False
+        self._columns[name] = values
+        return values
+    
+    def _derived_column(self, name: str) -> np.ndarray:
+        """Evaluate a record-class property on whole columns."""
+        vectorised = _COLUMN_PROPERTIES.get((self.record_cls, name))
+        attr = getattr(self.record_cls, name)
+        if vectorised is not None or isinstance(attr, property):
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    values = (vectorised or attr.fget)(self.view())
+                n = len(self._stored()[0])
+                if isinstance(values, np.ndarray) and values.shape == (n,) and values.dtype == float:
+                    return values
+                return np.broadcast_to(np.asarray(values, dtype=float), (n,))
+            except (ValueError, TypeError):
+                pass
+        return np.fromiter((getattr(row, name) for row in self.values()), dtype=float, count=len(self))
+    
+    def view(self) -> "_ColumnView":
+        """Record-shaped view whose attributes (fields and properties) are whole columns."""
+        return _ColumnView(self)
+    
+    def record(self, year: int):
+        """Detached plain record for `year` — faster than the proxy for repeated reads."""
+        i = self._index(year)
+        values = dict(zip(self.fields, self._data[:, i].tolist()))
+        return self.record_cls(year=self.start_year + i, **values)
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Compact copy of the stored rows: (years, fields × years block)."""
+        years, selector = self._stored()
+        return years.copy(), self._data[:, selector].copy()
+    
+    @classmethod
+    def from_arrays(cls, record_cls: type, years: np.ndarray, data: np.ndarray) -> "AnnualTable":
+        """Rebuild a table from to_arrays() output."""
+        table = cls(record_cls)
+        years = np.asarray(years, dtype=np.int64)
+        if len(years):
+            table._offset(int(years.min()))
+            table._offset(int(years.max()))
+            offsets = years - table.start_year
+            table._data[:, offsets] = data
+            table._present[offsets] = True
+        return table
+    
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame of the record's to_dict() columns, built from whole columns."""
+        if hasattr(self.record_cls, "to_dict"):
+            data = self.record_cls.to_dict(self.view())
+        else:
+            data = {"year": self.years, **{name: self.column(name) for name in self.fields}}
+        return pd.DataFrame(data)
+
+
 @dataclass
 class ScenarioResults:
-    """Complete results for a scenario."""
+    """
+    Complete results for a scenario.
+    
+    Time series are AnnualTable columnar stores keyed by year; they read and
+    write like the dicts of per-year records they replace.
+    """
+    
+    # Time-series attribute -> record class
+    _TABLES = {
+        "generation_mix": GenerationMix,
+        "annual_costs": AnnualCosts,
+        "annual_emissions": AnnualEmissions,
+        "annual_benefits": AnnualBenefits,
+        "sectoral_demand": SectoralDemand,
+    }
     
     name: str
     description: str
     
     # Time series data
-    generation_mix: Dict[int, GenerationMix] = field(default_factory=dict)
-    annual_costs: Dict[int, AnnualCosts] = field(default_factory=dict)
-    annual_emissions: Dict[int, AnnualEmissions] = field(default_factory=dict)
-    annual_benefits: Dict[int, AnnualBenefits] = field(default_factory=dict)
+    generation_mix: AnnualTable = field(default_factory=lambda: AnnualTable(GenerationMix))
+    annual_costs: AnnualTable = field(default_factory=lambda: AnnualTable(AnnualCosts))
+    annual_emissions: AnnualTable = field(default_factory=lambda: AnnualTable(AnnualEmissions))
+    annual_benefits: AnnualTable = field(default_factory=lambda: AnnualTable(AnnualBenefits))
     
     # M5: Sectoral demand breakdown
-    sectoral_demand: Dict[int, SectoralDemand] = field(default_factory=dict)
+    sectoral_demand: AnnualTable = field(default_factory=lambda: AnnualTable(SectoralDemand))
+    
+    def _tables(self) -> Tuple[AnnualTable, ...]:
+        return (
+            self.generation_mix, self.annual_costs, self.annual_emissions,
+            self.annual_benefits, self.sectoral_demand,
+        )
+    
+    def reserve(self, start_year: int, n_years: int) -> None:
+        """Pre-size every time series for a known horizon."""
+        for table in self._tables():
+            table.reserve(start_year, n_years)
+    
+    def compact(self) -> None:
+        """Move any buffered per-year records into the column arrays."""
+        for table in self._tables():
+            table.compact()
+    
+    def __post_init__(self):
+        # Accept plain {year: record} dicts for backward compatibility
+        for name, record_cls in self._TABLES.items():
+            series = getattr(self, name)
+            if not isinstance(series, AnnualTable):
+                table = AnnualTable(record_cls)
+                for year in sorted(series):
+                    table[year] = series[year]
+                setattr(self, name, table)
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Every time series as flat arrays ("<table>.years", "<table>.data")."""
+        arrays = {}
+        for name in self._TABLES:
+            years, data = getattr(self, name).to_arrays()
+            arrays[f"{name}.years"] = years
+            arrays[f"{name}.data"] = data
+        return arrays
+    
+    @classmethod
+    def from_arrays(cls, name: str, description: str, arrays: Dict[str, np.ndarray]) -> "ScenarioResults":
+        """Rebuild results from to_arrays() output."""
+        tables = {
+            table: AnnualTable.from_arrays(record_cls, arrays[f"{table}.years"], arrays[f"{table}.data"])
+            for table, record_cls in cls._TABLES.items()
+        }
+        return cls(name=name, description=description, **tables)
+    
+    def truncated(self, end_year: int) -> "ScenarioResults":
+        """
+        Copy restricted to years up to `end_year`.
+        
+        For a horizon-independent scenario this equals a run on the shorter
+        horizon; horizon-dependent quantities (salvage, annuities, LCOE) are
+        computed downstream by a CBACalculator for that horizon's config.
+        """
+        arrays = {}
+        for name in self._TABLES:
+            years, data = getattr(self, name).to_arrays()
+            keep = years <= end_year
+            arrays[f"{name}.years"] = years[keep]
+            arrays[f"{name}.data"] = data[:, keep]
+        return ScenarioResults.from_arrays(self.name, self.description, arrays)
     
     def get_total_costs(self) -> float:
         """Sum of all costs over analysis period (undiscounted)."""
-        return sum(c.total for c in self.annual_costs.values())
+        return float(self.annual_costs.column("total").sum())
     
     def get_total_emissions(self) -> float:
         """Sum of all emissions over analysis period (tCO2)."""
-        return sum(e.total_emissions_tco2 for e in self.annual_emissions.values())
+        return float(self.annual_emissions.column("total_emissions_tco2").sum())
     
     def get_total_benefits(self) -> float:
         """Sum of all benefits over analysis period (undiscounted)."""
-        return sum(b.total for b in self.annual_benefits.values())
+        return float(self.annual_benefits.column("total").sum())
     
     def get_generation_df(self) -> pd.DataFrame:
         """Get generation mix as DataFrame."""
-        data = [g.to_dict() for g in self.generation_mix.values()]
-        return pd.DataFrame(data).sort_values("year")
+        return self.generation_mix.to_frame()
     
     def get_costs_df(self) -> pd.DataFrame:
         """Get costs as DataFrame."""
-        data = [c.to_dict() for c in self.annual_costs.values()]
-        return pd.DataFrame(data).sort_values("year")
+        return self.annual_costs.to_frame()
     
     def get_emissions_df(self) -> pd.DataFrame:
         """Get emissions as DataFrame."""
-        data = [e.to_dict() for e in self.annual_emissions.values()]
-        return pd.DataFrame(data).sort_values("year")
+        return self.annual_emissions.to_frame()
     
     def get_benefits_df(self) -> pd.DataFrame:
         """Get benefits as DataFrame."""
-        data = [b.to_dict() for b in self.annual_benefits.values()]
-        return pd.DataFrame(data).sort_values("year")
+        return self.annual_benefits.to_frame()
     
     def get_cash_flow_df(self) -> pd.DataFrame:
         """Get combined cash flows (costs, benefits, net)."""
@@ -229,6 +671,93 @@ class ScenarioResults:
         return pd.DataFrame(data)
 
 
+# =============================================================================
+# WHOLE-HORIZON KERNELS (run_vectorized)
+# =============================================================================
+
+def _ramp_limited(initial: float, target: np.ndarray, ramp: float) -> np.ndarray:
+    """
+    Capacity path that closes the gap to `target` by at most `ramp` per year.
+    
+    Array form of the deployment-schedule recursion
+        c_t = c_{t-1} + min(ramp, max(0, target_t - c_{t-1})),  c_{-1} = initial
+    For a non-decreasing target (clipped below at `initial`) the gap never
+    reopens, and the recursion reduces to one cumulative minimum:
+        c_t = ramp·t + min(initial + ramp, min_{s≤t}(target_s - ramp·s))
+    Any other target falls back to the recursion.
+    """
+    target = np.maximum(np.asarray(target, dtype=float), initial)
+    steps = np.arange(len(target))
+    if np.all(np.diff(target) >= 0):
+        return ramp * steps + np.minimum(initial + ramp, np.minimum.accumulate(target - ramp * steps))
+    
+    path = np.empty(len(target))
+    capacity = initial
+    for t, goal in enumerate(target.tolist()):
+        capacity += min(ramp, max(0, goal - capacity))
+        path[t] = capacity
+    return path
+
+
+def _ratchet_down(initial: float, ceiling: np.ndarray, floor: np.ndarray) -> np.ndarray:
+    """
+    Fleet that may only shrink towards `ceiling`, never below `floor`.
+    
+    Array form of d_t = max(min(d_{t-1}, ceiling_t), floor_t), d_{-1} = initial.
+    With a non-decreasing floor this is max(min(initial, cummin(ceiling)), floor);
+    any other floor falls back to the recursion.
+    """
+    ceiling = np.asarray(ceiling, dtype=float)
+    floor = np.asarray(floor, dtype=float)
+    if np.all(np.diff(floor) >= 0):
+        return np.maximum(np.minimum(initial, np.minimum.accumulate(ceiling)), floor)
+    
+    path = np.empty(len(ceiling))
+    capacity = initial
+    for t, (upper, lower) in enumerate(zip(ceiling.tolist(), floor.tolist())):
+        capacity = max(min(capacity, upper), lower)
+        path[t] = capacity
+    return path
+
+
+def _decay_with_floor(initial: float, floor: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Fleet retiring at a fixed rate down to a floor.
+    
+    Array form of d_t = max(floor_t, factor·d_{t-1}), d_{-1} = initial:
+        d_t = factor^t · max(factor·initial, max_{s≤t}(floor_s · factor^-s))
+    """
+    floor = np.asarray(floor, dtype=float)
+    if factor <= 0:
+        return np.maximum(floor, 0.0)
+    scale = factor ** np.arange(len(floor))
+    return scale * np.maximum(factor * initial, np.maximum.accumulate(floor / scale))
+
+
+def _full_columns(record_cls: type, n: int, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Every non-year field of record_cls as a length-n array, defaults filled in."""
+    full = {}
+    for f in fields(record_cls):
+        if f.name == "year":
+            continue
+        value = columns[f.name] if f.name in columns or f.default is MISSING else f.default
+        full[f.name] = np.broadcast_to(np.asarray(value, dtype=float), (n,))
+    return full
+
+
+def _lagged(values: np.ndarray, lag: int) -> np.ndarray:
+    """values shifted `lag` years later along the horizon, zero-filled."""
+    out = np.zeros(len(values))
+    if 0 <= lag < len(values):
+        out[lag:] = values[:len(values) - lag]
+    return out
+
+
+def _running_total(initial: float, additions: np.ndarray) -> np.ndarray:
+    """initial + cumulative additions, summed in the same order as the year loop."""
+    return np.cumsum(np.concatenate(([initial], additions)))[1:]
+
+
 class BaseScenario(ABC):
     """
     Abstract base class for scenario implementations.
@@ -237,8 +766,16 @@ class BaseScenario(ABC):
     - calculate_generation_mix(year)
     - calculate_annual_costs(year)
     - calculate_annual_benefits(year, baseline)
+    
+    Optionally, calculate_generation_arrays(years) and
+    calculate_cost_arrays(years, gen) for run_vectorized().
     """
     
+    # True if results for a year depend on config.end_year (not just on the
+    # years up to it). Horizon-independent scenarios can be run once on the
+    # longest horizon and truncated for shorter ones (ScenarioResults.truncated).
+    horizon_dependent: bool = False
+    
     def __init__(
         self,
         name: str,
@@ -255,9 +792,11 @@ class BaseScenario(ABC):
         
         # Results container
         self.results = ScenarioResults(name=name, description=description)
+        self.results.reserve(self.config.time_horizon[0], len(self.config.time_horizon))
         
         # Cache
         self._calculated = False
+        self._solar_profiles: Dict[float, Dict[int, float]] = {}
         
         # LW-01: Precompute temperature-derated capacity factor (constant for Maldives climate)
         self._effective_solar_cf = self._compute_effective_cf()
@@ -275,14 +814,25 @@ class BaseScenario(ABC):
             Effective capacity factor (dimensionless, ~0.167 for Maldives)
         """
         raw_cf = self.config.technology.solar_pv_capacity_factor
-        ghi = self.config.technology.default_ghi
-        t_amb = self.config.technology.default_ambient_temp
-        noct_coeff = self.config.technology.pv_noct_coeff
-        k_t = self.config.technology.pv_temp_derating_coeff
-        ghi_kw_m2 = ghi / 24.0
-        t_cell = t_amb + noct_coeff * ghi_kw_m2
-        temp_derating = max(0.0, 1.0 - k_t * (t_cell - 25.0))
-        return raw_cf * temp_derating
+        return raw_cf * self.cost_calc.solar_temp_derating()
+    
+    def _vintaged_solar_gwh(self, year: int, existing_mw: float) -> float:
+        """
+        Vintaged solar generation (C7, C8) in `year` for calculate_generation_mix().
+        
+        The deployment schedule (self.solar_additions) is complete once the
+        scenario is constructed, so the whole trajectory is computed in one
+        pass of the vintage engine and read back year by year.
+        """
+        profile = self._solar_profiles.get(existing_mw)
+        if profile is None:
+            years = np.asarray(self.config.time_horizon)
+            generation = self.cost_calc.solar_generation_profile(
+                years, self.solar_additions, existing_mw=existing_mw,
+            )
+            profile = dict(zip(years.tolist(), generation.tolist()))
+            self._solar_profiles[existing_mw] = profile
+        return profile[year]
     
     @abstractmethod
     def _init_demand_projector(self) -> DemandProjector:
@@ -453,9 +1003,236 @@ class BaseScenario(ABC):
         # V7: Validate solar deployment against physical land constraints
         self._validate_solar_land_constraints()
         
+        self.results.compact()
+        self._calculated = True
+        return self.results
+    
+    # =========================================================================
+    # WHOLE-HORIZON PATH (opt-in)
+    # =========================================================================
+    
+    def calculate_generation_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Generation mix for all years at once: GenerationMix field -> array.
+        
+        Array counterpart of calculate_generation_mix(). Optional: scenarios
+        that do not override it (and calculate_cost_arrays) run the year loop
+        from run_vectorized().
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no whole-horizon kernel; use run()")
+    
+    def calculate_cost_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Costs for all years at once: AnnualCosts field -> array.
+        
+        Array counterpart of calculate_annual_costs(); `gen` is the output of
+        calculate_generation_arrays(). Optional, as above.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no whole-horizon kernel; use run()")
+    
+    @classmethod
+    def has_array_kernels(cls) -> bool:
+        """True if the scenario overrides both whole-horizon kernels."""
+        return (
+            cls.calculate_generation_arrays is not BaseScenario.calculate_generation_arrays
+            and cls.calculate_cost_arrays is not BaseScenario.calculate_cost_arrays
+        )
+    
+    def calculate_emission_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Emissions for all years at once: AnnualEmissions field -> array.
+        
+        Default mirrors calculate_annual_emissions().
+        """
+        return {
+            "diesel_emissions_tco2": self.emissions_calc.diesel_emissions(gen["diesel_gwh"]),
+            "import_emissions_tco2": self.emissions_calc.import_emissions_array(gen["import_gwh"], years),
+            "solar_lifecycle_tco2": self.emissions_calc.solar_lifecycle_emissions(gen["solar_capacity_mw"]),
+        }
+    
+    def run_vectorized(self) -> ScenarioResults:
+        """
+        Run the scenario for all years at once (opt-in alternative to run()).
+        
+        Deployment schedule, generation mix, costs and emissions are computed
+        as arrays over the whole horizon and written into the result tables
+        column by column. Sequential state — ramp-limited additions, diesel
+        fleets that only shrink or only grow — is expressed with cumulative
+        operations. Results agree with run() year by year to floating-point
+        precision; see validate_vectorized(). Scenarios without array kernels
+        (see has_array_kernels()) fall back to run().
+        
+        Returns:
+            ScenarioResults with all annual data
+        """
+        if self._calculated:
+            return self.results
+        if not self.has_array_kernels():
+            return self.run()
+        
+        years = np.asarray(self.config.time_horizon, dtype=np.int64)
+        gen = _full_columns(GenerationMix, len(years), self.calculate_generation_arrays(years))
+        costs = self.calculate_cost_arrays(years, gen)
+        emissions = self.calculate_emission_arrays(years, gen)
+        
+        self.results.generation_mix.assign(years, gen)
+        self.results.annual_costs.assign(years, costs)
+        self.results.annual_emissions.assign(years, emissions)
+        
+        # M5: Sectoral demand breakdown (static shares of net demand)
+        demand_gwh, _ = self.demand.project_years(years)
+        shares = {
+            "residential": self.config.demand.sectoral_residential,
+            "commercial": self.config.demand.sectoral_commercial,
+            "public": self.config.demand.sectoral_public,
+        }
+        sectoral = {"total_gwh": demand_gwh}
+        for sector, share in shares.items():
+            sectoral[f"{sector}_gwh"] = demand_gwh * share
+            sectoral[f"{sector}_share"] = share
+        self.results.sectoral_demand.assign(years, sectoral)
+        
+        # V7: Validate solar deployment against physical land constraints
+        self._validate_solar_land_constraints()
+        
         self._calculated = True
         return self.results
     
+    def validate_vectorized(self, rtol: float = 1e-9, atol: float = 1e-6) -> pd.DataFrame:
+        """
+        Compare run_vectorized() with run() year by year.
+        
+        Both paths run on fresh instances built from this scenario's config,
+        so this instance is left untouched.
+        
+        Returns:
+            One row per (table, field, year) that differs beyond tolerance,
+            with both values. Empty when the two paths agree.
+        """
+        reference = type(self)(self.config).run()
+        candidate = type(self)(self.config).run_vectorized()
+        
+        rows = []
+        for table in ("generation_mix", "annual_costs", "annual_emissions", "sectoral_demand"):
+            expected = getattr(reference, table)
+            actual = getattr(candidate, table)
+            if not np.array_equal(expected.years, actual.years):
+                raise ValueError(f"[{self.name}] {table}: run_vectorized() covers different years")
+            for name in expected.fields:
+                a, b = expected.column(name), actual.column(name)
+                bad = ~np.isclose(b, a, rtol=rtol, atol=atol)
+                for year, x, y in zip(expected.years[bad].tolist(), a[bad].tolist(), b[bad].tolist()):
+                    rows.append({"table": table, "field": name, "year": year,
+                                 "run": x, "run_vectorized": y})
+        return pd.DataFrame(rows, columns=["table", "field", "year", "run", "run_vectorized"])
+    
+    # --- array building blocks shared by the scenario kernels ----------------
+    
+    def _outer_island_arrays(self, years: np.ndarray, net_demand_gwh: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Two-segment outer-island deployment (S3-S7) as arrays.
+        
+        Mirrors the outer-island block of _calculate_deployment_schedule():
+        time-varying Malé share (D60), weighted distribution loss (MR-09),
+        solar ramped towards 100% of outer demand at ramp_mw_yr, and the
+        resulting outer-island RE share.
+        """
+        effective_cf = self._effective_solar_cf
+        growth = self._scenario_growth_rate
+        
+        male_share = np.array([self.config.male_demand_share(year, growth) for year in years.tolist()])
+        outer_share = 1.0 - male_share
+        dist_loss = np.array([
+            self.config.weighted_distribution_loss(year, growth) for year in years.tolist()
+        ])
+        loss_factor = 1.0 / (1.0 - dist_loss)
+        outer_demand_gwh = net_demand_gwh * loss_factor * outer_share
+        
+        existing_mw = max(0, self.config.current_system.solar_capacity_mw - self.male_solar_cap_mw)
+        mw_for_100pct = (outer_demand_gwh * 1000) / (8760 * effective_cf)
+        outer_solar_mw = _ramp_limited(existing_mw, mw_for_100pct, self.ramp_mw_yr)
+        
+        outer_gen_gwh = outer_solar_mw * 8760 * effective_cf / 1000
+        with np.errstate(divide="ignore", invalid="ignore"):
+            outer_re = np.where(outer_demand_gwh > 0, np.minimum(1.0, outer_gen_gwh / outer_demand_gwh), 0.0)
+        
+        return {
+            "male_share": male_share,
+            "outer_share": outer_share,
+            "dist_loss": dist_loss,
+            "existing_outer_mw": existing_mw,
+            "outer_solar_mw": outer_solar_mw,
+            "prev_outer_solar_mw": np.concatenate(([existing_mw], outer_solar_mw[:-1])),
+            "outer_re": outer_re,
+        }
+    
+    def _phased_build_array(self, years: np.ndarray, total_mw: float, build_start: int,
+                            build_years: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Capacity built in equal tranches over [build_start, build_start + build_years).
+        
+        Returns (additions, cumulative) — the array form of the near-shore,
+        floating and wind phasing loops in S5/S6.
+        """
+        annual_mw = total_mw / max(1, build_years)
+        building = (years >= build_start) & (years <= build_start + build_years - 1)
+        cumulative = np.minimum(total_mw, annual_mw * np.cumsum(building))
+        return np.diff(cumulative, prepend=0.0), cumulative
+    
+    def _solar_generation_array(self, years: np.ndarray, additions: np.ndarray, existing_mw: float) -> np.ndarray:
+        """Vintaged solar generation (C7, C8) for each year of the horizon."""
+        return self.cost_calc.solar_generation_profile(years, additions, existing_mw=existing_mw)
+    
+    def _additions_array(self, required: np.ndarray, initial: float = 0.0) -> np.ndarray:
+        """Year-on-year additions max(0, required_t - required_{t-1})."""
+        previous = np.concatenate(([initial], required[:-1]))
+        return np.maximum(0, required - previous)
+    
+    def _backup_diesel_array(self, peak_mw: np.ndarray, re_target: np.ndarray) -> np.ndarray:
+        """Diesel fleet kept for backup: only maintained or reduced, never expanded."""
+        min_diesel_capacity = peak_mw * self.config.technology.min_diesel_backup
+        reserve_factor = 1 + self.config.technology.reserve_margin
+        required_diesel_mw = np.maximum(min_diesel_capacity, peak_mw * (1 - re_target) * reserve_factor)
+        return _ratchet_down(self.config.current_system.diesel_capacity_mw, required_diesel_mw, min_diesel_capacity)
+    
+    def _wte_generation_array(self, years: np.ndarray, residual_gwh: np.ndarray) -> np.ndarray:
+        """R6: WTE baseload once online, limited by the demand left to serve."""
+        wte = self.config.wte
+        baseload = np.minimum(wte.annual_generation_gwh, np.maximum(0, residual_gwh))
+        return np.where(years >= wte.online_year, baseload, 0.0)
+    
+    def _battery_capex_array(self, years: np.ndarray, additions: np.ndarray, premium: float = 1.0) -> np.ndarray:
+        """Battery CAPEX for additions plus replacement of the cohort reaching battery_lifetime."""
+        capex = np.where(additions > 0, self.cost_calc.battery_capex(additions, years) * premium, 0.0)
+        replaced = _lagged(additions, self.config.technology.battery_lifetime)
+        return capex + np.where(replaced > 0, self.cost_calc.battery_capex(replaced, years) * premium, 0.0)
+    
+    def _inter_island_capex_array(self, years: np.ndarray) -> np.ndarray:
+        """One-time inter-island grid CAPEX in inter_island_build_end."""
+        gt = self.config.green_transition
+        if not gt.inter_island_grid:
+            return np.zeros(len(years))
+        return np.where(years == gt.inter_island_build_end, self.cost_calc.inter_island_cable_capex(gt.inter_island_km), 0.0)
+    
+    def _wte_cost_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """R6: WTE CAPEX (one-time at online year) + annual OPEX over plant life."""
+        wte = self.config.wte
+        capex = wte.total_capex * (1 + self.config.technology.climate_adaptation_premium)
+        operating = (years >= wte.online_year) & (years < wte.online_year + wte.plant_lifetime)
+        return {
+            "capex_wte": np.where(years == wte.online_year, capex, 0.0),
+            "opex_wte": np.where(operating, wte.annual_opex, 0.0),
+        }
+    
+    def _connection_capex_array(self, years: np.ndarray, premium: float = 1.0) -> np.ndarray:
+        """L11: Household connection CAPEX over the phased rollout."""
+        conn_cfg = self.config.connection
+        conn_start = self.config.base_year + 1
+        conn_end = conn_start + conn_cfg.rollout_years - 1
+        annual_hh = conn_cfg.number_of_households / conn_cfg.rollout_years
+        capex = self.cost_calc.connection_capex(int(annual_hh)) * premium
+        return np.where((years >= conn_start) & (years <= conn_end), capex, 0.0)
+    
     def _validate_solar_land_constraints(self) -> None:
         """
         V7: Check that aggregate solar deployment does not exceed the physical
@@ -508,14 +1285,18 @@ class BaseScenario(ABC):
         if not self._calculated:
             self.run()
         
+        def record(table, year):
+            # Detached records: many field reads per year, no write-back needed
+            return table.record(year) if year in table else None
+        
         for year in self.config.time_horizon:
-            gen_mix = self.results.generation_mix[year]
-            costs = self.results.annual_costs[year]
-            emissions = self.results.annual_emissions[year]
+            gen_mix = self.results.generation_mix.record(year)
+            costs = self.results.annual_costs.record(year)
+            emissions = self.results.annual_emissions.record(year)
             
-            baseline_costs = baseline_results.annual_costs.get(year)
-            baseline_emissions = baseline_results.annual_emissions.get(year)
-            baseline_gen_mix = baseline_results.generation_mix.get(year)
+            baseline_costs = record(baseline_results.annual_costs, year)
+            baseline_emissions = record(baseline_results.annual_emissions, year)
+            baseline_gen_mix = record(baseline_results.generation_mix, year)
             
             benefits = self.calculate_annual_benefits(
                 year=year,
@@ -528,28 +1309,30 @@ class BaseScenario(ABC):
             )
             
             self.results.annual_benefits[year] = benefits
+        
+        self.results.annual_benefits.compact()
     
     def get_summary(self) -> Dict:
         """Get summary statistics for the scenario."""
         if not self._calculated:
             self.run()
         
-        costs_df = self.results.get_costs_df()
-        emissions_df = self.results.get_emissions_df()
-        gen_df = self.results.get_generation_df()
+        # Column reductions straight off the AnnualTables (no DataFrames)
+        costs = self.results.annual_costs.column
+        gen = self.results.generation_mix.column
         
         return {
             "name": self.name,
-            "total_costs_million": costs_df["total"].sum() / 1e6,
-            "total_capex_million": costs_df["total_capex"].sum() / 1e6,
-            "total_opex_million": costs_df["total_opex"].sum() / 1e6,
-            "total_fuel_million": costs_df["total_fuel"].sum() / 1e6,
-            "total_connection_million": costs_df["capex_connection"].sum() / 1e6 if "capex_connection" in costs_df.columns else 0.0,
-            "total_emissions_mtco2": emissions_df["total_emissions_tco2"].sum() / 1e6,
+            "total_costs_million": costs("total").sum() / 1e6,
+            "total_capex_million": costs("total_capex").sum() / 1e6,
+            "total_opex_million": costs("total_opex").sum() / 1e6,
+            "total_fuel_million": costs("total_fuel").sum() / 1e6,
+            "total_connection_million": costs("capex_connection").sum() / 1e6,
+            "total_emissions_mtco2": self.results.annual_emissions.column("total_emissions_tco2").sum() / 1e6,
             # G-MO-01: cumulative diesel GWh for MCA health criterion (physical metric)
-            "total_diesel_gwh": gen_df["diesel_gwh"].sum(),
-            "final_re_share": gen_df.iloc[-1]["re_share"],
-            "final_diesel_share": gen_df.iloc[-1]["diesel_share"],
+            "total_diesel_gwh": gen("diesel_gwh").sum(),
+            "final_re_share": gen("re_share")[-1],
+            "final_diesel_share": gen("diesel_share")[-1],
             # M5: Sectoral demand snapshot for final year
             "sectoral_demand_2050": (
                 self.results.sectoral_demand[self.config.end_year].to_dict()
@@ -567,6 +1350,8 @@ from .nearshore_solar import NearShoreSolarScenario
 from .maximum_re import MaximumREScenario
 from .lng_transition import LNGTransitionScenario
 
+from .cache import ScenarioCache, get_scenario_cache
+
 # Backward compatibility aliases
 GreenTransitionScenario = NationalGridScenario
 OneGridScenario = FullIntegrationScenario
@@ -575,8 +1360,12 @@ __all__ = [
     # Base classes
     "BaseScenario",
     "ScenarioResults",
+    "AnnualTable",
     "GenerationMix",
     "AnnualBenefits",
+    # Result cache
+    "ScenarioCache",
+    "get_scenario_cache",
     # Active scenario implementations (S1–S7)
     "StatusQuoScenario",        # S1 BAU
     "FullIntegrationScenario",  # S2 Full Integration (India Cable)
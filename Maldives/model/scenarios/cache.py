@@ -0,0 +1,342 @@
+"""
+Scenario Result Cache
+=====================
+
+Memoises BaseScenario.run() across sensitivity, switching-value and
+multi-horizon sweeps, where the same (scenario, config) pair is otherwise
+recomputed many times — e.g. every one-way parameter re-running a BAU it
+does not touch.
+
+Entries are keyed on the scenario class and the fingerprint of the config
+fields the scenario actually read. The read set is recorded during the
+first (uncached) run of each class: if a later config agrees with a cached
+run on every field that run read, the scenario would follow the same path
+and produce the same results, so the entry is reused. A change to an
+unrelated parameter (cable CAPEX for BAU, say) is therefore a hit.
+
+Two tiers:
+  - an in-memory LRU of compact column arrays (ScenarioResults.to_arrays()),
+  - an optional on-disk tier of .npz files, keyed additionally on the model
+    code version so edits to the scenario code invalidate it.
+
+Hits return a fresh ScenarioResults, so callers may add benefits to it.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import FunctionType, MethodType
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..config import Config
+from . import BaseScenario, ScenarioResults
+
+
+# =============================================================================
+# READ TRACKING
+# =============================================================================
+# The scenario is constructed with a _ConfigProxy over the caller's config
+# rather than the config itself. The proxy records the dotted path of every
+# field read ("fuel.price_2026", "base_year") in a set owned by that one
+# run, and memoises the value on itself so later reads of the same field
+# skip the proxy. The caller's config is never modified, and concurrent
+# runs each record into their own set; a run nested inside another wraps
+# the outer proxy, so its reads count towards both.
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    return frozenset(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _class_attr(cls: type, name: str):
+    """Raw class-level attribute `name` of `cls` (function, property, ...), or None."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
+
+class _ConfigProxy:
+    """
+    Read-recording view of a Config (or one of its sub-configs).
+
+    Config methods and properties are evaluated against the proxy, so the
+    fields they read are recorded too. Sub-configs come back as child
+    proxies; anything deeper is recorded as a read of the whole sub-config
+    field, which is what Config.fingerprint() can key on. Copying or
+    pickling the proxy yields a plain copy of the config and counts as a
+    read of everything it holds.
+    """
+
+    __slots__ = ("_target", "_reads", "_prefix", "_fields", "_properties", "__dict__")
+
+    def __init__(self, target, reads: Set[str], prefix: str = ""):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_reads", reads)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_properties", set())
+        object.__setattr__(self, "_fields", _field_names(target.__class__))
+        if type(target) is not _ConfigProxy:
+            # Private state (e.g. Config._male_share_cache) is read via self.__dict__
+            self.__dict__.update((k, v) for k, v in target.__dict__.items() if k not in self._fields)
+
+    @property
+    def __class__(self):
+        return self._target.__class__
+
+    def __getattr__(self, name):
+        target = self._target
+        raw = _class_attr(target.__class__, name)
+        if name == "fingerprint" and not self._prefix:
+            return self._fingerprint
+        if isinstance(raw, FunctionType):
+            value = self.__dict__[name] = MethodType(raw, self)
+            return value
+        if isinstance(raw, property):
+            # Its field reads are recorded on first evaluation
+            value = self.__dict__[name] = raw.fget(self)
+            self._properties.add(name)
+            return value
+
+        value = getattr(target, name)
+        if name in self._fields:
+            if not self._prefix and is_dataclass(value.__class__):
+                value = _ConfigProxy(value, self._reads, f"{name}.")
+            else:
+                self._reads.add(self._prefix + name)
+            self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+        for derived in self._properties:
+            self.__dict__.pop(derived, None)
+        self._properties.clear()
+        if name in self._fields:
+            self.__dict__.pop(name, None)
+        else:
+            self.__dict__[name] = value
+
+    def _read_all(self) -> None:
+        if self._prefix:
+            self._reads.add(self._prefix[:-1])
+        else:
+            self._reads.update(self._fields)
+
+    def _fingerprint(self, sections: Optional[List[str]] = None) -> str:
+        if sections is None:
+            self._read_all()
+        else:
+            self._reads.update(sections)
+        return self._target.fingerprint(sections)
+
+    def __copy__(self):
+        self._read_all()
+        return copy.copy(self._target)
+
+    def __deepcopy__(self, memo):
+        self._read_all()
+        return copy.deepcopy(self._target, memo)
+
+    def __reduce_ex__(self, protocol):
+        self._read_all()
+        return self._target.__reduce_ex__(protocol)
+
+    def __repr__(self) -> str:
+        return repr(self._target)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ScenarioCache:
+    """
+    Memoising runner for scenario results.
+
+    Usage:
+        cache = ScenarioCache(max_entries=64, disk_dir="outputs/.scenario_cache")
+        results = cache.run(StatusQuoScenario, config)
+        print(cache.stats())
+    """
+
+    def __init__(self, max_entries: int = 64, disk_dir: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, np.ndarray]]" = OrderedDict()
+        self._read_sets: Dict[str, List[Tuple[str, ...]]] = {}
+        self._code_version: Optional[str] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._miss_seconds = 0.0
+
+    @staticmethod
+    def _class_key(scenario_cls: type) -> str:
+        return f"{scenario_cls.__module__}.{scenario_cls.__qualname__}"
+
+    # --- disk tier -----------------------------------------------------------
+
+    def _disk_path(self, cls_key: str, fingerprint: str) -> Path:
+        if self._code_version is None:
+            from ..pipeline import code_version
+            self._code_version = code_version()
+        digest = hashlib.sha256(f"{self._code_version}|{cls_key}|{fingerprint}".encode()).hexdigest()[:24]
+        return self.disk_dir / f"{cls_key.rsplit('.', 1)[-1]}-{digest}.npz"
+
+    def _read_sets_path(self, cls_key: str) -> Path:
+        return self.disk_dir / f"{cls_key.rsplit('.', 1)[-1]}.reads.json"
+
+    def _known_read_sets(self, cls_key: str) -> List[Tuple[str, ...]]:
+        read_sets = self._read_sets.get(cls_key)
+        if read_sets is None:
+            read_sets = []
+            path = self._read_sets_path(cls_key) if self.disk_dir is not None else None
+            if path is not None and path.exists():
+                with open(path) as f:
+                    read_sets = [tuple(reads) for reads in json.load(f)]
+            self._read_sets[cls_key] = read_sets
+        return read_sets
+
+    def _add_read_set(self, cls_key: str, reads: Tuple[str, ...]) -> None:
+        read_sets = self._known_read_sets(cls_key)
+        if reads in read_sets:
+            return
+        read_sets.append(reads)
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            path = self._read_sets_path(cls_key)
+            tmp = path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp, "w") as f:
+                json.dump([list(r) for r in read_sets], f)
+            os.replace(tmp, path)
+
+    def _load_disk(self, cls_key: str, fingerprint: str) -> Optional[Dict[str, np.ndarray]]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(cls_key, fingerprint)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    def _store_disk(self, cls_key: str, fingerprint: str, arrays: Dict[str, np.ndarray]) -> None:
+        if self.disk_dir is None:
+            return
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        path = self._disk_path(cls_key, fingerprint)
+        tmp = path.with_name(f"{path.stem}.tmp{os.getpid()}.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, path)
+
+    # --- memory tier ---------------------------------------------------------
+
+    def _remember(self, key: Tuple[str, str], arrays: Dict[str, np.ndarray]) -> None:
+        self._entries[key] = arrays
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _results(arrays: Dict[str, np.ndarray]) -> ScenarioResults:
+        return ScenarioResults.from_arrays(str(arrays["name"]), str(arrays["description"]), arrays)
+
+    # --- public API ----------------------------------------------------------
+
+    def lookup(self, scenario_cls: type, config: Config) -> Optional[ScenarioResults]:
+        """Cached results for (scenario_cls, config), or None (counts as neither hit nor miss)."""
+        cls_key = self._class_key(scenario_cls)
+        for reads in self._known_read_sets(cls_key):
+            fingerprint = config.fingerprint(list(reads))
+            key = (cls_key, fingerprint)
+            arrays = self._entries.get(key)
+            if arrays is not None:
+                self._entries.move_to_end(key)
+                return self._results(arrays)
+            arrays = self._load_disk(cls_key, fingerprint)
+            if arrays is not None:
+                self.disk_hits += 1
+                self._remember(key, arrays)
+                return self._results(arrays)
+        return None
+
+    def run(self, scenario_cls: type, config: Config) -> ScenarioResults:
+        """
+        scenario_cls(config).run(), served from the cache when possible.
+
+        Args:
+            scenario_cls: BaseScenario subclass
+            config: Configuration to run with (must not be mutated while running)
+
+        Returns:
+            ScenarioResults (a fresh object on every call)
+        """
+        if not (isinstance(scenario_cls, type) and issubclass(scenario_cls, BaseScenario)):
+            raise TypeError(f"Expected a BaseScenario subclass, got {scenario_cls!r}")
+
+        results = self.lookup(scenario_cls, config)
+        if results is not None:
+            self.hits += 1
+            return results
+
+        self.misses += 1
+        start = time.perf_counter()
+        read_set: Set[str] = set()
+        results = scenario_cls(_ConfigProxy(config, read_set)).run()
+        self._miss_seconds += time.perf_counter() - start
+
+        cls_key = self._class_key(scenario_cls)
+        reads = tuple(sorted(read_set))
+        self._add_read_set(cls_key, reads)
+        fingerprint = config.fingerprint(list(reads))
+        arrays = results.to_arrays()
+        arrays["name"] = np.array(results.name)
+        arrays["description"] = np.array(results.description)
+        self._remember((cls_key, fingerprint), arrays)
+        self._store_disk(cls_key, fingerprint, arrays)
+        return self._results(arrays)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and the estimated run time saved by hits."""
+        lookups = self.hits + self.misses
+        mean_run = self._miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "seconds_saved": self.hits * mean_run,
+        }
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (the disk tier is kept)."""
+        self._entries.clear()
+        self._read_sets.clear()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+        self._miss_seconds = 0.0
+
+
+_DEFAULT_CACHE: Optional[ScenarioCache] = None
+
+
+def get_scenario_cache() -> ScenarioCache:
+    """Process-wide ScenarioCache (in-memory only)."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = ScenarioCache()
+    return _DEFAULT_CACHE
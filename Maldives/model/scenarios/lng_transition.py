@@ -43,7 +43,7 @@ import numpy as np
 from ..config import Config, get_config
 from ..demand import DemandProjector
 from ..costs import CostCalculator, AnnualCosts
-from . import BaseScenario, GenerationMix
+from . import BaseScenario, GenerationMix, _running_total, round_elementwise
 
 
 class LNGTransitionScenario(BaseScenario):
@@ -225,10 +225,8 @@ class LNGTransitionScenario(BaseScenario):
         self.battery_capacity_mwh += self.battery_additions.get(year, 0)
         
         # Solar generation with vintage-based degradation (C7, C8)
-        solar_gwh = self.cost_calc.solar_generation_vintaged(
-            solar_additions=self.solar_additions,
-            year=year,
-            existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
+        solar_gwh = self._vintaged_solar_gwh(
+            year, existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
         )
         
         # Cap solar at national RE target
@@ -416,6 +414,99 @@ class LNGTransitionScenario(BaseScenario):
             solar_lifecycle_tco2=solar_emissions_tco2,
         )
 
+    def _deployment_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Array form of _calculate_deployment_schedule() for run_vectorized()."""
+        net_demand_gwh, peak_mw = self.demand.project_years(years)
+        schedule = self._outer_island_arrays(years, net_demand_gwh)
+        outer_mw = schedule["outer_solar_mw"]
+        prev_outer_mw = schedule["prev_outer_solar_mw"]
+        
+        schedule["net_demand_gwh"] = net_demand_gwh
+        schedule["peak_mw"] = peak_mw
+        schedule["solar_additions"] = np.maximum(
+            0, (outer_mw + self.male_solar_cap_mw) - (prev_outer_mw + self.male_solar_cap_mw)
+        )
+        schedule["battery_additions"] = self._additions_array(
+            outer_mw * self.config.green_transition.battery_ratio
+        )
+        schedule["re_target"] = (schedule["outer_share"] * schedule["outer_re"]
+                                 + schedule["male_share"] * self.male_max_re)
+        return schedule
+    
+    def calculate_generation_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_generation_mix(): LNG serves Malé fossil demand once online."""
+        schedule = self._deployment_arrays(years)
+        demand_gwh = schedule["net_demand_gwh"] * self.cost_calc.loss_factor_array(
+            years, self._scenario_growth_rate,
+        )
+        re_target = schedule["re_target"]
+        
+        solar_gwh = self._solar_generation_array(
+            years, schedule["solar_additions"],
+            existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
+        )
+        solar_gwh = np.minimum(solar_gwh, demand_gwh * re_target)
+        wte_gwh = self._wte_generation_array(years, demand_gwh - solar_gwh)
+        fossil_gwh = np.maximum(0, demand_gwh - solar_gwh - wte_gwh)
+        
+        # Split fossil between LNG (Malé, up to plant capacity) and diesel
+        male_share = schedule["male_share"]
+        male_fossil_gwh = demand_gwh * male_share - demand_gwh * male_share * self.male_max_re
+        lng_max_gwh = self.lng_capacity_mw * 8760 * self.lng_capacity_factor / 1000
+        lng_operational = years >= self.lng_online_year
+        lng_gwh = np.where(lng_operational, np.minimum(male_fossil_gwh, lng_max_gwh), 0.0)
+        diesel_gwh = np.where(lng_operational, np.maximum(0, fossil_gwh - lng_gwh), fossil_gwh)
+        
+        return {
+            "total_demand_gwh": demand_gwh,
+            "diesel_gwh": round_elementwise(diesel_gwh, 1),
+            "solar_gwh": round_elementwise(solar_gwh, 1),
+            "lng_gwh": round_elementwise(lng_gwh, 1),
+            "wte_gwh": round_elementwise(wte_gwh, 1),
+            "diesel_capacity_mw": round_elementwise(self._backup_diesel_array(schedule["peak_mw"], re_target), 1),
+            "solar_capacity_mw": round_elementwise(_running_total(
+                self.config.current_system.solar_capacity_mw, schedule["solar_additions"]), 1),
+            "battery_capacity_mwh": round_elementwise(_running_total(
+                self.config.current_system.battery_capacity_mwh, schedule["battery_additions"]), 1),
+        }
+    
+    def calculate_cost_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_annual_costs() with LNG terminal, O&M and fuel."""
+        schedule = self._deployment_arrays(years)
+        solar_additions = schedule["solar_additions"]
+        lng_gwh = gen["lng_gwh"]
+        diesel_replacement_mw = gen["diesel_capacity_mw"] / self.config.technology.diesel_gen_lifetime
+        
+        lng_capex = self.lng_capex_total * (1 + self.config.technology.climate_adaptation_premium)
+        lng_fuel_per_mwh = self.config.lng.get_fuel_cost(years, self.config.base_year)
+        
+        return {
+            "capex_solar": np.where(solar_additions > 0, self.cost_calc.solar_capex(solar_additions, years), 0.0),
+            "capex_battery": self._battery_capex_array(years, schedule["battery_additions"]),
+            "capex_grid": (self._inter_island_capex_array(years)
+                           + np.where(years == self.lng_online_year, lng_capex, 0.0)),
+            "capex_diesel": self.cost_calc.diesel_gen_capex(diesel_replacement_mw),
+            "opex_solar": self.cost_calc.solar_opex(gen["solar_capacity_mw"], years),
+            "opex_battery": self.cost_calc.battery_opex(gen["battery_capacity_mwh"]),
+            "opex_diesel": (self.cost_calc.diesel_gen_opex(gen["diesel_gwh"])
+                            + np.where(lng_gwh > 0, lng_gwh * 1000 * self.config.lng.opex_per_mwh, 0.0)),
+            "fuel_diesel": self.cost_calc.diesel_fuel_cost_array(
+                gen["diesel_gwh"], years, gen["diesel_capacity_mw"]
+            ),
+            "fuel_lng": np.where(lng_gwh > 0, lng_gwh * 1000 * lng_fuel_per_mwh, 0.0),
+            **self._wte_cost_arrays(years),
+            "capex_connection": self._connection_capex_array(years),
+        }
+    
+    def calculate_emission_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_annual_emissions(): LNG emissions in the import field."""
+        lng_kwh = gen["lng_gwh"] * 1_000_000
+        return {
+            "diesel_emissions_tco2": self.emissions_calc.diesel_emissions(gen["diesel_gwh"]),
+            "import_emissions_tco2": lng_kwh * self.config.lng.emission_factor / 1000,
+            "solar_lifecycle_tco2": self.emissions_calc.solar_lifecycle_emissions(gen["solar_capacity_mw"]),
+        }
+
 
 # =============================================================================
 # TESTING
@@ -30,7 +30,7 @@ import numpy as np
 from ..config import Config, get_config
 from ..demand import DemandProjector
 from ..costs import CostCalculator, AnnualCosts
-from . import BaseScenario, GenerationMix
+from . import BaseScenario, GenerationMix, _lagged, _running_total, round_elementwise
 
 
 class MaximumREScenario(BaseScenario):
@@ -293,10 +293,8 @@ class MaximumREScenario(BaseScenario):
         self.battery_capacity_mwh += self.battery_additions.get(year, 0)
         
         # Solar generation with vintage-based degradation
-        solar_gwh = self.cost_calc.solar_generation_vintaged(
-            solar_additions=self.solar_additions,
-            year=year,
-            existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
+        solar_gwh = self._vintaged_solar_gwh(
+            year, existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
         )
         
         # Cap solar at national RE target (before adding wind)
@@ -447,6 +445,133 @@ class MaximumREScenario(BaseScenario):
         
         return costs
 
+    def _deployment_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Array form of _calculate_deployment_schedule() and the RE target."""
+        net_demand_gwh, peak_mw = self.demand.project_years(years)
+        schedule = self._outer_island_arrays(years, net_demand_gwh)
+        outer_mw = schedule["outer_solar_mw"]
+        prev_outer_mw = schedule["prev_outer_solar_mw"]
+        
+        ns = self.config.nearshore
+        ns_additions, ns_cumulative = self._phased_build_array(
+            years, self.nearshore_mw, self.nearshore_build_start, ns.nearshore_build_years,
+        )
+        fl_additions, fl_cumulative = self._phased_build_array(
+            years, self.floating_mw, self.floating_build_start, ns.floating_build_years,
+        )
+        wi_additions, wi_cumulative = self._phased_build_array(
+            years, self.wind_mw, self.wind_build_start, self.config.wind.build_years,
+        )
+        
+        # Total solar excludes wind (separate CF)
+        total_solar_mw = outer_mw + self.male_solar_cap_mw + ns_cumulative + fl_cumulative
+        prev_total = (prev_outer_mw + self.male_solar_cap_mw
+                      + (ns_cumulative - ns_additions)
+                      + (fl_cumulative - fl_additions))
+        
+        # Malé RE: rooftop + near-shore + floating + wind over Malé gross demand
+        male_demand_gwh = net_demand_gwh / (1.0 - schedule["dist_loss"]) * schedule["male_share"]
+        rooftop_gwh = self.male_solar_cap_mw * 8760 * self._effective_cf / 1000
+        ns_gwh = ns_cumulative * 8760 * self._effective_cf / 1000
+        fl_gwh = fl_cumulative * 8760 * self._effective_cf / 1000
+        wi_gwh = wi_cumulative * 8760 * self.wind_cf / 1000
+        with np.errstate(divide="ignore", invalid="ignore"):
+            male_re = np.where(
+                male_demand_gwh > 0,
+                np.minimum(1.0, (rooftop_gwh + ns_gwh + fl_gwh + wi_gwh) / male_demand_gwh),
+                0.0,
+            )
+        
+        schedule["net_demand_gwh"] = net_demand_gwh
+        schedule["peak_mw"] = peak_mw
+        schedule["nearshore_additions"] = ns_additions
+        schedule["floating_additions"] = fl_additions
+        schedule["wind_additions"] = wi_additions
+        schedule["wind_cumulative"] = wi_cumulative
+        schedule["solar_additions"] = np.maximum(0, total_solar_mw - prev_total)
+        schedule["battery_additions"] = self._additions_array(
+            (outer_mw + ns_cumulative + fl_cumulative + wi_cumulative) * self.config.green_transition.battery_ratio
+        )
+        schedule["re_target"] = schedule["outer_share"] * schedule["outer_re"] + schedule["male_share"] * male_re
+        return schedule
+    
+    def calculate_generation_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_generation_mix()."""
+        schedule = self._deployment_arrays(years)
+        demand_gwh = schedule["net_demand_gwh"] * self.cost_calc.loss_factor_array(
+            years, self._scenario_growth_rate,
+        )
+        re_target = schedule["re_target"]
+        max_re_gwh = demand_gwh * re_target
+        
+        solar_gwh = self._solar_generation_array(
+            years, schedule["solar_additions"],
+            existing_mw=self._existing_outer_solar_mw + self.male_solar_cap_mw,
+        )
+        solar_gwh = np.minimum(solar_gwh, max_re_gwh)
+        wind_gwh = schedule["wind_cumulative"] * 8760 * self.wind_cf / 1000
+        
+        # Cap total RE (solar + wind) at RE target, scaling both proportionally
+        total_re_gwh = solar_gwh + wind_gwh
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(total_re_gwh > 0, max_re_gwh / total_re_gwh, 0.0)
+        over = total_re_gwh > max_re_gwh
+        solar_gwh = np.where(over, solar_gwh * scale, solar_gwh)
+        wind_gwh = np.where(over, wind_gwh * scale, wind_gwh)
+        
+        wte_gwh = self._wte_generation_array(years, demand_gwh - solar_gwh - wind_gwh)
+        diesel_gwh = np.maximum(0, demand_gwh - solar_gwh - wind_gwh - wte_gwh)
+        
+        return {
+            "total_demand_gwh": demand_gwh,
+            "diesel_gwh": round_elementwise(diesel_gwh, 1),
+            "solar_gwh": round_elementwise(solar_gwh, 1),
+            "wte_gwh": round_elementwise(wte_gwh, 1),
+            "wind_gwh": round_elementwise(wind_gwh, 1),
+            "diesel_capacity_mw": round_elementwise(self._backup_diesel_array(schedule["peak_mw"], re_target), 1),
+            "solar_capacity_mw": round_elementwise(_running_total(
+                self.config.current_system.solar_capacity_mw, schedule["solar_additions"]), 1),
+            "battery_capacity_mwh": round_elementwise(_running_total(
+                self.config.current_system.battery_capacity_mwh, schedule["battery_additions"]), 1),
+        }
+    
+    def calculate_cost_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_annual_costs() with floating and wind cost streams."""
+        schedule = self._deployment_arrays(years)
+        ns_additions = schedule["nearshore_additions"]
+        fl_additions = schedule["floating_additions"]
+        wi_additions = schedule["wind_additions"]
+        diesel_replacement_mw = gen["diesel_capacity_mw"] / self.config.technology.diesel_gen_lifetime
+        
+        # Standard-cost solar (outer + rooftop + near-shore) and premium floating solar
+        outer_additions = np.maximum(0, schedule["solar_additions"] - ns_additions - fl_additions)
+        standard_additions = outer_additions + ns_additions
+        capex_solar = (
+            np.where(standard_additions > 0, self.cost_calc.solar_capex(standard_additions, years), 0.0)
+            + np.where(fl_additions > 0, self.cost_calc.solar_capex(fl_additions, years) * self.floating_capex_premium, 0.0)
+        )
+        
+        # Wind: new turbines plus replacement after wind_lifetime
+        wind_cost_per_mw = 1000 * self.wind_capex_per_kw * (1 + self.config.technology.climate_adaptation_premium)
+        wind_replaced = _lagged(wi_additions, self.wind_lifetime)
+        
+        return {
+            "capex_solar": capex_solar,
+            "capex_battery": self._battery_capex_array(years, schedule["battery_additions"]),
+            "capex_grid": ns_additions * self.nearshore_cable_cost_per_mw + self._inter_island_capex_array(years),
+            "capex_diesel": self.cost_calc.diesel_gen_capex(diesel_replacement_mw),
+            "capex_wind": wi_additions * wind_cost_per_mw + wind_replaced * wind_cost_per_mw,
+            "opex_solar": self.cost_calc.solar_opex(gen["solar_capacity_mw"], years),
+            "opex_battery": self.cost_calc.battery_opex(gen["battery_capacity_mwh"]),
+            "opex_diesel": self.cost_calc.diesel_gen_opex(gen["diesel_gwh"]),
+            "opex_wind": schedule["wind_cumulative"] * 1000 * self.wind_opex_per_kw,
+            "fuel_diesel": self.cost_calc.diesel_fuel_cost_array(
+                gen["diesel_gwh"], years, gen["diesel_capacity_mw"]
+            ),
+            **self._wte_cost_arrays(years),
+            "capex_connection": self._connection_capex_array(years),
+        }
+
 
 if __name__ == "__main__":
     config = get_config()
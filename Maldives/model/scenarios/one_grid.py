@@ -27,7 +27,7 @@ import numpy as np
 from ..config import Config, get_config
 from ..demand import DemandProjector
 from ..costs import CostCalculator, AnnualCosts
-from . import BaseScenario, GenerationMix
+from . import BaseScenario, GenerationMix, _decay_with_floor, _ramp_limited, _running_total, round_elementwise
 
 
 class FullIntegrationScenario(BaseScenario):
@@ -180,10 +180,8 @@ class FullIntegrationScenario(BaseScenario):
         self.battery_capacity_mwh += self.battery_additions.get(year, 0)
         
         # Solar generation with vintage-based degradation (C7, C8)
-        solar_gwh = self.cost_calc.solar_generation_vintaged(
-            solar_additions=self.solar_additions,
-            year=year,
-            existing_mw=self._existing_solar_mw,
+        solar_gwh = self._vintaged_solar_gwh(
+            year, existing_mw=self._existing_solar_mw,
         )
         
         # R6: Waste-to-energy baseload (Thilafushi 12 + Addu 1.5 + Vandhoo 0.5 = 14 MW)
@@ -373,6 +371,174 @@ class FullIntegrationScenario(BaseScenario):
         
         return costs
 
+    def _deployment_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Array form of _calculate_deployment_schedule() for run_vectorized().
+        
+        Solar ramps only over the pre-cable prefix of the horizon and is frozen
+        once the cable is online.
+        """
+        effective_cf = self._effective_solar_cf
+        net_demand_gwh, peak_mw = self.demand.project_years(years)
+        cable_operational = years >= self.cable_online_year
+        
+        # Pre-cable: distribution losses only. Post-cable: + HVDC.
+        dist_loss = np.array([
+            self.config.weighted_distribution_loss(year, self.config.demand.growth_rates['one_grid'])
+            for year in years.tolist()
+        ])
+        hvdc_loss = self.config.technology.hvdc_cable_loss_pct
+        loss_factor = np.where(
+            cable_operational, 1.0 / ((1.0 - dist_loss) * (1.0 - hvdc_loss)), 1.0 / (1.0 - dist_loss)
+        )
+        demand_gwh = net_demand_gwh * loss_factor
+        
+        pre_cable = ~cable_operational
+        mw_for_100pct = (demand_gwh[pre_cable] * 1000) / (8760 * effective_cf)
+        ramped_mw = _ramp_limited(self._existing_solar_mw, mw_for_100pct, self.ramp_mw_yr)
+        solar_mw = np.full(len(years), ramped_mw[-1] if len(ramped_mw) else self._existing_solar_mw)
+        solar_mw[pre_cable] = ramped_mw
+        
+        solar_gen_gwh = solar_mw * 8760 * effective_cf / 1000
+        with np.errstate(divide="ignore", invalid="ignore"):
+            domestic_re = np.where(
+                demand_gwh > 0, np.minimum(self.domestic_re_cap, solar_gen_gwh / demand_gwh), 0.0
+            )
+        
+        return {
+            "net_demand_gwh": net_demand_gwh,
+            "peak_mw": peak_mw,
+            "cable_operational": cable_operational,
+            "domestic_re": domestic_re,
+            "solar_additions": self._additions_array(solar_mw, self._existing_solar_mw),
+            "battery_additions": self._additions_array(solar_mw * self.config.one_grid.battery_ratio),
+        }
+    
+    def calculate_generation_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_generation_mix(): diesel-led pre-cable, import-led after."""
+        schedule = self._deployment_arrays(years)
+        net_demand_gwh = schedule["net_demand_gwh"]
+        peak_mw = schedule["peak_mw"]
+        cable_operational = schedule["cable_operational"]
+        
+        # L8: Induced demand post-cable wherever the PPA undercuts the BAU price
+        bau_price = self.config.current_system.outer_island_electricity_cost
+        fi_price = np.array([
+            np.nan if price is None else price
+            for price in (self.config.ppa.get_price(year) for year in years.tolist())
+        ])
+        with np.errstate(invalid="ignore"):
+            induced = cable_operational & (bau_price > 0) & (fi_price < bau_price)
+        if induced.any():
+            price_reduction_pct = (bau_price - fi_price[induced]) / bau_price
+            induced_gwh = round_elementwise(
+                net_demand_gwh[induced] * (1 + self.config.demand.price_elasticity * (-price_reduction_pct)), 1
+            )
+            peak_mw = peak_mw.copy()
+            peak_mw[induced] = induced_gwh / net_demand_gwh[induced] * peak_mw[induced]
+            net_demand_gwh = net_demand_gwh.copy()
+            net_demand_gwh[induced] = induced_gwh
+        
+        demand_gwh = net_demand_gwh * self.cost_calc.loss_factor_array(
+            years, self.config.demand.growth_rates['one_grid'], include_hvdc=cable_operational,
+        )
+        
+        solar_gwh = self._solar_generation_array(
+            years, schedule["solar_additions"], existing_mw=self._existing_solar_mw,
+        )
+        wte_gwh = self._wte_generation_array(years, demand_gwh - solar_gwh)
+        
+        # Cable operational: solar capped at domestic RE, diesel reserve, import the rest
+        capped_solar_gwh = np.minimum(solar_gwh, demand_gwh * schedule["domestic_re"])
+        reserve_gwh = demand_gwh * self.config.one_grid.diesel_reserve_ratio
+        import_gwh = demand_gwh - capped_solar_gwh - wte_gwh - reserve_gwh
+        short = import_gwh < 0
+        reserve_gwh = np.where(short, np.maximum(0, demand_gwh - capped_solar_gwh - wte_gwh), reserve_gwh)
+        import_gwh = np.where(short, 0.0, import_gwh)
+        
+        solar_gwh = np.where(cable_operational, capped_solar_gwh, solar_gwh)
+        diesel_gwh = np.where(cable_operational, reserve_gwh, np.maximum(0, demand_gwh - solar_gwh - wte_gwh))
+        import_gwh = np.where(cable_operational, import_gwh, 0.0)
+        
+        # Diesel fleet: unchanged pre-cable, retired towards backup share after
+        diesel_capacity_mw = np.full(len(years), float(self.diesel_capacity_mw))
+        diesel_capacity_mw[cable_operational] = _decay_with_floor(
+            self.diesel_capacity_mw,
+            peak_mw[cable_operational] * self.config.one_grid.diesel_backup_share,
+            1 - self.config.one_grid.diesel_retirement_rate,
+        )
+        
+        return {
+            "total_demand_gwh": round_elementwise(demand_gwh, 1),
+            "diesel_gwh": round_elementwise(diesel_gwh, 1),
+            "solar_gwh": round_elementwise(solar_gwh, 1),
+            "import_gwh": round_elementwise(import_gwh, 1),
+            "wte_gwh": round_elementwise(wte_gwh, 1),
+            "diesel_capacity_mw": round_elementwise(diesel_capacity_mw, 1),
+            "solar_capacity_mw": round_elementwise(_running_total(
+                self.config.current_system.solar_capacity_mw, schedule["solar_additions"]), 1),
+            "battery_capacity_mwh": round_elementwise(_running_total(
+                self.config.current_system.battery_capacity_mwh, schedule["battery_additions"]), 1),
+        }
+    
+    def calculate_cost_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_annual_costs() including cable and supply security."""
+        schedule = self._deployment_arrays(years)
+        solar_additions = schedule["solar_additions"]
+        cable_operational = schedule["cable_operational"]
+        og = self.config.one_grid
+        
+        # CAPEX: India cable (GoM share over construction) + inter-island grid
+        construction_years = og.cable_construction_years
+        constructing = (years >= self.cable_online_year - construction_years) & (years < self.cable_online_year)
+        cable_annual = self.cost_calc.cable_capex() * self.gom_cost_share / construction_years
+        ii_years = og.inter_island_build_end - og.inter_island_build_start + 1
+        inter_island_total = self.config.green_transition.inter_island_km * self.config.technology.inter_island_capex_per_km
+        building_ii = (years >= og.inter_island_build_start) & (years <= og.inter_island_build_end)
+        capex_cable = np.where(constructing, cable_annual, 0.0) + np.where(building_ii, inter_island_total / ii_years, 0.0)
+        
+        # CAPEX: Diesel replacement halves once the cable is online
+        diesel_life = self.config.technology.diesel_gen_lifetime
+        diesel_replacement_mw = np.where(
+            cable_operational, gen["diesel_capacity_mw"] / (diesel_life * 2), gen["diesel_capacity_mw"] / diesel_life
+        )
+        
+        # L2: Supply security (idle fleet + expected outage fuel premium + VOLL)
+        outage_cfg = self.config.cable_outage
+        expected_duration_months = (outage_cfg.min_outage_months + outage_cfg.max_outage_months) / 2.0
+        expected_outage_fraction = outage_cfg.outage_rate_per_yr * expected_duration_months / 12.0
+        import_gwh_at_risk = gen["import_gwh"] * expected_outage_fraction
+        outage_fuel_premium_cost = np.where(
+            import_gwh_at_risk > 0,
+            self.cost_calc.diesel_fuel_cost_array(import_gwh_at_risk, years, gen["diesel_capacity_mw"])
+            * self.config.supply_security.diesel_fuel_premium_outage,
+            0.0,
+        )
+        backup_gwh = (gen["diesel_capacity_mw"] * expected_outage_fraction
+                      * 8760 / 1000 * self.config.dispatch.emergency_diesel_cf)
+        voll_cost = np.maximum(0, import_gwh_at_risk - backup_gwh) * 1e3 * self.config.economics.voll
+        idle_fleet_cost = self.config.supply_security.idle_fleet_annual_cost_m * 1e6
+        
+        return {
+            "capex_cable": capex_cable,
+            "capex_solar": np.where(solar_additions > 0, self.cost_calc.solar_capex(solar_additions, years), 0.0),
+            "capex_battery": self._battery_capex_array(years, schedule["battery_additions"]),
+            "capex_diesel": self.cost_calc.diesel_gen_capex(diesel_replacement_mw),
+            "opex_solar": self.cost_calc.solar_opex(gen["solar_capacity_mw"], years),
+            "opex_battery": self.cost_calc.battery_opex(gen["battery_capacity_mwh"]),
+            "opex_diesel": self.cost_calc.diesel_gen_opex(gen["diesel_gwh"]),
+            "opex_cable": np.where(cable_operational, self.cost_calc.cable_opex(), 0.0),
+            "fuel_diesel": self.cost_calc.diesel_fuel_cost_array(
+                gen["diesel_gwh"], years, gen["diesel_capacity_mw"]
+            ),
+            "ppa_imports": self.cost_calc.ppa_cost_array(gen["import_gwh"], years),
+            "capex_connection": self._connection_capex_array(years),
+            **self._wte_cost_arrays(years),
+            "supply_security": np.where(
+                cable_operational, idle_fleet_cost + outage_fuel_premium_cost + voll_cost, 0.0
+            ),
+        }
+
 
 # =============================================================================
 # TESTING
@@ -24,7 +24,7 @@ import numpy as np
 from ..config import Config, get_config
 from ..demand import DemandProjector
 from ..costs import CostCalculator, AnnualCosts
-from . import BaseScenario, GenerationMix
+from . import BaseScenario, GenerationMix, round_elementwise
 
 
 class StatusQuoScenario(BaseScenario):
@@ -155,6 +155,58 @@ class StatusQuoScenario(BaseScenario):
         
         return costs
 
+    def calculate_generation_arrays(self, years: np.ndarray) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_generation_mix(): flat solar, diesel fleet only grows."""
+        net_demand_gwh, peak_mw = self.demand.project_years(years)
+        demand_gwh = net_demand_gwh * self.cost_calc.loss_factor_array(
+            years, self.config.demand.growth_rates['status_quo'],
+        )
+        
+        # Existing solar degrading from base_year (C7, C8)
+        deg_rate = self.config.technology.solar_pv_degradation
+        years_operating = np.maximum(0, years - self.config.base_year)
+        solar_gwh = self.cost_calc.solar_generation(self.existing_solar_mw) * (1.0 - deg_rate) ** years_operating
+        
+        # Diesel meets the rest (solar curtailed if it ever exceeds demand)
+        diesel_gwh = demand_gwh - solar_gwh
+        curtailed = diesel_gwh < 0
+        diesel_gwh = np.where(curtailed, 0.0, diesel_gwh)
+        solar_gwh = np.where(curtailed, demand_gwh, solar_gwh)
+        
+        # Diesel capacity expands to the running maximum of peak × reserve
+        reserve_margin = 1 + self.config.technology.reserve_margin
+        solar_peak_contrib = self.config.technology.solar_peak_contribution
+        required_diesel_mw = peak_mw * reserve_margin - self.existing_solar_mw * solar_peak_contrib
+        diesel_capacity_mw = np.maximum(self.diesel_capacity_mw, np.maximum.accumulate(required_diesel_mw))
+        
+        return {
+            "total_demand_gwh": demand_gwh,
+            "diesel_gwh": round_elementwise(diesel_gwh, 1),
+            "solar_gwh": round_elementwise(solar_gwh, 1),
+            "diesel_capacity_mw": round_elementwise(diesel_capacity_mw, 1),
+            "solar_capacity_mw": self.existing_solar_mw,
+            "battery_capacity_mwh": self.config.current_system.battery_capacity_mwh,
+        }
+    
+    def calculate_cost_arrays(self, years: np.ndarray, gen: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Whole-horizon calculate_annual_costs()."""
+        # Rolling replacement plus new capacity for peak growth
+        replacement_mw = np.array([self._replacement_years.get(year, 0) for year in years.tolist()])
+        _, peak_mw = self.demand.project_years(years)
+        peak_growth = np.maximum(0, np.diff(peak_mw, prepend=peak_mw[:1]))
+        capex_diesel = self.cost_calc.diesel_gen_capex(replacement_mw) + np.where(
+            years > self.config.base_year, self.cost_calc.diesel_gen_capex(peak_growth), 0.0
+        )
+        
+        return {
+            "capex_diesel": capex_diesel,
+            "opex_diesel": self.cost_calc.diesel_gen_opex(gen["diesel_gwh"]),
+            "opex_solar": self.cost_calc.solar_opex(self.existing_solar_mw, self.config.base_year),
+            "fuel_diesel": self.cost_calc.diesel_fuel_cost_array(
+                gen["diesel_gwh"], years, gen["diesel_capacity_mw"]
+            ),
+        }
+
 
 # =============================================================================
 # TESTING